@@ -0,0 +1 @@
+"""Offline benchmarks for the isal Easy Homey integration."""
@@ -0,0 +1,509 @@
+"""Local stand-in for the isal Easy Homey API.
+
+Serves every endpoint used by IsalEasyHomeyApiClient with generated
+payloads. Latency, jitter, error rate and payload size are configurable so
+the integration can be benchmarked without network access.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+import hashlib
+import json
+import random
+import time
+from typing import Any
+
+from aiohttp import hdrs, web
+
+API_PREFIX = "/v1"
+
+POLLEN_TYPES = (
+    "ALDER",
+    "AMBROSIA",
+    "ASH_TREE",
+    "BIRCH",
+    "GRASSES",
+    "HAZEL",
+    "MUGWORT",
+    "RYE",
+)
+WASTE_TYPES = ("PAPER", "ORGANIC", "RESIDUAL", "YELLOW_BAG", "HAZARDOUS")
+SEVERITY_TYPES = ("NONE", "NONE_TO_LOW", "LOW", "LOW_TO_MEDIUM", "MEDIUM", "HIGH")
+
+
+@dataclass
+class FakeApiSettings:
+    """Settings of the fake API server."""
+
+    # Base response delay in seconds
+    latency: float = 0.02
+    # Maximum random deviation from the base delay in seconds
+    jitter: float = 0.01
+    # Share of requests answered with 503 Service Unavailable
+    error_rate: float = 0.0
+    # Number of stations returned by a station search
+    stations: int = 25
+    # Number of active warnings per warning type
+    warnings: int = 2
+    # Number of scheduled waste collections per waste type
+    waste_collections: int = 12
+    # Seconds between petrol price changes
+    price_period: float = 60.0
+    # Serve the bulk station endpoint, otherwise it answers 404 like an
+    # unknown station ID
+    bulk_stations: bool = True
+    seed: int = 0
+
+
+class FakeEasyHomeyApi:
+    """aiohttp server imitating the isal Easy Homey API."""
+
+    def __init__(self, settings: FakeApiSettings | None = None) -> None:
+        """Initialize the server.
+
+        Args:
+            settings: The server settings
+
+        """
+        self.settings = settings or FakeApiSettings()
+        self.requests: Counter[str] = Counter()
+        self.not_modified = 0
+        self.errors = 0
+        self._random = random.Random(self.settings.seed)
+        self._started = time.time()
+        self._water_scene = "NORMAL"
+        self._shutoff_valve = "OPEN"
+        self._micro_leakage_check = "IDLE"
+        self._total_consumption = 120_000.0
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+        app = web.Application(middlewares=[self._middleware])
+        get = [
+            ("/patrol-stations", self._search_stations),
+            ("/patrol-stations/cheapest", self._cheapest_station),
+            *(
+                [("/patrol-stations/by-ids", self._stations_by_ids)]
+                if self.settings.bulk_stations
+                else []
+            ),
+            ("/patrol-stations/{station_id}", self._station),
+            ("/weather/warnings", self._weather_warnings),
+            ("/weather/pollen-flight", self._pollen_flight),
+            ("/weather/pollen-flight/highest", self._highest_pollen_flight),
+            ("/waste-collection", self._waste_collections),
+            ("/waste-collection/upcoming-collections", self._upcoming_waste),
+            ("/waste-collection/next-collection", self._next_waste),
+            ("/info", self._service_info),
+            ("/water/softener", self._water_softener),
+            ("/water/control", self._water_control),
+        ]
+        post = [
+            ("/water/softener/water-scene", self._change_water_scene),
+            ("/water/softener/micro-leakage-check", self._start_micro_leakage_check),
+            ("/water/control/shutoff-valve", self._control_shutoff_valve),
+        ]
+        # Static routes are registered before /patrol-stations/{station_id}
+        for path, handler in get:
+            app.router.add_get(f"{API_PREFIX}{path}", handler)
+        for path, handler in post:
+            app.router.add_post(f"{API_PREFIX}{path}", handler)
+        self._app = app
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests received."""
+        return sum(self.requests.values())
+
+    async def start(self) -> str:
+        """Start the server on a free local port.
+
+        Returns:
+            The base URL to configure in the integration
+
+        """
+        self._runner = web.AppRunner(self._app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://127.0.0.1:{port}{API_PREFIX}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Count the request and apply latency and errors."""
+        resource = request.match_info.route.resource
+        self.requests[resource.canonical if resource else request.path] += 1
+
+        settings = self.settings
+        delay = settings.latency + self._random.uniform(
+            -settings.jitter, settings.jitter
+        )
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if settings.error_rate and self._random.random() < settings.error_rate:
+            self.errors += 1
+            raise web.HTTPServiceUnavailable
+        return await handler(request)
+
+    def _json(self, request: web.Request, data: Any) -> web.Response:
+        """Return a JSON response honouring If-None-Match.
+
+        Args:
+            request: The request
+            data: The payload
+
+        Returns:
+            The response
+
+        """
+        body = json.dumps(data).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'  # noqa: S324
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={hdrs.ETAG: etag})
+        return web.Response(
+            body=body,
+            content_type="application/json",
+            headers={hdrs.ETAG: etag},
+        )
+
+    # Petrol stations
+
+    def _price_epoch(self) -> int:
+        """Return the current price period."""
+        return int(time.time() / self.settings.price_period)
+
+    def _make_station(self, index: int) -> dict[str, Any]:
+        """Build a station payload.
+
+        Args:
+            index: Station number, stable across requests
+
+        Returns:
+            The station
+
+        """
+        prices_random = random.Random(f"{index}-{self._price_epoch()}")
+        base = 1.60 + prices_random.uniform(0, 0.25)
+        return {
+            "stationId": f"00000000-0000-0000-0000-{index:012d}",
+            "name": f"Station {index}",
+            "brand": ("ARAL", "SHELL", "JET", "ESSO")[index % 4],
+            "address": {
+                "street": "Hauptstraße",
+                "houseNumber": str(index + 1),
+                "postalCode": "80331",
+                "city": "München",
+            },
+            "location": {
+                "latitude": 48.137 + index * 0.001,
+                "longitude": 11.575 + index * 0.001,
+                "distance": round(0.4 + index * 0.35, 2),
+            },
+            "status": "CLOSED" if index % 11 == 10 else "OPEN",
+            "statusTranslation": "Geschlossen" if index % 11 == 10 else "Geöffnet",
+            "prices": [
+                {"petrolType": "E5", "price": round(base, 3)},
+                {"petrolType": "E10", "price": round(base - 0.06, 3)},
+                {"petrolType": "DIESEL", "price": round(base - 0.1, 3)},
+            ],
+            "openingHours": {"allDayOpened": index % 3 == 0, "openingHours": []},
+        }
+
+    async def _search_stations(self, request: web.Request) -> web.Response:
+        """Return the stations around the requested location."""
+        radius = float(request.query.get("distance", 15))
+        stations = [self._make_station(index) for index in range(self.settings.stations)]
+        return self._json(
+            request,
+            [
+                station
+                for station in stations
+                if station["location"]["distance"] <= radius
+            ],
+        )
+
+    async def _cheapest_station(self, request: web.Request) -> web.Response:
+        """Return the cheapest open station for a petrol type."""
+        petrol_type = request.query.get("petrolType", "E5")
+        stations = [
+            station
+            for index in range(self.settings.stations)
+            if (station := self._make_station(index))["status"] == "OPEN"
+        ]
+        if not stations:
+            raise web.HTTPNotFound
+
+        def price(station: dict[str, Any]) -> float:
+            return next(
+                p["price"] for p in station["prices"] if p["petrolType"] == petrol_type
+            )
+
+        return self._json(request, min(stations, key=price))
+
+    @staticmethod
+    def _station_index(station_id: str) -> int | None:
+        """Return the station number of a station ID, None if malformed."""
+        try:
+            return int(station_id.rsplit("-", 1)[-1])
+        except ValueError:
+            return None
+
+    async def _station(self, request: web.Request) -> web.Response:
+        """Return a station by ID."""
+        if (index := self._station_index(request.match_info["station_id"])) is None:
+            raise web.HTTPNotFound
+        return self._json(request, self._make_station(index))
+
+    async def _stations_by_ids(self, request: web.Request) -> web.Response:
+        """Return the known stations of a comma separated list of IDs."""
+        station_ids = request.query.get("stationIds", "").split(",")
+        return self._json(
+            request,
+            [
+                self._make_station(index)
+                for station_id in station_ids
+                if (index := self._station_index(station_id)) is not None
+            ],
+        )
+
+    # Weather
+
+    def _severity(self, level: int) -> dict[str, Any]:
+        """Build a severity payload for a level."""
+        return {
+            "severityLevel": level,
+            "severityType": SEVERITY_TYPES[level],
+            "severityTranslation": SEVERITY_TYPES[level].replace("_", " ").title(),
+            "severityColor": {"hex": f"#{level * 40:02x}8000"},
+        }
+
+    async def _weather_warnings(self, request: web.Request) -> web.Response:
+        """Return the warnings of a warning cell."""
+        cell_id = request.query.get("warningCellId", "")
+        warning_type = request.query.get("weatherWarningType", "WARNING")
+        now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        warnings = [
+            {
+                "warningId": f"{cell_id}-{warning_type}-{index}",
+                "areaName": "Stadt München",
+                "from": now.isoformat(),
+                "until": (now + timedelta(hours=6)).isoformat(),
+                "issuedBy": "DWD",
+                "createdOn": now.isoformat(),
+                "details": {
+                    "title": f"Amtliche Warnung {index}",
+                    "description": "Es tritt Sturm auf. " * 8,
+                    "instruction": "Achten Sie auf herabstürzende Äste. " * 4,
+                    "weatherType": "WIND",
+                    "weatherIcon": {"mdiIcon": "mdi:weather-windy"},
+                    "severity": {
+                        "severity": "MODERATE",
+                        "severityLevel": index + 1,
+                        "severityTranslation": "Markant",
+                        "severityColor": {"hex": "#ff9900"},
+                    },
+                },
+            }
+            for index in range(self.settings.warnings)
+        ]
+        return self._json(
+            request,
+            {"warningCellId": cell_id, "count": len(warnings), "warnings": warnings},
+        )
+
+    def _pollen_flights(self) -> list[dict[str, Any]]:
+        """Build the pollen flights of today."""
+        day_random = random.Random(date.today().isoformat())
+        flights = []
+        for pollen_type in POLLEN_TYPES:
+            levels = [day_random.randrange(len(SEVERITY_TYPES)) for _ in range(3)]
+            flights.append(
+                {
+                    "pollenType": pollen_type,
+                    "pollenTypeTranslation": pollen_type.title(),
+                    "pollenIcon": {"mdiIcon": "mdi:flower-pollen"},
+                    "today": self._severity(levels[0]),
+                    "tomorrow": self._severity(levels[1]),
+                    "dayAfterTomorrow": self._severity(levels[2]),
+                }
+            )
+        return flights
+
+    async def _pollen_flight(self, request: web.Request) -> web.Response:
+        """Return the pollen flights of all pollen types."""
+        return self._json(
+            request,
+            {
+                "regionName": "Bayern",
+                "partRegionName": "Oberbayern",
+                "lastUpdatedOn": date.today().isoformat(),
+                "flights": self._pollen_flights(),
+            },
+        )
+
+    async def _highest_pollen_flight(self, request: web.Request) -> web.Response:
+        """Return the pollen type with the highest severity today."""
+        highest = max(
+            self._pollen_flights(), key=lambda flight: flight["today"]["severityLevel"]
+        )
+        return self._json(request, {"highestSeverity": highest})
+
+    # Waste collection
+
+    def _build_waste_collections(self) -> list[dict[str, Any]]:
+        """Build the scheduled waste collections ordered by date."""
+        today = date.today()
+        collections = [
+            {
+                "wasteType": waste_type,
+                "wasteTypeTranslation": waste_type.replace("_", " ").title(),
+                "scheduledOn": (
+                    today + timedelta(days=1 + offset + week * 14)
+                ).isoformat(),
+                "wasteColorPrimary": {"hex": "#0000ff"},
+                "wasteColorSecondary": {"hex": "#ffffff"},
+                "icon": {"mdiIcon": "mdi:trash-can"},
+            }
+            for offset, waste_type in enumerate(WASTE_TYPES)
+            for week in range(self.settings.waste_collections)
+        ]
+        collections.sort(key=lambda collection: collection["scheduledOn"])
+        return collections
+
+    async def _waste_collections(self, request: web.Request) -> web.Response:
+        """Return all future waste collections."""
+        return self._json(
+            request, {"scheduledCollections": self._build_waste_collections()}
+        )
+
+    async def _upcoming_waste(self, request: web.Request) -> web.Response:
+        """Return the next collection per waste type."""
+        upcoming: dict[str, dict[str, Any]] = {}
+        for collection in self._build_waste_collections():
+            upcoming.setdefault(collection["wasteType"], collection)
+        return self._json(request, {"scheduledCollections": list(upcoming.values())})
+
+    async def _next_waste(self, request: web.Request) -> web.Response:
+        """Return the next collection date with all its waste types."""
+        collections = self._build_waste_collections()
+        next_date = collections[0]["scheduledOn"]
+        return self._json(
+            request,
+            {
+                "scheduledOn": next_date,
+                "scheduledCollections": [
+                    c for c in collections if c["scheduledOn"] == next_date
+                ],
+            },
+        )
+
+    # Service info
+
+    async def _service_info(self, request: web.Request) -> web.Response:
+        """Return the service info."""
+        return self._json(
+            request,
+            {
+                "uptime": int(time.time() - self._started),
+                "apiSpecificationVersion": "1.0.0",
+                "serviceVersion": "1.0.0",
+                "startupTime": datetime.fromtimestamp(
+                    self._started, timezone.utc
+                ).isoformat(),
+            },
+        )
+
+    # Water devices
+
+    async def _water_softener(self, request: web.Request) -> web.Response:
+        """Return the water softener state."""
+        uptime = int(time.time() - self._started)
+        return self._json(
+            request,
+            {
+                "deviceStatus": "ONLINE",
+                "deviceStatusIcon": {"mdiIcon": "mdi:check-network"},
+                "softwareVersion": "2.4.1",
+                "hardwareVersion": "1.0",
+                "gatewayFirmwareVersion": "3.1.0",
+                "gatewayHardwareVersion": "1.2",
+                # Coarse counters, so most refreshes only change a few sections
+                "operatingTimeSeconds": 3_600_000 + uptime // 600 * 600,
+                "uptimeSeconds": uptime // 600 * 600,
+                "waterHardness": {"rawHardnessDH": 21.0, "desiredHardnessDH": 6.0},
+                "batteryCapacity": {"percentage": 87, "remainingTimeSeconds": 5400},
+                "saltLevel": {
+                    "saltLevelPercent": 64,
+                    "saltLevelGrams": 12800,
+                    "saltRangeDays": 41,
+                },
+                "maintenance": {
+                    "daysUntilNext": 120,
+                    "registeredMaintenances": 3,
+                    "requestedMaintenances": 0,
+                },
+                "regeneration": {"totalRegenerationCount": 812, "isRegenerating": False},
+                "leakageProtection": {
+                    "shutoffValveStatus": self._shutoff_valve,
+                    "shutoffValveIcon": {"mdiIcon": "mdi:valve-open"},
+                    "maxFlowRateLiterPerHour": 3000,
+                    "maxExtractionVolumeLiter": 300,
+                    "maxExtractionTimeMinutes": 90,
+                    "microLeakageCheck": self._micro_leakage_check,
+                    "microLeakageStatus": "NO_LEAKAGE",
+                },
+                "waterScene": self._water_scene,
+                "waterSceneIcon": {"mdiIcon": "mdi:faucet"},
+                "lastUpdatedOn": datetime.fromtimestamp(
+                    self._started + uptime // 600 * 600, timezone.utc
+                ).isoformat(),
+            },
+        )
+
+    async def _water_control(self, request: web.Request) -> web.Response:
+        """Return the water control state with a fluctuating flow rate."""
+        flow_rate = 0.0
+        if self._shutoff_valve == "OPEN" and self._random.random() < 0.3:
+            flow_rate = round(self._random.uniform(60, 900), 1)
+        self._total_consumption += flow_rate / 120
+        return self._json(
+            request,
+            {
+                "currentFlowRate": flow_rate,
+                "totalWaterConsumption": round(self._total_consumption, 1),
+                "treatedWaterConsumption": round(self._total_consumption * 0.8, 1),
+                "untreatedWaterConsumption": round(self._total_consumption * 0.2, 1),
+                "shutoffValveStatus": self._shutoff_valve,
+                "shutoffValveIcon": {"mdiIcon": "mdi:valve"},
+                "lastUpdatedOn": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+
+    async def _change_water_scene(self, request: web.Request) -> web.Response:
+        """Change the water scene."""
+        body = await request.json()
+        self._water_scene = body.get("waterScene", self._water_scene)
+        return web.json_response({"waterScene": self._water_scene})
+
+    async def _start_micro_leakage_check(self, request: web.Request) -> web.Response:
+        """Start a micro leakage check."""
+        self._micro_leakage_check = "RUNNING"
+        return web.json_response({"microLeakageCheck": self._micro_leakage_check})
+
+    async def _control_shutoff_valve(self, request: web.Request) -> web.Response:
+        """Open or close the shutoff valve."""
+        body = await request.json()
+        self._shutoff_valve = body.get("newStatus", self._shutoff_valve)
+        return web.json_response({"shutoffValveStatus": self._shutoff_valve})
@@ -0,0 +1,118 @@
+"""Benchmark decoding API responses of representative sizes.
+
+Builds the payloads FakeEasyHomeyApi serves and reports, per payload, the
+time to decode it with the standard library json module, with orjson (if
+installed) and with orjson in an executor, including the hand-off to the
+executor thread. The last column shows where moving the decoding off the
+event loop starts to pay off, see JSON_EXECUTOR_THRESHOLD.
+
+Run from the repository root:
+
+    python -m benchmarks.json_decode --repeat 200
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import json
+import time
+from typing import Any
+
+from .fake_api import FakeApiSettings, FakeEasyHomeyApi
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def build_payloads() -> dict[str, bytes]:
+    """Return encoded payloads of representative endpoints and sizes.
+
+    Returns:
+        Dictionary of payload name to JSON body
+
+    """
+    payloads: dict[str, Any] = {}
+    for stations in (10, 100, 1000, 5000):
+        api = FakeEasyHomeyApi(FakeApiSettings(stations=stations))
+        payloads[f"station search ({stations} stations)"] = [
+            api._make_station(index) for index in range(stations)
+        ]
+    for collections in (12, 120):
+        api = FakeEasyHomeyApi(FakeApiSettings(waste_collections=collections))
+        payloads[f"waste schedule ({collections} per type)"] = {
+            "scheduledCollections": api._build_waste_collections()
+        }
+    api = FakeEasyHomeyApi()
+    payloads["pollen flights"] = {"flights": api._pollen_flights()}
+    return {name: json.dumps(data).encode() for name, data in payloads.items()}
+
+
+def time_sync(loads: Callable[[bytes], Any], body: bytes, repeat: int) -> float:
+    """Return the best time of a decoder in microseconds.
+
+    Args:
+        loads: The decoding function
+        body: The JSON body
+        repeat: Number of runs
+
+    Returns:
+        Fastest run in microseconds
+
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loads(body)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+async def time_executor(
+    loads: Callable[[bytes], Any], body: bytes, repeat: int
+) -> float:
+    """Return the best time of a decoder run in the executor in microseconds.
+
+    Args:
+        loads: The decoding function
+        body: The JSON body
+        repeat: Number of runs
+
+    Returns:
+        Fastest run in microseconds, including the executor hand-off
+
+    """
+    loop = asyncio.get_running_loop()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await loop.run_in_executor(None, loads, body)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark and print the results."""
+    fast_loads = orjson.loads if orjson is not None else json.loads
+    print(
+        f"{'payload':<34} {'bytes':>9} {'json µs':>10} "
+        f"{'orjson µs':>10} {'executor µs':>12}"
+    )
+    for name, body in build_payloads().items():
+        stdlib = time_sync(json.loads, body, args.repeat)
+        fast = time_sync(orjson.loads, body, args.repeat) if orjson else None
+        executor = await time_executor(fast_loads, body, args.repeat)
+        print(
+            f"{name:<34} {len(body):>9} {stdlib:>10.1f} "
+            f"{'-' if fast is None else f'{fast:.1f}':>10} {executor:>12.1f}"
+        )
+    if orjson is None:
+        print("orjson is not installed, the executor column uses json")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="Runs per payload")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,390 @@
+"""Benchmark the integration against the local fake API.
+
+Sets up the integration in a throwaway Home Assistant instance, pointed at
+FakeEasyHomeyApi, and reports:
+
+- setup time and traced memory per entity
+- refresh latency percentiles and HTTP calls per refresh per coordinator
+- state changes per refresh per coordinator
+- CPU time per state write per entity class
+
+Run from the repository root:
+
+    python -m benchmarks.run --refreshes 50 --latency 0.05 --error-rate 0.01
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import defaultdict
+import json
+import logging
+from pathlib import Path
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant import loader
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import async_get_platforms
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.isal_easy_homey.const import (
+    CONF_API_BASE_URL,
+    CONF_BACKGROUND_FIRST_REFRESH,
+    CONF_LOCATION_ENTITY_ID_CHEAPEST,
+    CONF_LOCATION_ENTITY_ID_NEAREST,
+    CONF_SEARCH_RADIUS,
+    CONF_STATION_IDS,
+    CONF_USER_LOCATIONS,
+    CONF_WARNING_CELL_ID,
+    DOMAIN,
+)
+
+from .fake_api import FakeApiSettings, FakeEasyHomeyApi
+
+HOME_ENTITY_ID = "zone.home"
+HOME_LATITUDE = 48.137
+HOME_LONGITUDE = 11.575
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """Return the p50, p90, p99 and maximum of some values.
+
+    Args:
+        values: The measured values
+
+    Returns:
+        Dictionary with the percentiles
+
+    """
+    if not values:
+        return {}
+    if len(values) == 1:
+        cuts = values * 99
+    else:
+        cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {
+        "p50": cuts[49],
+        "p90": cuts[89],
+        "p99": cuts[98],
+        "max": max(values),
+    }
+
+
+def build_entry(args: argparse.Namespace, base_url: str) -> MockConfigEntry:
+    """Build the config entry of the benchmark.
+
+    Args:
+        args: The command line arguments
+        base_url: The base URL of the fake API
+
+    Returns:
+        The config entry
+
+    """
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="Benchmark",
+        data={
+            CONF_API_BASE_URL: base_url,
+            CONF_LOCATION_ENTITY_ID_CHEAPEST: HOME_ENTITY_ID,
+            CONF_LOCATION_ENTITY_ID_NEAREST: HOME_ENTITY_ID,
+            CONF_WARNING_CELL_ID: "809177119",
+            CONF_SEARCH_RADIUS: 15.0,
+        },
+        options={
+            CONF_USER_LOCATIONS: [
+                {"name": f"User {index}", "entity_id": f"device_tracker.user_{index}"}
+                for index in range(args.users)
+            ],
+            CONF_STATION_IDS: [
+                f"00000000-0000-0000-0000-{index:012d}"
+                for index in range(args.station_ids)
+            ],
+            # Measure the complete setup instead of returning early
+            CONF_BACKGROUND_FIRST_REFRESH: False,
+        },
+    )
+
+
+async def benchmark_refreshes(
+    hass: HomeAssistant,
+    api: FakeEasyHomeyApi,
+    entry: MockConfigEntry,
+    args: argparse.Namespace,
+) -> dict[str, Any]:
+    """Refresh every coordinator repeatedly and measure each refresh.
+
+    Args:
+        hass: The Home Assistant instance
+        api: The fake API
+        entry: The config entry
+        args: The command line arguments
+
+    Returns:
+        Measurements per coordinator
+
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    client = entry_data["client"]
+    state_changes = 0
+
+    @callback
+    def count_state_change(event: Event) -> None:
+        nonlocal state_changes
+        state_changes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, count_state_change)
+    results: dict[str, Any] = {}
+    try:
+        for name, coordinator in entry_data["coordinators"].items():
+            latencies: list[float] = []
+            cpu_times: list[float] = []
+            requests = failures = changes = 0
+            for _ in range(args.refreshes):
+                if args.cold:
+                    # Measure the backend path instead of cache hits
+                    client._cache.invalidate("")  # noqa: SLF001
+                    client._validators.invalidate("")  # noqa: SLF001
+                    client._geo_cache.clear()  # noqa: SLF001
+                requests_before = api.total_requests
+                changes_before = state_changes
+                wall_start = time.perf_counter()
+                cpu_start = time.process_time()
+                await coordinator.async_refresh()
+                await hass.async_block_till_done()
+                cpu_times.append(time.process_time() - cpu_start)
+                latencies.append(time.perf_counter() - wall_start)
+                requests += api.total_requests - requests_before
+                changes += state_changes - changes_before
+                failures += not coordinator.last_update_success
+
+            results[name] = {
+                "latency_ms": {
+                    key: value * 1000 for key, value in percentiles(latencies).items()
+                },
+                "cpu_ms_per_refresh": statistics.fmean(cpu_times) * 1000,
+                "http_calls_per_refresh": requests / args.refreshes,
+                "state_changes_per_refresh": changes / args.refreshes,
+                "failed_refreshes": failures,
+            }
+    finally:
+        unsub()
+    return results
+
+
+def benchmark_state_writes(hass: HomeAssistant, writes: int) -> dict[str, Any]:
+    """Write the state of every entity repeatedly and measure the CPU time.
+
+    Args:
+        hass: The Home Assistant instance
+        writes: Number of writes per entity
+
+    Returns:
+        Mean CPU time per state write by entity class
+
+    """
+    cpu_by_class: dict[str, list[float]] = defaultdict(list)
+    for platform in async_get_platforms(hass, DOMAIN):
+        for entity in platform.entities.values():
+            cpu_start = time.process_time()
+            for _ in range(writes):
+                entity.async_write_ha_state()
+            cpu_by_class[type(entity).__name__].append(
+                (time.process_time() - cpu_start) / writes
+            )
+
+    return {
+        name: {
+            "entities": len(cpu_times),
+            "cpu_us_per_write": statistics.fmean(cpu_times) * 1_000_000,
+        }
+        for name, cpu_times in sorted(cpu_by_class.items())
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmark.
+
+    Args:
+        args: The command line arguments
+
+    Returns:
+        The benchmark report
+
+    """
+    api = FakeEasyHomeyApi(
+        FakeApiSettings(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            stations=args.stations,
+            warnings=args.warnings,
+            bulk_stations=not args.no_bulk,
+            seed=args.seed,
+        )
+    )
+    base_url = await api.start()
+    report: dict[str, Any] = {"settings": vars(args)}
+
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            async with async_test_home_assistant(config_dir=config_dir) as hass:
+                # Allow loading the integration from custom_components
+                hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+
+                hass.states.async_set(
+                    HOME_ENTITY_ID,
+                    "0",
+                    {"latitude": HOME_LATITUDE, "longitude": HOME_LONGITUDE},
+                )
+                for index in range(args.users):
+                    hass.states.async_set(
+                        f"device_tracker.user_{index}",
+                        "not_home",
+                        {
+                            "latitude": HOME_LATITUDE + index * 0.01,
+                            "longitude": HOME_LONGITUDE + index * 0.01,
+                        },
+                    )
+
+                entry = build_entry(args, base_url)
+                entry.add_to_hass(hass)
+
+                tracemalloc.start()
+                memory_before = tracemalloc.get_traced_memory()[0]
+                requests_before = api.total_requests
+                setup_start = time.perf_counter()
+                assert await hass.config_entries.async_setup(entry.entry_id)
+                await hass.async_block_till_done()
+                setup_time = time.perf_counter() - setup_start
+                memory = tracemalloc.get_traced_memory()[0] - memory_before
+                tracemalloc.stop()
+
+                entity_count = len(
+                    er.async_entries_for_config_entry(
+                        er.async_get(hass), entry.entry_id
+                    )
+                )
+                report["setup"] = {
+                    "seconds": setup_time,
+                    "http_calls": api.total_requests - requests_before,
+                    "entities": entity_count,
+                    "memory_bytes_per_entity": memory / max(entity_count, 1),
+                }
+                report["refresh"] = await benchmark_refreshes(hass, api, entry, args)
+                report["state_write"] = benchmark_state_writes(hass, args.writes)
+                report["client"] = hass.data[DOMAIN][entry.entry_id][
+                    "client"
+                ].statistics.as_dict()
+
+                await hass.config_entries.async_unload(entry.entry_id)
+                await hass.async_block_till_done()
+    finally:
+        await api.stop()
+
+    report["server"] = {
+        "requests": dict(api.requests),
+        "not_modified": api.not_modified,
+        "errors": api.errors,
+    }
+    return report
+
+
+def print_report(report: dict[str, Any]) -> None:
+    """Print a benchmark report as tables.
+
+    Args:
+        report: The benchmark report
+
+    """
+    setup = report["setup"]
+    print(
+        f"Setup: {setup['seconds'] * 1000:.1f} ms, {setup['http_calls']} HTTP calls, "
+        f"{setup['entities']} entities, "
+        f"{setup['memory_bytes_per_entity'] / 1024:.1f} KiB per entity"
+    )
+
+    print()
+    print(
+        f"{'coordinator':<18} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} "
+        f"{'cpu ms':>8} {'calls':>6} {'states':>7} {'failed':>6}"
+    )
+    for name, result in report["refresh"].items():
+        latency = result["latency_ms"]
+        print(
+            f"{name:<18} {latency['p50']:>8.2f} {latency['p90']:>8.2f} "
+            f"{latency['p99']:>8.2f} {result['cpu_ms_per_refresh']:>8.2f} "
+            f"{result['http_calls_per_refresh']:>6.2f} "
+            f"{result['state_changes_per_refresh']:>7.2f} "
+            f"{result['failed_refreshes']:>6}"
+        )
+
+    print()
+    print(f"{'entity class':<46} {'count':>5} {'cpu us/write':>13}")
+    for name, result in report["state_write"].items():
+        print(
+            f"{name:<46} {result['entities']:>5} {result['cpu_us_per_write']:>13.1f}"
+        )
+
+    print()
+    print(f"Client: {report['client']}")
+    server = report["server"]
+    print(
+        f"Server: {sum(server['requests'].values())} requests, "
+        f"{server['not_modified']} not modified, {server['errors']} errors"
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments.
+
+    Returns:
+        The parsed arguments
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--refreshes", type=int, default=20, help="refreshes per coordinator")
+    parser.add_argument("--writes", type=int, default=100, help="state writes per entity")
+    parser.add_argument("--latency", type=float, default=0.02, help="response delay in s")
+    parser.add_argument("--jitter", type=float, default=0.01, help="delay deviation in s")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503 responses")
+    parser.add_argument("--stations", type=int, default=25, help="stations per search")
+    parser.add_argument("--warnings", type=int, default=2, help="warnings per type")
+    parser.add_argument("--station-ids", type=int, default=10, help="tracked station IDs")
+    parser.add_argument("--users", type=int, default=2, help="user locations")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the fake API")
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="clear the response cache before every refresh",
+    )
+    parser.add_argument(
+        "--no-bulk",
+        action="store_true",
+        help="serve no bulk station endpoint to measure the fallback",
+    )
+    parser.add_argument("--json", type=Path, help="also write the report to a file")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    report = asyncio.run(run_benchmark(args))
+    print_report(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,41 @@
 """The isal Easy Homey integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 from datetime import timedelta
 import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .api import IsalEasyHomeyApiClient
 from .const import (
     CONF_API_BASE_URL,
     CONF_API_KEY,
+    CONF_BACKGROUND_FIRST_REFRESH,
+    CONF_CHEAPEST_FROM_SEARCH,
+    CONF_DERIVE_LOCALLY,
+    CONF_LOCATION_MOVE_THRESHOLD,
     CONF_LOCATION_ENTITY_ID,
     CONF_LOCATION_ENTITY_ID_CHEAPEST,
     CONF_LOCATION_ENTITY_ID_NEAREST,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_STATION_BATCH_SIZE,
+    CONF_REQUEST_RETRIES,
+    CONF_PETROL_RATE_LIMIT,
     CONF_USER_LOCATIONS,
     CONF_STATION_IDS,
     CONF_PETROL_TYPE,
     CONF_SEARCH_RADIUS,
+    CONF_SECTION_MAX_STALENESS,
     CONF_UPDATE_INTERVAL_PETROL,
     CONF_UPDATE_INTERVAL_POLLEN,
     CONF_UPDATE_INTERVAL_WASTE,
@@ -28,6 +44,11 @@ from .const import (
     CONF_UPDATE_INTERVAL_WATER_SOFTENER,
     CONF_UPDATE_INTERVAL_WATER_CONTROL,
     CONF_WARNING_CELL_ID,
+    CONF_WARNING_CELL_IDS,
+    CONF_WARM_START_MAX_AGE,
+    CONF_WASTE_SCHEDULE_MODE,
+    CONF_WATER_CONTROL_MAX_INTERVAL,
+    CONF_WATER_CONTROL_MIN_INTERVAL,
     COORDINATOR_PETROL,
     COORDINATOR_POLLEN,
     COORDINATOR_WASTE,
@@ -35,8 +56,19 @@ from .const import (
     COORDINATOR_SERVICE_INFO,
     COORDINATOR_WATER_SOFTENER,
     COORDINATOR_WATER_CONTROL,
+    DATA_REFRESH_SCHEDULERS,
+    DATA_SHARED_REGISTRY,
+    DEFAULT_BACKGROUND_FIRST_REFRESH,
+    DEFAULT_CHEAPEST_FROM_SEARCH,
+    DEFAULT_DERIVE_LOCALLY,
+    DEFAULT_LOCATION_MOVE_THRESHOLD,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_STATION_BATCH_SIZE,
     DEFAULT_PETROL_TYPE,
+    DEFAULT_REQUEST_RETRIES,
+    DEFAULT_PETROL_RATE_LIMIT,
     DEFAULT_SEARCH_RADIUS,
+    DEFAULT_SECTION_MAX_STALENESS,
     DEFAULT_UPDATE_INTERVAL_PETROL,
     DEFAULT_UPDATE_INTERVAL_POLLEN,
     DEFAULT_UPDATE_INTERVAL_WASTE,
@@ -45,9 +77,18 @@ from .const import (
     DEFAULT_UPDATE_INTERVAL_WATER_SOFTENER,
     DEFAULT_UPDATE_INTERVAL_WATER_CONTROL,
     DEFAULT_WARNING_CELL_ID,
+    DEFAULT_WARM_START_MAX_AGE,
+    DEFAULT_WASTE_SCHEDULE_MODE,
+    DEFAULT_WATER_CONTROL_MAX_INTERVAL,
+    DEFAULT_WATER_CONTROL_MIN_INTERVAL,
     DOMAIN,
+    ENDPOINT_PETROL_STATIONS_SEARCH,
+    NON_CRITICAL_COORDINATORS,
+    RATE_LIMITS,
+    SERVICE_REFRESH_WASTE_SCHEDULE,
 )
 from .coordinator import (
+    IsalEasyHomeyDataUpdateCoordinator,
     PetrolStationCoordinator,
     PollenFlightCoordinator,
     WasteCollectionCoordinator,
@@ -56,6 +97,9 @@ from .coordinator import (
     WaterSoftenerCoordinator,
     WaterControlCoordinator,
 )
+from .scheduler import async_get_refresh_scheduler
+from .shared import async_get_shared_registry
+from .store import CoordinatorDataStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,6 +111,37 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the isal Easy Homey services.
+
+    Args:
+        hass: The Home Assistant instance
+        config: The Home Assistant configuration
+
+    Returns:
+        True if setup was successful
+
+    """
+
+    async def _async_refresh_waste_schedule(call: ServiceCall) -> None:
+        """Fetch the waste schedule of every loaded config entry now."""
+        # Entries may share one coordinator
+        waste_coordinators = {
+            entry_data["coordinators"][COORDINATOR_WASTE]
+            for entry_data in hass.data.get(DOMAIN, {}).values()
+        }
+        await asyncio.gather(
+            *(coordinator.async_refresh_schedule() for coordinator in waste_coordinators)
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH_WASTE_SCHEDULE, _async_refresh_waste_schedule
+    )
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up isal Easy Homey from a config entry.
@@ -86,8 +161,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     api_base_url = entry.options.get(CONF_API_BASE_URL, entry.data.get(CONF_API_BASE_URL))
     api_key = entry.options.get(CONF_API_KEY, entry.data.get(CONF_API_KEY))
 
+    request_retries = entry.options.get(CONF_REQUEST_RETRIES, DEFAULT_REQUEST_RETRIES)
+    petrol_rate_limit = entry.options.get(
+        CONF_PETROL_RATE_LIMIT, DEFAULT_PETROL_RATE_LIMIT
+    )
+
     _LOGGER.info("Setting up isal Easy Homey with API base URL: %s", api_base_url)
-    client = IsalEasyHomeyApiClient(api_base_url, session, api_key)
+    # Entries on the same backend share its request limits and refresh phases.
+    # The rate limits of the entry setting up the backend first apply.
+    _, petrol_burst = RATE_LIMITS[ENDPOINT_PETROL_STATIONS_SEARCH]
+    refresh_scheduler = async_get_refresh_scheduler(
+        hass,
+        api_base_url,
+        {
+            **RATE_LIMITS,
+            ENDPOINT_PETROL_STATIONS_SEARCH: (petrol_rate_limit / 60, petrol_burst),
+        },
+    )
+    # Entries with the same backend and API key share one client, so their
+    # identical requests are cached and coalesced together
+    registry = async_get_shared_registry(hass)
+    client_key = ("client", api_base_url.rstrip("/"), api_key, request_retries)
+    client, _ = registry.acquire(
+        client_key,
+        entry.entry_id,
+        lambda: IsalEasyHomeyApiClient(
+            api_base_url,
+            session,
+            api_key,
+            retries=request_retries,
+            request_semaphore=refresh_scheduler.request_semaphore,
+            rate_limiter=refresh_scheduler.rate_limiter,
+        ),
+    )
 
     # Get configuration values
     # Support both old (single location) and new (separate locations) config
@@ -99,9 +205,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     warning_cell_id = entry.options.get(
         CONF_WARNING_CELL_ID, entry.data.get(CONF_WARNING_CELL_ID, DEFAULT_WARNING_CELL_ID)
     )
+    warning_cell_ids = entry.options.get(CONF_WARNING_CELL_IDS, [])
     search_radius = entry.options.get(
         CONF_SEARCH_RADIUS, entry.data.get(CONF_SEARCH_RADIUS, DEFAULT_SEARCH_RADIUS)
     )
+    max_concurrent_requests = entry.options.get(
+        CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+    )
+    station_batch_size = entry.options.get(
+        CONF_STATION_BATCH_SIZE, DEFAULT_STATION_BATCH_SIZE
+    )
+    cheapest_from_search = entry.options.get(
+        CONF_CHEAPEST_FROM_SEARCH, DEFAULT_CHEAPEST_FROM_SEARCH
+    )
+    location_move_threshold = entry.options.get(
+        CONF_LOCATION_MOVE_THRESHOLD, DEFAULT_LOCATION_MOVE_THRESHOLD
+    )
+    background_first_refresh = entry.options.get(
+        CONF_BACKGROUND_FIRST_REFRESH, DEFAULT_BACKGROUND_FIRST_REFRESH
+    )
+    section_max_staleness = timedelta(
+        minutes=entry.options.get(
+            CONF_SECTION_MAX_STALENESS, DEFAULT_SECTION_MAX_STALENESS
+        )
+    )
+    waste_schedule_mode = entry.options.get(
+        CONF_WASTE_SCHEDULE_MODE, DEFAULT_WASTE_SCHEDULE_MODE
+    )
+    derive_locally = entry.options.get(CONF_DERIVE_LOCALLY, DEFAULT_DERIVE_LOCALLY)
+    warm_start_max_age = entry.options.get(
+        CONF_WARM_START_MAX_AGE, DEFAULT_WARM_START_MAX_AGE
+    )
 
     # Get update intervals
     update_interval_petrol = entry.options.get(
@@ -125,6 +259,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     update_interval_water_control = entry.options.get(
         CONF_UPDATE_INTERVAL_WATER_CONTROL, DEFAULT_UPDATE_INTERVAL_WATER_CONTROL
     )
+    water_control_min_interval = entry.options.get(
+        CONF_WATER_CONTROL_MIN_INTERVAL, DEFAULT_WATER_CONTROL_MIN_INTERVAL
+    )
+    water_control_max_interval = entry.options.get(
+        CONF_WATER_CONTROL_MAX_INTERVAL, DEFAULT_WATER_CONTROL_MAX_INTERVAL
+    )
+
+    # Coordinators without entry specific query parameters are shared by
+    # the entries of one client with the same settings, so global data is
+    # fetched once per backend. They are not bound to a config entry as they
+    # outlive the entry that created them.
+    shared_keys: dict[str, tuple] = {}
+    created_coordinators: set[str] = set()
+    reused_coordinators: set[str] = set()
+
+    def shared(
+        key: str,
+        params: tuple,
+        factory: Callable[[], IsalEasyHomeyDataUpdateCoordinator],
+    ) -> IsalEasyHomeyDataUpdateCoordinator:
+        shared_key = shared_keys[key] = (client_key, key, params)
+        coordinator, created = registry.acquire(shared_key, entry.entry_id, factory)
+        if created:
+            created_coordinators.add(key)
+            refresh_scheduler.async_add(
+                coordinator, f"{client.base_url}:{params!r}", key
+            )
+        else:
+            # The entry that created it restores and refreshes it, even if
+            # its first refresh is still running
+            reused_coordinators.add(key)
+        return coordinator
 
     # Create coordinators
     coordinators = {
@@ -138,49 +304,166 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             search_radius,
             timedelta(minutes=update_interval_petrol),
             entry,
+            max_concurrent_requests,
+            cheapest_from_search,
+            location_move_threshold,
+            station_batch_size,
         ),
-        COORDINATOR_WEATHER: WeatherWarningCoordinator(
-            hass,
-            client,
-            warning_cell_id,
-            timedelta(minutes=update_interval_weather),
-            entry,
+        COORDINATOR_WEATHER: shared(
+            COORDINATOR_WEATHER,
+            (
+                warning_cell_id,
+                tuple(warning_cell_ids),
+                update_interval_weather,
+                section_max_staleness,
+                max_concurrent_requests,
+            ),
+            lambda: WeatherWarningCoordinator(
+                hass,
+                client,
+                warning_cell_id,
+                timedelta(minutes=update_interval_weather),
+                None,
+                section_max_staleness,
+                warning_cell_ids,
+                max_concurrent_requests,
+            ),
         ),
-        COORDINATOR_POLLEN: PollenFlightCoordinator(
-            hass,
-            client,
-            timedelta(minutes=update_interval_pollen),
-            entry,
+        COORDINATOR_POLLEN: shared(
+            COORDINATOR_POLLEN,
+            (update_interval_pollen, section_max_staleness, derive_locally),
+            lambda: PollenFlightCoordinator(
+                hass,
+                client,
+                timedelta(minutes=update_interval_pollen),
+                None,
+                section_max_staleness,
+                derive_locally,
+            ),
         ),
-        COORDINATOR_WASTE: WasteCollectionCoordinator(
-            hass,
-            client,
-            timedelta(minutes=update_interval_waste),
-            entry,
+        COORDINATOR_WASTE: shared(
+            COORDINATOR_WASTE,
+            (
+                update_interval_waste,
+                section_max_staleness,
+                waste_schedule_mode,
+                derive_locally,
+            ),
+            lambda: WasteCollectionCoordinator(
+                hass,
+                client,
+                timedelta(minutes=update_interval_waste),
+                None,
+                section_max_staleness,
+                waste_schedule_mode,
+                derive_locally,
+            ),
         ),
-        COORDINATOR_SERVICE_INFO: ServiceInfoCoordinator(
-            hass,
-            client,
-            timedelta(minutes=update_interval_service_info),
-            entry,
+        COORDINATOR_SERVICE_INFO: shared(
+            COORDINATOR_SERVICE_INFO,
+            (update_interval_service_info,),
+            lambda: ServiceInfoCoordinator(
+                hass,
+                client,
+                timedelta(minutes=update_interval_service_info),
+                None,
+            ),
         ),
-        COORDINATOR_WATER_SOFTENER: WaterSoftenerCoordinator(
-            hass,
-            client,
-            timedelta(seconds=update_interval_water_softener),
-            entry,
+        COORDINATOR_WATER_SOFTENER: shared(
+            COORDINATOR_WATER_SOFTENER,
+            (update_interval_water_softener,),
+            lambda: WaterSoftenerCoordinator(
+                hass,
+                client,
+                timedelta(seconds=update_interval_water_softener),
+                None,
+            ),
         ),
-        COORDINATOR_WATER_CONTROL: WaterControlCoordinator(
-            hass,
-            client,
-            timedelta(seconds=update_interval_water_control),
-            entry,
+        COORDINATOR_WATER_CONTROL: shared(
+            COORDINATOR_WATER_CONTROL,
+            (
+                update_interval_water_control,
+                water_control_min_interval,
+                water_control_max_interval,
+            ),
+            lambda: WaterControlCoordinator(
+                hass,
+                client,
+                timedelta(seconds=update_interval_water_control),
+                None,
+                timedelta(seconds=water_control_min_interval),
+                timedelta(seconds=water_control_max_interval),
+            ),
         ),
     }
-
-    # Fetch initial data
-    for coordinator in coordinators.values():
-        await coordinator.async_config_entry_first_refresh()
+    refresh_scheduler.async_add(
+        coordinators[COORDINATOR_PETROL], entry.entry_id, COORDINATOR_PETROL
+    )
+    if COORDINATOR_WASTE in created_coordinators:
+        # Keep dates relative to today correct across midnight
+        registry.async_on_release(
+            shared_keys[COORDINATOR_WASTE],
+            coordinators[COORDINATOR_WASTE].async_track_midnight(),
+        )
+
+    # Start coordinators with recent enough data from the last run, their
+    # first refresh runs in the background
+    data_store = CoordinatorDataStore(hass, entry.entry_id)
+    await data_store.async_load()
+    warm_coordinators = set()
+    if warm_start_max_age:
+        for key, coordinator in coordinators.items():
+            if key in reused_coordinators:
+                continue
+            cached = data_store.restore(key, warm_start_max_age * 60)
+            if cached is not None:
+                coordinator.data = cached
+                warm_coordinators.add(key)
+        if warm_coordinators:
+            _LOGGER.info("Restored cached data of %s", ", ".join(sorted(warm_coordinators)))
+    for key, coordinator in coordinators.items():
+        entry.async_on_unload(data_store.async_track(key, coordinator))
+
+    # Fetch initial data concurrently. Non-critical coordinators can be
+    # refreshed in the background so they do not block the setup. Shared
+    # coordinators are already refreshing for another entry.
+    background_coordinators = {
+        key: coordinator
+        for key, coordinator in coordinators.items()
+        if key not in reused_coordinators
+        and (
+            key in warm_coordinators
+            or (background_first_refresh and key in NON_CRITICAL_COORDINATORS)
+        )
+    }
+    try:
+        timings = await _async_first_refresh(
+            {
+                key: coordinator
+                for key, coordinator in coordinators.items()
+                if key not in background_coordinators
+                and key not in reused_coordinators
+            }
+        )
+    except Exception:
+        # A failed setup is not unloaded, so release the shared objects here
+        await _async_release_shared(hass, entry)
+        raise
+    _LOGGER.info("First refresh timings: %s", _format_timings(timings))
+
+    for key, coordinator in background_coordinators.items():
+        if key in warm_coordinators:
+            continue
+        # Entities stay unavailable until the background refresh has data
+        coordinator.data = {}
+        coordinator.last_update_success = False
+    for key in reused_coordinators:
+        coordinator = coordinators[key]
+        if coordinator.data is None:
+            # Entities stay unavailable until the first refresh of the entry
+            # that created it has data
+            coordinator.data = {}
+            coordinator.last_update_success = False
 
     # Store coordinators and client
     hass.data[DOMAIN][entry.entry_id] = {
@@ -191,12 +474,100 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Setup platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if background_coordinators:
+        entry.async_create_background_task(
+            hass,
+            _async_background_first_refresh(background_coordinators),
+            f"{DOMAIN}_background_first_refresh_{entry.entry_id}",
+        )
+
+    # Search the nearest stations again as soon as a tracked location moves
+    entry.async_on_unload(coordinators[COORDINATOR_PETROL].async_track_locations())
+
     # Setup options update listener
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+async def _async_first_refresh(
+    coordinators: dict[str, DataUpdateCoordinator],
+) -> dict[str, float]:
+    """Run the first refresh of coordinators concurrently.
+
+    Args:
+        coordinators: The coordinators to refresh by coordinator key
+
+    Returns:
+        Duration of each first refresh in seconds by coordinator key
+
+    Raises:
+        ConfigEntryNotReady: If a first refresh fails
+
+    """
+
+    async def _refresh(coordinator: DataUpdateCoordinator) -> float:
+        start = time.monotonic()
+        if coordinator.config_entry is not None:
+            await coordinator.async_config_entry_first_refresh()
+        else:
+            # Shared coordinators are not bound to the entry being set up
+            await coordinator.async_refresh()
+            if not coordinator.last_update_success:
+                raise ConfigEntryNotReady(
+                    f"First refresh of {coordinator.name} failed"
+                ) from coordinator.last_exception
+        return time.monotonic() - start
+
+    results = await asyncio.gather(
+        *(_refresh(coordinator) for coordinator in coordinators.values()),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return dict(zip(coordinators, results, strict=True))
+
+
+async def _async_background_first_refresh(
+    coordinators: dict[str, DataUpdateCoordinator],
+) -> None:
+    """Run the first refresh of non-critical coordinators after setup.
+
+    Args:
+        coordinators: The coordinators to refresh by coordinator key
+
+    """
+
+    async def _refresh(key: str, coordinator: DataUpdateCoordinator) -> float:
+        start = time.monotonic()
+        await coordinator.async_refresh()
+        if not coordinator.last_update_success:
+            _LOGGER.warning(
+                "Background refresh of %s failed: %s", key, coordinator.last_exception
+            )
+        return time.monotonic() - start
+
+    durations = await asyncio.gather(
+        *(_refresh(key, coordinator) for key, coordinator in coordinators.items())
+    )
+    timings = dict(zip(coordinators, durations, strict=True))
+    _LOGGER.info("Background first refresh timings: %s", _format_timings(timings))
+
+
+def _format_timings(timings: dict[str, float]) -> str:
+    """Format refresh durations for logging.
+
+    Args:
+        timings: Duration in seconds by coordinator key
+
+    Returns:
+        Formatted timings, e.g. "petrol_station=1.20s, weather_warning=0.31s"
+
+    """
+    return ", ".join(f"{key}={duration:.2f}s" for key, duration in timings.items())
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry.
 
@@ -210,10 +581,40 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        await _async_release_shared(hass, entry)
+        if not hass.data[DOMAIN]:
+            hass.data.pop(DATA_REFRESH_SCHEDULERS, None)
+            hass.data.pop(DATA_SHARED_REGISTRY, None)
 
     return unload_ok
 
 
+async def _async_release_shared(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Release the shared client and coordinators of a config entry.
+
+    Shared coordinators no other entry uses anymore are shut down.
+
+    Args:
+        hass: The Home Assistant instance
+        entry: The config entry
+
+    """
+    for released in async_get_shared_registry(hass).async_release(entry.entry_id):
+        if isinstance(released, DataUpdateCoordinator):
+            await released.async_shutdown()
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached coordinator data of a removed config entry.
+
+    Args:
+        hass: The Home Assistant instance
+        entry: The config entry
+
+    """
+    await CoordinatorDataStore(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry.
 
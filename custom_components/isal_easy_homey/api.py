@@ -2,16 +2,97 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+import contextlib
+import heapq
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+import json
 import logging
+import random
+import time
 from typing import Any
 
 import aiohttp
-from aiohttp import ClientError, ClientSession, ClientTimeout
+from aiohttp import ClientError, ClientSession, ClientTimeout, hdrs
+
+from .const import (
+    CACHE_MAX_BYTES,
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL_INTERVAL_RATIO,
+    CACHE_TTL_POLICIES,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_GROUPS,
+    CIRCUIT_BREAKER_RESET_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_REQUEST_RETRIES,
+    DEFAULT_STATION_BATCH_SIZE,
+    ENDPOINT_PETROL_STATIONS_BULK,
+    ENDPOINT_PETROL_STATIONS_SEARCH,
+    ENDPOINT_WATER_CONTROL,
+    GEO_CACHE_CELL_SIZE,
+    GEO_CACHE_MAX_ENTRIES,
+    GEO_CACHE_TTL,
+    JSON_EXECUTOR_THRESHOLD,
+    MAX_SEARCH_RADIUS,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+)
+from .geo import distance_km, grid_cell, stations_within
+
+try:
+    # Bundled with Home Assistant, several times faster than json
+    import orjson
+except ImportError:
+    orjson = None
 
 _LOGGER = logging.getLogger(__name__)
 
 API_TIMEOUT = 30
 
+# Identifies identical GET requests: endpoint plus sorted query parameters
+_RequestKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+# Statuses of a backend without the bulk station endpoint: the path is taken
+# for a station ID, the query is rejected or the method is not implemented
+_BULK_UNSUPPORTED_STATUSES = (400, 404, 405, 422, 501)
+
+
+def decode_json(body: bytes) -> Any:
+    """Decode a JSON response body.
+
+    Uses orjson if it is installed and falls back to the json module.
+
+    Args:
+        body: The raw response body
+
+    Returns:
+        The decoded data or None for an empty body
+
+    Raises:
+        ValueError: If the body is not valid JSON
+
+    """
+    if not body.strip():
+        return None
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _request_key(endpoint: str, params: dict[str, Any] | None) -> _RequestKey:
+    """Build the key identifying a GET request.
+
+    Args:
+        endpoint: The endpoint to request
+        params: Optional query parameters
+
+    Returns:
+        The request key
+
+    """
+    return (endpoint, tuple(sorted((params or {}).items())))
+
 
 class IsalEasyHomeyApiError(Exception):
     """Base exception for API errors."""
@@ -25,6 +106,731 @@ class IsalEasyHomeyApiTimeoutError(IsalEasyHomeyApiError):
     """Exception for timeout errors."""
 
 
+class IsalEasyHomeyApiResponseError(IsalEasyHomeyApiConnectionError):
+    """Exception for error status responses."""
+
+    def __init__(self, message: str, status: int) -> None:
+        """Initialize the exception.
+
+        Args:
+            message: The error message
+            status: The HTTP status of the response
+
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class IsalEasyHomeyApiCircuitOpenError(IsalEasyHomeyApiConnectionError):
+    """Exception for requests rejected while the backend is considered down."""
+
+
+def _is_transient(err: IsalEasyHomeyApiError) -> bool:
+    """Return whether a failed request may succeed when sent again.
+
+    Args:
+        err: The error of the failed request
+
+    Returns:
+        True for timeouts, connection errors and 5xx or 429 responses
+
+    """
+    if isinstance(err, IsalEasyHomeyApiResponseError):
+        return err.status >= 500 or err.status == 429
+    return isinstance(
+        err, (IsalEasyHomeyApiConnectionError, IsalEasyHomeyApiTimeoutError)
+    )
+
+
+@dataclass
+class IsalEasyHomeyApiStatistics:
+    """Counters describing the requests handled by the API client."""
+
+    # HTTP requests actually sent to the backend
+    requests_sent: int = 0
+    # GET requests answered by joining an identical request already in flight
+    requests_coalesced: int = 0
+    # GET requests answered from the response cache
+    cache_hits: int = 0
+    # Cache entries dropped to stay within the entry and byte limits
+    cache_evictions: int = 0
+    # Station searches answered from a cached or running search covering
+    # their area
+    geo_cache_hits: int = 0
+    # Conditional GET requests answered with 304 Not Modified
+    not_modified: int = 0
+    # Failed GET requests sent again
+    retries: int = 0
+    # Requests rejected without being sent because a circuit breaker was open
+    circuit_rejections: int = 0
+    # Requests queued by the rate limiter before being sent
+    rate_limit_waits: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a dictionary.
+
+        Returns:
+            Dictionary of counter name to value
+
+        """
+        return asdict(self)
+
+
+class ResponseCache:
+    """In-memory LRU cache of decoded responses with a lifetime per endpoint."""
+
+    def __init__(
+        self,
+        ttl_policies: dict[str, float],
+        max_entries: int,
+        max_bytes: int,
+        statistics: IsalEasyHomeyApiStatistics,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_policies: Lifetime in seconds per endpoint prefix
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of the cached response bodies
+            statistics: Statistics to count hits and evictions in
+
+        """
+        # Longest prefix first so the most specific policy wins
+        self._ttl_policies = sorted(
+            ttl_policies.items(), key=lambda policy: len(policy[0]), reverse=True
+        )
+        # Upper bounds of the lifetime per endpoint prefix
+        self._ttl_limits: dict[str, float] = {}
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._statistics = statistics
+        self._entries: OrderedDict[_RequestKey, tuple[float, int, Any]] = OrderedDict()
+        self._size = 0
+        self.generation = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Return the cache lifetime for an endpoint.
+
+        Args:
+            endpoint: The endpoint to look up
+
+        Returns:
+            Lifetime in seconds, 0 if the endpoint is not cached
+
+        """
+        ttl = next(
+            (ttl for prefix, ttl in self._ttl_policies if endpoint.startswith(prefix)),
+            0,
+        )
+        for prefix, limit in self._ttl_limits.items():
+            if endpoint.startswith(prefix):
+                ttl = min(ttl, limit)
+        return ttl
+
+    def limit_ttl(self, prefix: str, ttl: float) -> None:
+        """Cap the lifetime of every endpoint below a prefix.
+
+        A limit never raises a lifetime, the lowest limit of a prefix wins.
+
+        Args:
+            prefix: The endpoint prefix
+            ttl: Maximum lifetime in seconds
+
+        """
+        self._ttl_limits[prefix] = min(ttl, self._ttl_limits.get(prefix, ttl))
+
+    def get(self, key: _RequestKey) -> Any | None:
+        """Return a cached response if it is still fresh.
+
+        Args:
+            key: The request key
+
+        Returns:
+            The cached response or None
+
+        """
+        if (entry := self._entries.get(key)) is None:
+            return None
+        expires_at, size, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._size -= size
+            return None
+        self._entries.move_to_end(key)
+        self._statistics.cache_hits += 1
+        return value
+
+    def set(self, key: _RequestKey, value: Any, size: int, generation: int) -> None:
+        """Store a response.
+
+        Args:
+            key: The request key
+            value: The decoded response
+            size: Size of the response body in bytes
+            generation: Cache generation at the time the request was sent
+
+        """
+        ttl = self.ttl_for(key[0])
+        if (
+            ttl <= 0
+            or self._max_entries <= 0
+            or size > self._max_bytes
+            or generation != self.generation
+        ):
+            # Responses requested before an invalidation may already be stale
+            return
+        if (previous := self._entries.pop(key, None)) is not None:
+            self._size -= previous[1]
+        self._entries[key] = (time.monotonic() + ttl, size, value)
+        self._size += size
+        while self._entries and (
+            len(self._entries) > self._max_entries or self._size > self._max_bytes
+        ):
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+            self._statistics.cache_evictions += 1
+
+    def invalidate(self, prefix: str) -> None:
+        """Drop every cached response for endpoints below a prefix.
+
+        Args:
+            prefix: The endpoint prefix to invalidate
+
+        """
+        self.generation += 1
+        for key in [key for key in self._entries if key[0].startswith(prefix)]:
+            self._size -= self._entries.pop(key)[1]
+
+
+class ValidatorStore:
+    """Bounded store of ETag / Last-Modified validators per GET request.
+
+    Each entry keeps the decoded response the validators belong to, so a
+    304 Not Modified answer can return it without downloading the body.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize the store.
+
+        Args:
+            max_entries: Maximum number of requests to keep validators for
+
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[
+            _RequestKey, tuple[str | None, str | None, Any, int]
+        ] = OrderedDict()
+
+    def headers(self, key: _RequestKey) -> dict[str, str]:
+        """Return the conditional request headers for a request.
+
+        Args:
+            key: The request key
+
+        Returns:
+            Dictionary of conditional headers, empty if nothing is stored
+
+        """
+        if (entry := self._entries.get(key)) is None:
+            return {}
+        etag, last_modified, _, _ = entry
+        headers = {}
+        if etag:
+            headers[hdrs.IF_NONE_MATCH] = etag
+        if last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = last_modified
+        return headers
+
+    def get(self, key: _RequestKey) -> tuple[Any, int] | None:
+        """Return the stored response for a request.
+
+        Args:
+            key: The request key
+
+        Returns:
+            Tuple of (decoded response, body size) or None
+
+        """
+        if (entry := self._entries.get(key)) is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[2], entry[3]
+
+    def set(
+        self,
+        key: _RequestKey,
+        etag: str | None,
+        last_modified: str | None,
+        value: Any,
+        size: int,
+    ) -> None:
+        """Store the validators of a response.
+
+        Args:
+            key: The request key
+            etag: The ETag header of the response
+            last_modified: The Last-Modified header of the response
+            value: The decoded response
+            size: Size of the response body in bytes
+
+        """
+        self._entries.pop(key, None)
+        if not etag and not last_modified:
+            return
+        self._entries[key] = (etag, last_modified, value, size)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str) -> None:
+        """Drop the validators of every endpoint below a prefix.
+
+        Args:
+            prefix: The endpoint prefix to invalidate
+
+        """
+        for key in [key for key in self._entries if key[0].startswith(prefix)]:
+            del self._entries[key]
+
+
+class GeoSearchCache:
+    """Spatial cache of station searches.
+
+    Searches are widened to cover the grid cell their coordinates fall in,
+    so nearby locations share one search. A search whose circle lies
+    within a cached search is answered from it.
+    """
+
+    def __init__(
+        self,
+        cell_size: float,
+        max_radius: float,
+        ttl: float,
+        max_entries: int,
+        statistics: IsalEasyHomeyApiStatistics,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cell_size: Edge length of a grid cell in degrees
+            max_radius: Largest radius the API accepts in km
+            ttl: Lifetime of a cached search in seconds
+            max_entries: Maximum number of cached searches, 0 disables the cache
+            statistics: Statistics to count hits in
+
+        """
+        self._cell_size = cell_size
+        self._max_radius = max_radius
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._statistics = statistics
+        # (center, radius) -> (expires_at, stations)
+        self._entries: OrderedDict[
+            tuple[tuple[float, float], float], tuple[float, list[dict[str, Any]]]
+        ] = OrderedDict()
+        # (center, radius) -> search in flight
+        self._pending: dict[
+            tuple[tuple[float, float], float], asyncio.Future[list[dict[str, Any]]]
+        ] = {}
+
+    def extend_ttl(self, ttl: float) -> None:
+        """Keep cached searches for at least a lifetime.
+
+        Args:
+            ttl: Minimum lifetime of a cached search in seconds
+
+        """
+        self._ttl = max(self._ttl, ttl)
+
+    def search_area(
+        self, coordinates: tuple[float, float], radius: float
+    ) -> tuple[tuple[float, float], float]:
+        """Return the area to actually search for a search.
+
+        Args:
+            coordinates: Tuple of (latitude, longitude) to search around
+            radius: The search radius in km
+
+        Returns:
+            Tuple of (center, radius) of the widened search, or the search
+            itself if the cache is disabled or the widened radius is too large
+
+        """
+        if self._max_entries <= 0:
+            return coordinates, radius
+        center = grid_cell(coordinates, self._cell_size)
+        corner = (
+            center[0] + self._cell_size / 2,
+            center[1] + self._cell_size / 2,
+        )
+        widened = round(radius + distance_km(center, corner), 2)
+        if widened > self._max_radius:
+            return coordinates, radius
+        return center, widened
+
+    def get(
+        self, coordinates: tuple[float, float], radius: float
+    ) -> list[dict[str, Any]] | None:
+        """Return the stations of a search from a cached search covering it.
+
+        Args:
+            coordinates: Tuple of (latitude, longitude) to search around
+            radius: The search radius in km
+
+        Returns:
+            Stations within the radius, nearest first, or None on a miss
+
+        """
+        now = time.monotonic()
+        for key, (expires_at, stations) in list(self._entries.items()):
+            if expires_at <= now:
+                del self._entries[key]
+                continue
+            center, cached_radius = key
+            if distance_km(center, coordinates) + radius <= cached_radius:
+                self._entries.move_to_end(key)
+                self._statistics.geo_cache_hits += 1
+                return stations_within(stations, coordinates, radius)
+        return None
+
+    def get_pending(
+        self, coordinates: tuple[float, float], radius: float
+    ) -> asyncio.Future[list[dict[str, Any]]] | None:
+        """Return a search in flight whose area covers a search.
+
+        Args:
+            coordinates: Tuple of (latitude, longitude) to search around
+            radius: The search radius in km
+
+        Returns:
+            The running search or None
+
+        """
+        for (center, pending_radius), search in self._pending.items():
+            if distance_km(center, coordinates) + radius <= pending_radius:
+                self._statistics.geo_cache_hits += 1
+                return search
+        return None
+
+    def add_pending(
+        self,
+        center: tuple[float, float],
+        radius: float,
+        search: asyncio.Future[list[dict[str, Any]]],
+    ) -> None:
+        """Track a search in flight until it is done.
+
+        Args:
+            center: Tuple of (latitude, longitude) searched around
+            radius: The radius searched in km
+            search: The running search
+
+        """
+        key = (center, radius)
+        self._pending[key] = search
+
+        def _done(done: asyncio.Future[list[dict[str, Any]]]) -> None:
+            if self._pending.get(key) is done:
+                del self._pending[key]
+            if not done.cancelled():
+                # Mark the exception as retrieved in case no search waits
+                done.exception()
+
+        search.add_done_callback(_done)
+
+    def set(
+        self,
+        center: tuple[float, float],
+        radius: float,
+        stations: list[dict[str, Any]],
+    ) -> None:
+        """Store the stations of a search.
+
+        Args:
+            center: Tuple of (latitude, longitude) that was searched around
+            radius: The radius that was searched in km
+            stations: The stations found
+
+        """
+        if self._max_entries <= 0:
+            return
+        self._entries.pop((center, radius), None)
+        self._entries[(center, radius)] = (time.monotonic() + self._ttl, stations)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached search."""
+        self._entries.clear()
+
+
+class CircuitBreaker:
+    """Circuit breaker for one endpoint group.
+
+    While closed, requests pass and consecutive transient failures are
+    counted. Reaching the threshold opens the breaker and requests fail
+    immediately. After the reset timeout it is half open and lets a single
+    trial request through, which closes or reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds to fail fast before a trial request
+
+        """
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.last_error: str | None = None
+        self._opened_at = 0.0
+        self._trial_running = False
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be sent now.
+
+        Returns:
+            True if the request may be sent
+
+        """
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self._reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            if self._trial_running:
+                return False
+            self._trial_running = True
+        return True
+
+    def record_success(self) -> None:
+        """Record a request the backend answered."""
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_running = False
+
+    def record_failure(self, err: Exception) -> None:
+        """Record a transient failure.
+
+        Args:
+            err: The error of the failed request
+
+        """
+        self.failures += 1
+        self.last_error = str(err)
+        self._trial_running = False
+        if self.state == self.HALF_OPEN or self.failures >= self._failure_threshold:
+            if self.state != self.OPEN:
+                self.trips += 1
+                _LOGGER.warning(
+                    "Opening circuit breaker after %s failures: %s",
+                    self.failures,
+                    err,
+                )
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Forget a request that ended without a result, e.g. when cancelled."""
+        self._trial_running = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics.
+
+        Returns:
+            Dictionary describing the breaker
+
+        """
+        retry_in = None
+        if self.state == self.OPEN:
+            retry_in = max(
+                0.0, self._opened_at + self._reset_timeout - time.monotonic()
+            )
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "last_error": self.last_error,
+            "retry_in": retry_in,
+        }
+
+
+class TokenBucket:
+    """Token bucket handing out tokens to waiters in priority order.
+
+    Tokens refill at a steady rate up to the burst size. A request takes a
+    token right away if one is left and nobody is waiting, otherwise it is
+    queued. Queued requests get tokens by priority, lowest value first,
+    then in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens
+
+        """
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        # (priority, arrival, future) of the queued requests
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._arrivals = 0
+        self._wakeup: asyncio.TimerHandle | None = None
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of queued requests."""
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def acquire(self, priority: int) -> float:
+        """Take a token, waiting for one if needed.
+
+        Args:
+            priority: Priority of the request, lower values are served first
+
+        Returns:
+            Seconds waited for the token
+
+        """
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._arrivals += 1
+        heapq.heappush(self._waiters, (priority, self._arrivals, future))
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        self._schedule_wakeup()
+        start = time.monotonic()
+        await future
+        waited = time.monotonic() - start
+        self.waits += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def _schedule_wakeup(self) -> None:
+        """Wake up the queue once the next token is available."""
+        if self._wakeup is not None:
+            return
+        delay = max(0.0, (1 - self._tokens) / self._rate)
+        self._wakeup = asyncio.get_running_loop().call_later(delay, self._release)
+
+    def _release(self) -> None:
+        """Hand out the available tokens to the queued requests."""
+        self._wakeup = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                # Cancelled while queued
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+        # Drop cancelled requests at the head so they do not keep a wakeup
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        if self._waiters:
+            self._schedule_wakeup()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the bucket state for diagnostics.
+
+        Returns:
+            Dictionary with the limits, tokens left, queue depth and wait times
+
+        """
+        self._refill()
+        return {
+            "rate": self._rate,
+            "burst": self._burst,
+            "tokens": round(self._tokens, 2),
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "waits": self.waits,
+            "mean_wait": self.total_wait / self.waits if self.waits else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+class RateLimiter:
+    """Token buckets limiting the requests per endpoint group of a backend."""
+
+    def __init__(self, limits: dict[str, tuple[float, int]]) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limits: (rate per second, burst) by endpoint prefix, the longest
+                matching prefix wins and other endpoints are not limited
+
+        """
+        self._buckets = {
+            prefix: TokenBucket(rate, burst) for prefix, (rate, burst) in limits.items()
+        }
+
+    async def acquire(self, method: str, endpoint: str) -> float:
+        """Wait until a request may be sent.
+
+        Write commands are served first, then water control polls, then
+        every other request.
+
+        Args:
+            method: The HTTP method of the request
+            endpoint: The endpoint to request
+
+        Returns:
+            Seconds waited
+
+        """
+        group = max(
+            (prefix for prefix in self._buckets if endpoint.startswith(prefix)),
+            key=len,
+            default=None,
+        )
+        if group is None:
+            return 0.0
+        if method != "GET":
+            priority = 0
+        elif endpoint.startswith(ENDPOINT_WATER_CONTROL):
+            priority = 1
+        else:
+            priority = 2
+        return await self._buckets[group].acquire(priority)
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the state of every bucket for diagnostics.
+
+        Returns:
+            Dictionary of endpoint group to bucket state
+
+        """
+        return {group: bucket.as_dict() for group, bucket in self._buckets.items()}
+
+
 class IsalEasyHomeyApiClient:
     """API Client for isal Easy Homey."""
 
@@ -33,6 +839,12 @@ class IsalEasyHomeyApiClient:
         base_url: str,
         session: ClientSession,
         api_key: str | None = None,
+        cache_max_entries: int = CACHE_MAX_ENTRIES,
+        cache_max_bytes: int = CACHE_MAX_BYTES,
+        retries: int = DEFAULT_REQUEST_RETRIES,
+        request_semaphore: asyncio.Semaphore | None = None,
+        rate_limiter: RateLimiter | None = None,
+        rate_limits: dict[str, tuple[float, int]] | None = None,
     ) -> None:
         """Initialize the API client.
 
@@ -40,11 +852,130 @@ class IsalEasyHomeyApiClient:
             base_url: The base URL of the API
             session: The aiohttp session to use for requests
             api_key: Optional API key to authenticate requests
+            cache_max_entries: Maximum number of cached responses, 0 disables the cache
+            cache_max_bytes: Maximum total size of cached response bodies
+            retries: How often a GET request failing transiently is sent again
+            request_semaphore: Limits the requests in flight, shared by every
+                client of the same backend
+            rate_limiter: Limits the request rate, shared by every client of
+                the same backend
+            rate_limits: (rate per second, burst) by endpoint prefix of an own
+                rate limiter, used without a shared rate limiter
 
         """
         self._base_url = base_url.rstrip("/")
         self._session = session
         self._api_key = api_key
+        self._in_flight: dict[_RequestKey, asyncio.Task] = {}
+        self.statistics = IsalEasyHomeyApiStatistics()
+        self._cache = ResponseCache(
+            CACHE_TTL_POLICIES, cache_max_entries, cache_max_bytes, self.statistics
+        )
+        self._validators = ValidatorStore(CACHE_MAX_ENTRIES)
+        self._geo_cache = GeoSearchCache(
+            GEO_CACHE_CELL_SIZE,
+            MAX_SEARCH_RADIUS,
+            GEO_CACHE_TTL,
+            GEO_CACHE_MAX_ENTRIES if cache_max_entries > 0 else 0,
+            self.statistics,
+        )
+        self._retries = retries
+        self._request_semaphore = request_semaphore
+        if rate_limiter is None and rate_limits is not None:
+            rate_limiter = RateLimiter(rate_limits)
+        self._rate_limiter = rate_limiter
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        # Unknown until the first bulk station request was answered
+        self._bulk_supported: bool | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Return the base URL of the API."""
+        return self._base_url
+
+    @property
+    def api_key(self) -> str | None:
+        """Return the API key sent with every request."""
+        return self._api_key
+
+    def invalidate_cache(self, prefix: str) -> None:
+        """Drop the cached responses of every endpoint below a prefix.
+
+        GET requests in flight below the prefix keep running for their
+        current waiters, but later requests no longer join them.
+
+        Args:
+            prefix: The endpoint prefix to invalidate
+
+        """
+        self._cache.invalidate(prefix)
+        for key in [key for key in self._in_flight if key[0].startswith(prefix)]:
+            del self._in_flight[key]
+
+    def extend_geo_cache_ttl(self, lifetime: timedelta) -> None:
+        """Keep cached station searches for at least a lifetime.
+
+        Args:
+            lifetime: Minimum lifetime, e.g. until the next petrol refresh
+
+        """
+        self._geo_cache.extend_ttl(lifetime.total_seconds())
+
+    def limit_cache_ttl(self, prefix: str, update_interval: timedelta) -> None:
+        """Keep cached responses of a prefix from outliving a polling interval.
+
+        Args:
+            prefix: The endpoint prefix a coordinator polls
+            update_interval: The shortest update interval of the coordinator
+
+        """
+        self._cache.limit_ttl(
+            prefix, update_interval.total_seconds() * CACHE_TTL_INTERVAL_RATIO
+        )
+
+    def circuit_breaker_states(self) -> dict[str, dict[str, Any]]:
+        """Return the state of every circuit breaker used so far.
+
+        Returns:
+            Dictionary of endpoint group to breaker state
+
+        """
+        return {
+            group: breaker.as_dict()
+            for group, breaker in self._circuit_breakers.items()
+        }
+
+    def rate_limiter_states(self) -> dict[str, dict[str, Any]]:
+        """Return the state of every rate limited endpoint group.
+
+        Returns:
+            Dictionary of endpoint group to token bucket state
+
+        """
+        if self._rate_limiter is None:
+            return {}
+        return self._rate_limiter.as_dict()
+
+    def _circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        """Return the circuit breaker of the group an endpoint belongs to.
+
+        Args:
+            endpoint: The endpoint to request
+
+        Returns:
+            The circuit breaker
+
+        """
+        group = max(
+            (prefix for prefix in CIRCUIT_BREAKER_GROUPS if endpoint.startswith(prefix)),
+            key=len,
+            default=endpoint,
+        )
+        if (breaker := self._circuit_breakers.get(group)) is None:
+            breaker = self._circuit_breakers[group] = CircuitBreaker(
+                CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_RESET_TIMEOUT
+            )
+        return breaker
 
     async def _request(
         self,
@@ -53,30 +984,181 @@ class IsalEasyHomeyApiClient:
         params: dict[str, Any] | None = None,
         json_body: dict[str, Any] | None = None,
     ) -> dict[str, Any] | list[dict[str, Any]]:
-        """Make a request to the API.
+        """Make a request to the API, sharing identical GET requests in flight.
+
+        Fresh cached GET responses are returned without a request. A GET
+        request with the same endpoint and params as a request that is
+        still running does not hit the backend again but waits for the
+        running request and receives the same response. Any other method
+        bypasses the cache and invalidates the responses, validators and
+        in-flight GET requests of its resource, so the next GET sees the
+        result of the write.
+
+        Args:
+            method: The HTTP method to use
+            endpoint: The endpoint to request
+            params: Optional query parameters
+            json_body: Optional JSON body
+
+        Returns:
+            The JSON response from the API
+
+        """
+        if method != "GET":
+            try:
+                return await self._send_with_retries(
+                    method, endpoint, params, json_body
+                )
+            finally:
+                # e.g. /water/softener/water-scene invalidates /water/softener
+                prefix = endpoint.rsplit("/", 1)[0]
+                self.invalidate_cache(prefix)
+                self._validators.invalidate(prefix)
+
+        key = _request_key(endpoint, params)
+        if (cached := self._cache.get(key)) is not None:
+            _LOGGER.debug("Using cached response for %s", endpoint)
+            return cached
+
+        if (in_flight := self._in_flight.get(key)) is not None:
+            self.statistics.requests_coalesced += 1
+            _LOGGER.debug("Joining in-flight request to %s", endpoint)
+            # Shield the shared request so a cancelled waiter does not
+            # cancel it for everyone else
+            return await asyncio.shield(in_flight)
+
+        task = asyncio.ensure_future(
+            self._send_with_retries(method, endpoint, params)
+        )
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._request_done(key, done))
+        return await asyncio.shield(task)
+
+    def _request_done(
+        self,
+        key: _RequestKey,
+        task: asyncio.Task,
+    ) -> None:
+        """Forget a finished in-flight request.
+
+        Args:
+            key: The key of the request
+            task: The finished request task
+
+        """
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every waiter was cancelled
+            task.exception()
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Send a request through the circuit breaker of its endpoint.
+
+        GET requests failing transiently are sent again after a random
+        backoff. Other methods are not idempotent and are sent only once.
+        Only the failure of the last attempt is logged as an error.
 
         Args:
             method: The HTTP method to use
             endpoint: The endpoint to request
             params: Optional query parameters
+            json_body: Optional JSON body
 
         Returns:
             The JSON response from the API
 
         Raises:
+            IsalEasyHomeyApiCircuitOpenError: If the circuit breaker is open
+
+        """
+        breaker = self._circuit_breaker(endpoint)
+        attempts = 1 + (self._retries if method == "GET" else 0)
+        for attempt in range(attempts):
+            if not breaker.allow_request():
+                self.statistics.circuit_rejections += 1
+                raise IsalEasyHomeyApiCircuitOpenError(
+                    f"Backend unavailable, not requesting {endpoint}"
+                )
+            try:
+                if self._rate_limiter is not None and (
+                    waited := await self._rate_limiter.acquire(method, endpoint)
+                ):
+                    self.statistics.rate_limit_waits += 1
+                    _LOGGER.debug("Rate limited %s for %.2f s", endpoint, waited)
+                # Backoff delays do not hold a slot of the backend limit
+                async with self._request_semaphore or contextlib.nullcontext():
+                    data = await self._send_request(method, endpoint, params, json_body)
+            except IsalEasyHomeyApiError as err:
+                if not _is_transient(err):
+                    # The backend answered, so it is reachable
+                    breaker.record_success()
+                    _LOGGER.error("Request to %s failed: %s", endpoint, err)
+                    raise
+                breaker.record_failure(err)
+                if attempt + 1 >= attempts or breaker.state == CircuitBreaker.OPEN:
+                    _LOGGER.error("Request to %s failed: %s", endpoint, err)
+                    raise
+                delay = random.uniform(
+                    0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2**attempt)
+                )
+                self.statistics.retries += 1
+                _LOGGER.debug(
+                    "Retrying %s in %.2f s after error: %s", endpoint, delay, err
+                )
+                await asyncio.sleep(delay)
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                return data
+        raise AssertionError("unreachable")
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Send a request to the API.
+
+        GET requests carry the validators of the last response, so an
+        unchanged resource is answered with 304 Not Modified and the
+        previously decoded object is returned as is.
+
+        Args:
+            method: The HTTP method to use
+            endpoint: The endpoint to request
+            params: Optional query parameters
+
+        Returns:
+            The JSON response from the API
+
+        Raises:
+            IsalEasyHomeyApiResponseError: If the API answers with an error status
             IsalEasyHomeyApiConnectionError: If there is a connection error
             IsalEasyHomeyApiTimeoutError: If the request times out
 
         """
         url = f"{self._base_url}{endpoint}"
+        cache_key = _request_key(endpoint, params)
+        cache_generation = self._cache.generation
 
         # Add API key to params if available
-        if params is None:
-            params = {}
+        params = dict(params) if params else {}
         if self._api_key:
             params["apiKey"] = self._api_key
 
         _LOGGER.debug("Making %s request to %s with params %s", method, url, params)
+        self.statistics.requests_sent += 1
 
         try:
             async with asyncio.timeout(API_TIMEOUT):
@@ -85,28 +1167,80 @@ class IsalEasyHomeyApiClient:
                 }
                 if json_body is not None:
                     request_kwargs["json"] = json_body
+                if method == "GET" and (
+                    headers := self._validators.headers(cache_key)
+                ):
+                    request_kwargs["headers"] = headers
                 response = await self._session.request(
                     method,
                     url,
                     **request_kwargs,
                 )
+                if response.status == 304:
+                    response.release()
+                    if (validated := self._validators.get(cache_key)) is not None:
+                        self.statistics.not_modified += 1
+                        data, size = validated
+                        _LOGGER.debug("Response for %s not modified", endpoint)
+                        self._cache.set(cache_key, data, size, cache_generation)
+                        return data
+                    # The stored response was dropped while the request was
+                    # in flight, ask for the full response instead
+                    _LOGGER.debug(
+                        "Response for %s not modified but no longer stored", endpoint
+                    )
+                    request_kwargs.pop("headers", None)
+                    self.statistics.requests_sent += 1
+                    response = await self._session.request(
+                        method,
+                        url,
+                        **request_kwargs,
+                    )
+                    if response.status == 304:
+                        response.release()
+                        raise IsalEasyHomeyApiResponseError(
+                            "Not modified answer to an unconditional request", 304
+                        )
                 response.raise_for_status()
-                data = await response.json()
+                body = await response.read()
+                if len(body) > JSON_EXECUTOR_THRESHOLD:
+                    # Only worth the hand-off for multi-megabyte bodies
+                    data = await asyncio.get_running_loop().run_in_executor(
+                        None, decode_json, body
+                    )
+                else:
+                    data = decode_json(body)
                 _LOGGER.debug("Received response: %s", data)
+                if method == "GET" and cache_generation == self._cache.generation:
+                    self._validators.set(
+                        cache_key,
+                        response.headers.get(hdrs.ETAG),
+                        response.headers.get(hdrs.LAST_MODIFIED),
+                        data,
+                        len(body),
+                    )
+                    self._cache.set(cache_key, data, len(body), cache_generation)
                 return data
 
+        except IsalEasyHomeyApiError:
+            raise
         except asyncio.TimeoutError as err:
-            _LOGGER.error("Timeout connecting to API: %s", err)
+            _LOGGER.debug("Timeout connecting to API: %s", err)
             raise IsalEasyHomeyApiTimeoutError(
                 f"Timeout connecting to API: {err}"
             ) from err
+        except aiohttp.ClientResponseError as err:
+            _LOGGER.debug("Error response from API: %s", err)
+            raise IsalEasyHomeyApiResponseError(
+                f"Error response from API: {err}", err.status
+            ) from err
         except ClientError as err:
-            _LOGGER.error("Error connecting to API: %s", err)
+            _LOGGER.debug("Error connecting to API: %s", err)
             raise IsalEasyHomeyApiConnectionError(
                 f"Error connecting to API: {err}"
             ) from err
         except Exception as err:
-            _LOGGER.error("Unexpected error: %s", err)
+            _LOGGER.debug("Unexpected error: %s", err)
             raise IsalEasyHomeyApiError(f"Unexpected error: {err}") from err
 
     # Petrol Station endpoints
@@ -124,6 +1258,112 @@ class IsalEasyHomeyApiClient:
         endpoint = f"/patrol-stations/{station_id}"
         return await self._request("GET", endpoint)
 
+    async def get_petrol_stations(
+        self,
+        station_ids: list[str],
+        batch_size: int = DEFAULT_STATION_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, IsalEasyHomeyApiError]]:
+        """Get the details of many petrol stations.
+
+        The IDs are looked up in batches with one bulk request each. If the
+        backend has no bulk endpoint or a bulk request fails, the stations
+        are requested one by one instead, for all batches not sent yet. A
+        failing station only fails its own ID.
+
+        Args:
+            station_ids: The IDs of the petrol stations
+            batch_size: Maximum number of IDs per bulk request
+            max_concurrency: Maximum number of requests running at the same time
+
+        Returns:
+            Tuple of (stations by ID, API errors by ID)
+
+        """
+        station_ids = list(dict.fromkeys(station_ids))
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        stations: dict[str, dict[str, Any]] = {}
+        errors: dict[str, IsalEasyHomeyApiError] = {}
+        bulk_failed = False
+
+        async def fetch_station(station_id: str) -> None:
+            async with semaphore:
+                try:
+                    stations[station_id] = await self.get_petrol_station(station_id)
+                except IsalEasyHomeyApiError as err:
+                    errors[station_id] = err
+
+        async def fetch_batch(batch: list[str]) -> None:
+            nonlocal bulk_failed
+            found = None
+            async with semaphore:
+                if self._bulk_supported is not False and not bulk_failed:
+                    try:
+                        found = await self._get_petrol_station_batch(batch)
+                    except IsalEasyHomeyApiError as err:
+                        if not bulk_failed:
+                            _LOGGER.warning(
+                                "Bulk station request failed, requesting stations one by one: %s",
+                                err,
+                            )
+                        bulk_failed = True
+                if found is not None:
+                    for station_id in batch:
+                        if station_id in found:
+                            stations[station_id] = found[station_id]
+                        else:
+                            errors[station_id] = IsalEasyHomeyApiResponseError(
+                                f"Petrol station {station_id} not found", 404
+                            )
+                    return
+            await asyncio.gather(*(fetch_station(station_id) for station_id in batch))
+
+        batch_size = max(1, batch_size)
+        batches = [
+            station_ids[start : start + batch_size]
+            for start in range(0, len(station_ids), batch_size)
+        ]
+        if batches and self._bulk_supported is None:
+            # Probe the bulk endpoint with one batch before sending the rest
+            await fetch_batch(batches.pop(0))
+        await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+        return stations, errors
+
+    async def _get_petrol_station_batch(
+        self, station_ids: list[str]
+    ) -> dict[str, dict[str, Any]] | None:
+        """Get the details of a batch of petrol stations with one request.
+
+        Args:
+            station_ids: The IDs of the petrol stations
+
+        Returns:
+            Stations by ID, unknown IDs are missing, or None if the backend
+            has no bulk endpoint
+
+        """
+        try:
+            stations = await self._request(
+                "GET",
+                ENDPOINT_PETROL_STATIONS_BULK,
+                params={"stationIds": ",".join(station_ids)},
+            )
+        except IsalEasyHomeyApiResponseError as err:
+            if err.status not in _BULK_UNSUPPORTED_STATUSES:
+                raise
+            if self._bulk_supported is not False:
+                _LOGGER.info(
+                    "Backend has no bulk station endpoint, requesting stations one by one"
+                )
+            self._bulk_supported = False
+            return None
+        self._bulk_supported = True
+        return {
+            station["stationId"]: station
+            for station in stations
+            if station.get("stationId")
+        }
+
     async def search_petrol_stations(
         self,
         latitude: float,
@@ -132,6 +1372,10 @@ class IsalEasyHomeyApiClient:
     ) -> list[dict[str, Any]]:
         """Search for petrol stations around coordinates.
 
+        Searches within the area of a cached or running search are answered
+        locally. Otherwise the whole grid cell around the coordinates is
+        searched and cached for the next nearby search.
+
         Args:
             latitude: The latitude
             longitude: The longitude
@@ -141,12 +1385,34 @@ class IsalEasyHomeyApiClient:
             List of petrol stations
 
         """
+        coordinates = (latitude, longitude)
+        if (stations := self._geo_cache.get(coordinates, distance)) is not None:
+            _LOGGER.debug("Using cached station search around %s", coordinates)
+            return stations
+
+        if (search := self._geo_cache.get_pending(coordinates, distance)) is not None:
+            _LOGGER.debug("Joining running station search around %s", coordinates)
+            stations = await asyncio.shield(search)
+            return stations_within(stations, coordinates, distance)
+
+        center, radius = self._geo_cache.search_area(coordinates, distance)
         params = {
-            "latitude": latitude,
-            "longitude": longitude,
-            "distance": distance,
+            "latitude": center[0],
+            "longitude": center[1],
+            "distance": radius,
         }
-        return await self._request("GET", "/patrol-stations", params=params)
+        if (center, radius) == (coordinates, distance):
+            return await self._request(
+                "GET", ENDPOINT_PETROL_STATIONS_SEARCH, params=params
+            )
+        # Concurrent searches nearby wait for this one instead of searching
+        search = asyncio.ensure_future(
+            self._request("GET", ENDPOINT_PETROL_STATIONS_SEARCH, params=params)
+        )
+        self._geo_cache.add_pending(center, radius, search)
+        stations = await asyncio.shield(search)
+        self._geo_cache.set(center, radius, stations)
+        return stations_within(stations, coordinates, distance)
 
     async def get_cheapest_petrol_station(
         self,
@@ -22,7 +22,11 @@ from .const import (
     DOMAIN,
     get_device_info,
 )
-from .coordinator import PollenFlightCoordinator, WeatherWarningCoordinator
+from .coordinator import (
+    PartialDataUpdateCoordinator,
+    PollenFlightCoordinator,
+    WeatherWarningCoordinator,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,12 +38,15 @@ class IsalEasyHomeyBinarySensorEntityDescription(BinarySensorEntityDescription):
     value_fn: Callable[[dict[str, Any]], bool] | None = None
     attributes_fn: Callable[[dict[str, Any]], dict[str, Any]] | None = None
     icon_fn: Callable[[bool], str] | None = None
+    # Top-level payload keys the entity depends on, None for all
+    sections: frozenset[str] | None = None
 
 
 WEATHER_WARNING_BINARY_SENSORS: tuple[IsalEasyHomeyBinarySensorEntityDescription, ...] = (
     IsalEasyHomeyBinarySensorEntityDescription(
         key="weather_warning_active",
         translation_key="weather_warning_active",
+        sections=frozenset({"warnings"}),
         value_fn=lambda data: data.get("warnings", {}).get("count", 0) > 0,
         attributes_fn=lambda data: {
             "count": data.get("warnings", {}).get("count", 0),
@@ -50,6 +57,7 @@ WEATHER_WARNING_BINARY_SENSORS: tuple[IsalEasyHomeyBinarySensorEntityDescription
     IsalEasyHomeyBinarySensorEntityDescription(
         key="upfront_warning_active",
         translation_key="upfront_warning_active",
+        sections=frozenset({"upfront"}),
         value_fn=lambda data: data.get("upfront", {}).get("count", 0) > 0,
         attributes_fn=lambda data: {
             "count": data.get("upfront", {}).get("count", 0),
@@ -59,14 +67,73 @@ WEATHER_WARNING_BINARY_SENSORS: tuple[IsalEasyHomeyBinarySensorEntityDescription
     ),
 )
 
+def weather_cell_binary_sensors(
+    coordinator: WeatherWarningCoordinator,
+) -> list[tuple[str | None, IsalEasyHomeyBinarySensorEntityDescription]]:
+    """Build the binary sensors of the additional warning cells.
+
+    Args:
+        coordinator: The weather warning coordinator
+
+    Returns:
+        Tuples of (cell ID, description): one per additional cell and one,
+        without cell ID, for a warning in any cell. Empty without additional
+        cells.
+
+    """
+    additional_cell_ids = coordinator.warning_cell_ids[1:]
+    if not additional_cell_ids:
+        return []
+
+    def cell_description(
+        cell_id: str,
+    ) -> tuple[str, IsalEasyHomeyBinarySensorEntityDescription]:
+        warnings, upfront = coordinator.cell_sections(cell_id)
+        return (
+            cell_id,
+            IsalEasyHomeyBinarySensorEntityDescription(
+                key=f"weather_warning_active_{cell_id}",
+                translation_key="cell_weather_warning_active",
+                sections=frozenset({warnings}),
+                value_fn=lambda data: data.get(warnings, {}).get("count", 0) > 0,
+                attributes_fn=lambda data: {
+                    "count": data.get(warnings, {}).get("count", 0),
+                    "upfront_count": data.get(upfront, {}).get("count", 0),
+                    "cell_id": cell_id,
+                },
+                icon_fn=lambda is_on: "mdi:alert" if is_on else "mdi:check-circle",
+            ),
+        )
+
+    return [
+        *(cell_description(cell_id) for cell_id in additional_cell_ids),
+        (
+            None,
+            IsalEasyHomeyBinarySensorEntityDescription(
+                key="any_weather_warning_active",
+                translation_key="any_weather_warning_active",
+                value_fn=lambda data: bool(coordinator.active_cells(data)),
+                attributes_fn=lambda data: {
+                    "cells": coordinator.active_cells(data),
+                    "upfront_cells": coordinator.active_cells(data, upfront=True),
+                    "unavailable_cells": [
+                        cell_id
+                        for cell_id in coordinator.warning_cell_ids
+                        if coordinator.cell_sections(cell_id)[0] not in data
+                    ],
+                },
+                icon_fn=lambda is_on: "mdi:alert" if is_on else "mdi:check-circle",
+            ),
+        ),
+    ]
+
+
 POLLEN_BINARY_SENSORS: tuple[IsalEasyHomeyBinarySensorEntityDescription, ...] = (
     IsalEasyHomeyBinarySensorEntityDescription(
         key="pollen_flight_active",
         translation_key="pollen_flight_active",
-        value_fn=lambda data: any(
-            flight.get("today", {}).get("severityLevel", 0) > 0
-            for flight in data.get("all_pollen", {}).get("flights", [])
-        ),
+        sections=frozenset({"all_pollen"}),
+        value_fn=lambda data: data.get("active_today", False),
         attributes_fn=lambda data: {
             "region": data.get("all_pollen", {}).get("regionName"),
             "part_region": data.get("all_pollen", {}).get("partRegionName"),
@@ -80,6 +147,7 @@ WATER_SOFTENER_BINARY_SENSORS: tuple[IsalEasyHomeyBinarySensorEntityDescription,
     IsalEasyHomeyBinarySensorEntityDescription(
         key="water_softener_regenerating",
         translation_key="water_softener_regenerating",
+        sections=frozenset({"regeneration"}),
         value_fn=lambda data: data.get("regeneration", {}).get("isRegenerating", False),
         icon_fn=lambda is_on: "mdi:water-sync" if is_on else "mdi:water-sync-outline",
     ),
@@ -115,6 +183,16 @@ async def async_setup_entry(
         )
         for description in WEATHER_WARNING_BINARY_SENSORS
     )
+    entities.extend(
+        IsalEasyHomeyBinarySensor(
+            weather_coordinator,
+            entry,
+            description,
+            COORDINATOR_WEATHER,
+            {"cell_id": cell_id} if cell_id else None,
+        )
+        for cell_id, description in weather_cell_binary_sensors(weather_coordinator)
+    )
 
     # Add pollen binary sensors
     pollen_coordinator = coordinators[COORDINATOR_POLLEN]
@@ -158,6 +236,7 @@ class IsalEasyHomeyBinarySensor(
         entry: ConfigEntry,
         description: IsalEasyHomeyBinarySensorEntityDescription,
         coordinator_key: str,
+        translation_placeholders: dict[str, str] | None = None,
     ) -> None:
         """Initialize the binary sensor.
 
@@ -166,10 +245,13 @@ class IsalEasyHomeyBinarySensor(
             entry: The config entry
             description: The entity description
             coordinator_key: The coordinator key for device assignment
+            translation_placeholders: Placeholders of the translated name
 
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.sections)
         self.entity_description = description
+        if translation_placeholders:
+            self._attr_translation_placeholders = translation_placeholders
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = get_device_info(entry.entry_id, coordinator_key)
 
@@ -197,6 +279,24 @@ class IsalEasyHomeyBinarySensor(
             return self.entity_description.attributes_fn(self.coordinator.data)
         return None
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available.
+
+        Returns:
+            True if available
+
+        """
+        sections = self.entity_description.sections
+        if (
+            sections
+            and isinstance(self.coordinator, PartialDataUpdateCoordinator)
+            and not self.coordinator.has_sections(sections)
+        ):
+            # A section failed for longer than the maximum staleness
+            return False
+        return super().available
+
     @property
     def icon(self) -> str | None:
         """Return the icon.
@@ -54,7 +54,8 @@ class IsalEasyHomeyMicroLeakageCheckButton(
         entry: ConfigEntry,
     ) -> None:
         """Initialize the button entity."""
-        super().__init__(coordinator)
+        # The button has no state, only availability changes are relevant
+        super().__init__(coordinator, frozenset())
         self._attr_unique_id = f"{entry.entry_id}_water_softener_micro_leakage_start"
         self._attr_device_info = get_device_info(entry.entry_id, COORDINATOR_WATER_SOFTENER)
 
@@ -67,9 +68,10 @@ class IsalEasyHomeyMicroLeakageCheckButton(
             return
 
         # Optimistic update
-        leakage_protection = self.coordinator.data.get("leakageProtection", {})
-        leakage_protection["microLeakageCheck"] = "RUNNING"
-        self.coordinator.data["leakageProtection"] = leakage_protection
-        self.async_write_ha_state()
+        leakage_protection = {
+            **self.coordinator.data.get("leakageProtection", {}),
+            "microLeakageCheck": "RUNNING",
+        }
+        self.coordinator.async_set_section("leakageProtection", leakage_protection)
         await self.coordinator.async_request_refresh()
 
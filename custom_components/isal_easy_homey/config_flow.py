@@ -21,31 +21,74 @@ from .api import (
 from .const import (
     CONF_API_BASE_URL,
     CONF_API_KEY,
+    CONF_BACKGROUND_FIRST_REFRESH,
+    CONF_CHEAPEST_FROM_SEARCH,
+    CONF_DERIVE_LOCALLY,
+    CONF_LOCATION_MOVE_THRESHOLD,
     CONF_LOCATION_ENTITY_ID,
     CONF_LOCATION_ENTITY_ID_CHEAPEST,
     CONF_LOCATION_ENTITY_ID_NEAREST,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_STATION_BATCH_SIZE,
+    CONF_REQUEST_RETRIES,
+    CONF_PETROL_RATE_LIMIT,
     CONF_USER_LOCATIONS,
     CONF_STATION_IDS,
+    CONF_WARNING_CELL_IDS,
     CONF_PETROL_TYPE,
     CONF_SEARCH_RADIUS,
+    CONF_SECTION_MAX_STALENESS,
     CONF_UPDATE_INTERVAL_PETROL,
     CONF_UPDATE_INTERVAL_POLLEN,
     CONF_UPDATE_INTERVAL_WASTE,
     CONF_UPDATE_INTERVAL_WEATHER,
     CONF_UPDATE_INTERVAL_SERVICE_INFO,
     CONF_WARNING_CELL_ID,
+    CONF_WARM_START_MAX_AGE,
+    CONF_WASTE_SCHEDULE_MODE,
+    CONF_WATER_CONTROL_MAX_INTERVAL,
+    CONF_WATER_CONTROL_MIN_INTERVAL,
     DEFAULT_API_BASE_URL,
+    DEFAULT_BACKGROUND_FIRST_REFRESH,
+    DEFAULT_CHEAPEST_FROM_SEARCH,
+    DEFAULT_DERIVE_LOCALLY,
+    DEFAULT_LOCATION_MOVE_THRESHOLD,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_STATION_BATCH_SIZE,
+    DEFAULT_REQUEST_RETRIES,
+    DEFAULT_PETROL_RATE_LIMIT,
     DEFAULT_PETROL_TYPE,
     DEFAULT_SEARCH_RADIUS,
+    DEFAULT_SECTION_MAX_STALENESS,
     DEFAULT_UPDATE_INTERVAL_PETROL,
     DEFAULT_UPDATE_INTERVAL_POLLEN,
     DEFAULT_UPDATE_INTERVAL_WASTE,
     DEFAULT_UPDATE_INTERVAL_WEATHER,
     DEFAULT_UPDATE_INTERVAL_SERVICE_INFO,
     DEFAULT_WARNING_CELL_ID,
+    DEFAULT_WARM_START_MAX_AGE,
+    DEFAULT_WASTE_SCHEDULE_MODE,
+    DEFAULT_WATER_CONTROL_MAX_INTERVAL,
+    DEFAULT_WATER_CONTROL_MIN_INTERVAL,
     DOMAIN,
+    MAX_LOCATION_MOVE_THRESHOLD,
+    MAX_MAX_CONCURRENT_REQUESTS,
+    MAX_STATION_BATCH_SIZE,
+    MAX_REQUEST_RETRIES,
+    MAX_PETROL_RATE_LIMIT,
     MAX_SEARCH_RADIUS,
+    MAX_SECTION_MAX_STALENESS,
+    MAX_WARM_START_MAX_AGE,
+    MAX_WATER_CONTROL_INTERVAL,
+    MIN_LOCATION_MOVE_THRESHOLD,
+    MIN_MAX_CONCURRENT_REQUESTS,
+    MIN_STATION_BATCH_SIZE,
+    MIN_REQUEST_RETRIES,
+    MIN_PETROL_RATE_LIMIT,
     MIN_SEARCH_RADIUS,
+    MIN_SECTION_MAX_STALENESS,
+    MIN_WARM_START_MAX_AGE,
+    MIN_WATER_CONTROL_INTERVAL,
     PETROL_TYPES,
 )
 
@@ -232,12 +275,17 @@ class IsalEasyHomeyOptionsFlow(config_entries.OptionsFlow):
                     config_entry.data.get(CONF_STATION_IDS, [])
                 )
             )
-            _LOGGER.debug("Loaded %d user locations and %d station IDs",
-                         len(self._user_locations), len(self._station_ids))
+            self._warning_cell_ids = list(
+                config_entry.options.get(CONF_WARNING_CELL_IDS, [])
+            )
+            _LOGGER.debug("Loaded %d user locations, %d station IDs and %d warning cells",
+                         len(self._user_locations), len(self._station_ids),
+                         len(self._warning_cell_ids))
         except Exception as err:
             _LOGGER.exception("Error initializing options flow: %s", err)
             self._user_locations = []
             self._station_ids = []
+            self._warning_cell_ids = []
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -255,7 +303,12 @@ class IsalEasyHomeyOptionsFlow(config_entries.OptionsFlow):
         try:
             return self.async_show_menu(
                 step_id="init",
-                menu_options=["general_settings", "user_locations", "station_ids"],
+                menu_options=[
+                    "general_settings",
+                    "user_locations",
+                    "station_ids",
+                    "warning_cells",
+                ],
             )
         except Exception as err:
             _LOGGER.exception("Error in options flow init: %s", err)
@@ -275,9 +328,10 @@ class IsalEasyHomeyOptionsFlow(config_entries.OptionsFlow):
         """
         _LOGGER.debug("General settings step, user_input: %s", user_input)
         if user_input is not None:
-            # Merge with existing user_locations and station_ids
+            # Merge with existing user_locations, station_ids and warning cells
             user_input[CONF_USER_LOCATIONS] = self._user_locations
             user_input[CONF_STATION_IDS] = self._station_ids
+            user_input[CONF_WARNING_CELL_IDS] = self._warning_cell_ids
             _LOGGER.debug("Saving general settings: %s", user_input)
             return self.async_create_entry(title="", data=user_input)
 
@@ -365,6 +419,148 @@ class IsalEasyHomeyOptionsFlow(config_entries.OptionsFlow):
                             DEFAULT_UPDATE_INTERVAL_SERVICE_INFO,
                         ),
                     ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+                    vol.Optional(
+                        CONF_WATER_CONTROL_MIN_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_WATER_CONTROL_MIN_INTERVAL,
+                            DEFAULT_WATER_CONTROL_MIN_INTERVAL,
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(
+                            min=MIN_WATER_CONTROL_INTERVAL,
+                            max=MAX_WATER_CONTROL_INTERVAL,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_WATER_CONTROL_MAX_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_WATER_CONTROL_MAX_INTERVAL,
+                            DEFAULT_WATER_CONTROL_MAX_INTERVAL,
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(
+                            min=MIN_WATER_CONTROL_INTERVAL,
+                            max=MAX_WATER_CONTROL_INTERVAL,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        default=self._config_entry.options.get(
+                            CONF_MAX_CONCURRENT_REQUESTS,
+                            DEFAULT_MAX_CONCURRENT_REQUESTS,
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(
+                            min=MIN_MAX_CONCURRENT_REQUESTS,
+                            max=MAX_MAX_CONCURRENT_REQUESTS,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_STATION_BATCH_SIZE,
+                        default=self._config_entry.options.get(
+                            CONF_STATION_BATCH_SIZE,
+                            DEFAULT_STATION_BATCH_SIZE,
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(
+                            min=MIN_STATION_BATCH_SIZE,
+                            max=MAX_STATION_BATCH_SIZE,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_REQUEST_RETRIES,
+                        default=self._config_entry.options.get(
+                            CONF_REQUEST_RETRIES,
+                            DEFAULT_REQUEST_RETRIES,
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_REQUEST_RETRIES, max=MAX_REQUEST_RETRIES),
+                    ),
+                    vol.Optional(
+                        CONF_PETROL_RATE_LIMIT,
+                        default=self._config_entry.options.get(
+                            CONF_PETROL_RATE_LIMIT,
+                            DEFAULT_PETROL_RATE_LIMIT,
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(
+                            min=MIN_PETROL_RATE_LIMIT,
+                            max=MAX_PETROL_RATE_LIMIT,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_SECTION_MAX_STALENESS,
+                        default=self._config_entry.options.get(
+                            CONF_SECTION_MAX_STALENESS,
+                            DEFAULT_SECTION_MAX_STALENESS,
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(
+                            min=MIN_SECTION_MAX_STALENESS,
+                            max=MAX_SECTION_MAX_STALENESS,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_CHEAPEST_FROM_SEARCH,
+                        default=self._config_entry.options.get(
+                            CONF_CHEAPEST_FROM_SEARCH,
+                            DEFAULT_CHEAPEST_FROM_SEARCH,
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_LOCATION_MOVE_THRESHOLD,
+                        default=self._config_entry.options.get(
+                            CONF_LOCATION_MOVE_THRESHOLD,
+                            DEFAULT_LOCATION_MOVE_THRESHOLD,
+                        ),
+                    ): vol.All(
+                        vol.Coerce(float),
+                        vol.Range(
+                            min=MIN_LOCATION_MOVE_THRESHOLD,
+                            max=MAX_LOCATION_MOVE_THRESHOLD,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_DERIVE_LOCALLY,
+                        default=self._config_entry.options.get(
+                            CONF_DERIVE_LOCALLY,
+                            DEFAULT_DERIVE_LOCALLY,
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_WASTE_SCHEDULE_MODE,
+                        default=self._config_entry.options.get(
+                            CONF_WASTE_SCHEDULE_MODE,
+                            DEFAULT_WASTE_SCHEDULE_MODE,
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_BACKGROUND_FIRST_REFRESH,
+                        default=self._config_entry.options.get(
+                            CONF_BACKGROUND_FIRST_REFRESH,
+                            DEFAULT_BACKGROUND_FIRST_REFRESH,
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_WARM_START_MAX_AGE,
+                        default=self._config_entry.options.get(
+                            CONF_WARM_START_MAX_AGE,
+                            DEFAULT_WARM_START_MAX_AGE,
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(
+                            min=MIN_WARM_START_MAX_AGE,
+                            max=MAX_WARM_START_MAX_AGE,
+                        ),
+                    ),
                 }
             ),
         )
@@ -391,6 +587,7 @@ class IsalEasyHomeyOptionsFlow(config_entries.OptionsFlow):
                 # Save and return
                 options = dict(self._config_entry.options)
                 options[CONF_USER_LOCATIONS] = self._user_locations
+                options[CONF_WARNING_CELL_IDS] = self._warning_cell_ids
                 return self.async_create_entry(title="", data=options)
 
         # Show current user locations
@@ -529,6 +726,7 @@ class IsalEasyHomeyOptionsFlow(config_entries.OptionsFlow):
                 options = dict(self._config_entry.options)
                 options[CONF_STATION_IDS] = self._station_ids
                 options[CONF_USER_LOCATIONS] = self._user_locations
+                options[CONF_WARNING_CELL_IDS] = self._warning_cell_ids
                 return self.async_create_entry(title="", data=options)
 
         # Show current station IDs
@@ -587,7 +785,20 @@ class IsalEasyHomeyOptionsFlow(config_entries.OptionsFlow):
                         CONF_API_KEY,
                         self._config_entry.data.get(CONF_API_KEY)
                     )
-                    client = IsalEasyHomeyApiClient(api_base_url, session, api_key)
+                    # Reuse the running client so the lookup can share an
+                    # identical request of the petrol coordinator, unless the
+                    # options now point to another backend or API key
+                    entry_data = self.hass.data.get(DOMAIN, {}).get(
+                        self._config_entry.entry_id
+                    )
+                    if (
+                        entry_data
+                        and entry_data["client"].base_url == api_base_url.rstrip("/")
+                        and entry_data["client"].api_key == api_key
+                    ):
+                        client = entry_data["client"]
+                    else:
+                        client = IsalEasyHomeyApiClient(api_base_url, session, api_key)
                     await client.get_petrol_station(station_id)
                     _LOGGER.debug("Successfully validated station ID %s", station_id)
 
@@ -651,3 +862,119 @@ class IsalEasyHomeyOptionsFlow(config_entries.OptionsFlow):
             ),
         )
 
+    async def async_step_warning_cells(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage additional warning cells.
+
+        Args:
+            user_input: The user input data
+
+        Returns:
+            The flow result
+
+        """
+        if user_input is not None:
+            action = user_input.get("action")
+            if action == "add":
+                return await self.async_step_add_warning_cell()
+            elif action == "remove" and self._warning_cell_ids:
+                return await self.async_step_remove_warning_cell()
+            elif action == "done":
+                # Save and return
+                options = dict(self._config_entry.options)
+                options[CONF_WARNING_CELL_IDS] = self._warning_cell_ids
+                options[CONF_STATION_IDS] = self._station_ids
+                options[CONF_USER_LOCATIONS] = self._user_locations
+                return self.async_create_entry(title="", data=options)
+
+        # Show current warning cells
+        cells_info = "\n".join(
+            [f"- {cell_id}" for cell_id in self._warning_cell_ids]
+        ) if self._warning_cell_ids else "Keine zusätzlichen Warnzellen konfiguriert"
+
+        return self.async_show_form(
+            step_id="warning_cells",
+            data_schema=vol.Schema(
+                {
+                    vol.Required("action", default="done"): vol.In(
+                        {
+                            "add": "Neue Warnzelle hinzufügen",
+                            "remove": "Warnzelle entfernen",
+                            "done": "Fertig",
+                        }
+                    ),
+                }
+            ),
+            description_placeholders={"cells": cells_info},
+        )
+
+    async def async_step_add_warning_cell(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add a new warning cell.
+
+        Args:
+            user_input: The user input data
+
+        Returns:
+            The flow result
+
+        """
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            cell_id = user_input.get(CONF_WARNING_CELL_ID, "").strip()
+            primary_cell_id = self._config_entry.options.get(
+                CONF_WARNING_CELL_ID,
+                self._config_entry.data.get(CONF_WARNING_CELL_ID, DEFAULT_WARNING_CELL_ID)
+            )
+
+            if not cell_id:
+                errors[CONF_WARNING_CELL_ID] = "invalid_warning_cell_id"
+            elif cell_id == primary_cell_id or cell_id in self._warning_cell_ids:
+                errors[CONF_WARNING_CELL_ID] = "warning_cell_id_exists"
+            else:
+                self._warning_cell_ids.append(cell_id)
+                return await self.async_step_warning_cells()
+
+        return self.async_show_form(
+            step_id="add_warning_cell",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_WARNING_CELL_ID): str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_remove_warning_cell(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Remove a warning cell.
+
+        Args:
+            user_input: The user input data
+
+        Returns:
+            The flow result
+
+        """
+        if user_input is not None:
+            cell_to_remove = user_input.get(CONF_WARNING_CELL_ID)
+            self._warning_cell_ids = [
+                cell_id for cell_id in self._warning_cell_ids if cell_id != cell_to_remove
+            ]
+            return await self.async_step_warning_cells()
+
+        # Build selection list
+        cell_options = {cell_id: cell_id for cell_id in self._warning_cell_ids}
+
+        return self.async_show_form(
+            step_id="remove_warning_cell",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_WARNING_CELL_ID): vol.In(cell_options),
+                }
+            ),
+        )
@@ -13,6 +13,7 @@ CONF_LOCATION_ENTITY_ID_NEAREST: Final = "location_entity_id_nearest"
 CONF_USER_LOCATIONS: Final = "user_locations"
 CONF_STATION_IDS: Final = "station_ids"
 CONF_WARNING_CELL_ID: Final = "warning_cell_id"
+CONF_WARNING_CELL_IDS: Final = "warning_cell_ids"
 CONF_SEARCH_RADIUS: Final = "search_radius"
 CONF_STATION_ID: Final = "station_id"
 CONF_PETROL_TYPE: Final = "petrol_type"
@@ -25,6 +26,21 @@ CONF_UPDATE_INTERVAL_WASTE: Final = "update_interval_waste"
 CONF_UPDATE_INTERVAL_SERVICE_INFO: Final = "update_interval_service_info"
 CONF_UPDATE_INTERVAL_WATER_SOFTENER: Final = "update_interval_water_softener"
 CONF_UPDATE_INTERVAL_WATER_CONTROL: Final = "update_interval_water_control"
+CONF_WATER_CONTROL_MIN_INTERVAL: Final = "water_control_min_interval"
+CONF_WATER_CONTROL_MAX_INTERVAL: Final = "water_control_max_interval"
+
+# Request handling
+CONF_MAX_CONCURRENT_REQUESTS: Final = "max_concurrent_requests"
+CONF_STATION_BATCH_SIZE: Final = "station_batch_size"
+CONF_CHEAPEST_FROM_SEARCH: Final = "cheapest_from_search"
+CONF_LOCATION_MOVE_THRESHOLD: Final = "location_move_threshold"
+CONF_BACKGROUND_FIRST_REFRESH: Final = "background_first_refresh"
+CONF_REQUEST_RETRIES: Final = "request_retries"
+CONF_PETROL_RATE_LIMIT: Final = "petrol_rate_limit"
+CONF_WARM_START_MAX_AGE: Final = "warm_start_max_age"
+CONF_SECTION_MAX_STALENESS: Final = "section_max_staleness"
+CONF_WASTE_SCHEDULE_MODE: Final = "waste_schedule_mode"
+CONF_DERIVE_LOCALLY: Final = "derive_locally"
 
 # Default values
 DEFAULT_API_BASE_URL: Final = "https://easy-homey.local.isal-home.de/v1"
@@ -41,6 +57,99 @@ DEFAULT_UPDATE_INTERVAL_SERVICE_INFO: Final = 5
 DEFAULT_UPDATE_INTERVAL_WATER_SOFTENER: Final = 30  # Seconds
 DEFAULT_UPDATE_INTERVAL_WATER_CONTROL: Final = 30  # Seconds
 
+# Adaptive water control polling (in seconds): the minimum interval is used
+# while water flows, the configured update interval right after, and once
+# water has been idle for the backoff delay the interval doubles with every
+# refresh up to the maximum
+DEFAULT_WATER_CONTROL_MIN_INTERVAL: Final = 5
+DEFAULT_WATER_CONTROL_MAX_INTERVAL: Final = 300
+MIN_WATER_CONTROL_INTERVAL: Final = 1
+MAX_WATER_CONTROL_INTERVAL: Final = 3600
+WATER_CONTROL_IDLE_BACKOFF_DELAY: Final = 600
+
+# Maximum number of API calls a coordinator runs at the same time
+DEFAULT_MAX_CONCURRENT_REQUESTS: Final = 4
+MIN_MAX_CONCURRENT_REQUESTS: Final = 1
+MAX_MAX_CONCURRENT_REQUESTS: Final = 20
+
+# Maximum number of station IDs looked up with one bulk request
+DEFAULT_STATION_BATCH_SIZE: Final = 50
+MIN_STATION_BATCH_SIZE: Final = 1
+MAX_STATION_BATCH_SIZE: Final = 200
+
+# Derive the cheapest station per fuel type from one station search
+DEFAULT_CHEAPEST_FROM_SEARCH: Final = True
+
+# Distance (in km) a location has to move before its nearest station is
+# searched again
+DEFAULT_LOCATION_MOVE_THRESHOLD: Final = 0.5
+MIN_LOCATION_MOVE_THRESHOLD: Final = 0.05
+MAX_LOCATION_MOVE_THRESHOLD: Final = 10.0
+
+# Station index of the petrol coordinator: grid cell edge length (in
+# degrees), most stations kept and most searched areas remembered. Stations
+# not seen again and areas not searched again within the maximum age (in
+# seconds) are dropped. A searched area is only kept between refreshes while
+# the nearest stations of the locations in it are confirmed by ID.
+STATION_INDEX_CELL_SIZE: Final = 0.05
+STATION_INDEX_MAX_STATIONS: Final = 2000
+STATION_INDEX_MAX_AREAS: Final = 32
+STATION_INDEX_MAX_AGE: Final = 6 * 60 * 60
+
+# Refresh non-critical coordinators in the background after setup
+DEFAULT_BACKGROUND_FIRST_REFRESH: Final = True
+
+# Maximum age (in minutes) of cached coordinator data shown at startup
+# while the first refresh runs in the background, 0 disables the cache
+DEFAULT_WARM_START_MAX_AGE: Final = 24 * 60
+MIN_WARM_START_MAX_AGE: Final = 0
+MAX_WARM_START_MAX_AGE: Final = 7 * 24 * 60
+# Delay (in seconds) collecting coordinator updates into one write
+WARM_START_SAVE_DELAY: Final = 60
+
+# How long (in minutes) a failing part of the weather, pollen or waste data
+# keeps its last good value before its entities become unavailable
+DEFAULT_SECTION_MAX_STALENESS: Final = 60
+MIN_SECTION_MAX_STALENESS: Final = 0
+MAX_SECTION_MAX_STALENESS: Final = 24 * 60
+
+# Fetch the full waste schedule once a day (interval in hours) and derive
+# the next collections locally. A schedule keeps being used for up to the
+# maximum staleness (in days) while fetching it fails.
+DEFAULT_WASTE_SCHEDULE_MODE: Final = False
+WASTE_SCHEDULE_REFRESH_INTERVAL: Final = 24
+WASTE_SCHEDULE_MAX_STALENESS: Final = 7
+
+# Derive the highest pollen flight and the next waste collection from the
+# all pollen flights and upcoming collections responses instead of fetching
+# them. With debug logging both are fetched and compared.
+DEFAULT_DERIVE_LOCALLY: Final = False
+
+# Refreshes of the coordinators of every config entry on one backend are
+# spread over their update interval with a random jitter (share of the
+# interval, capped in seconds). Requests in flight to one backend are limited.
+REFRESH_JITTER_RATIO: Final = 0.05
+REFRESH_JITTER_MAX: Final = 30
+BACKEND_MAX_IN_FLIGHT_REQUESTS: Final = 8
+DATA_REFRESH_SCHEDULERS: Final = f"{DOMAIN}_refresh_schedulers"
+
+# Clients and coordinators shared by config entries with the same backend
+# and settings
+DATA_SHARED_REGISTRY: Final = f"{DOMAIN}_shared_registry"
+
+# Retries of failed GET requests
+DEFAULT_REQUEST_RETRIES: Final = 2
+MIN_REQUEST_RETRIES: Final = 0
+MAX_REQUEST_RETRIES: Final = 5
+
+# Petrol station requests per minute to one backend. The default lets a
+# refresh looking up 200 stations one by one finish in about three minutes,
+# within the default petrol update interval. The entry setting up the
+# backend first decides the limit of every entry on it.
+DEFAULT_PETROL_RATE_LIMIT: Final = 60
+MIN_PETROL_RATE_LIMIT: Final = 6
+MAX_PETROL_RATE_LIMIT: Final = 600
+
 # Update interval limits
 MIN_SEARCH_RADIUS: Final = 0.1
 MAX_SEARCH_RADIUS: Final = 25.0
@@ -54,6 +163,16 @@ COORDINATOR_SERVICE_INFO: Final = "service_info"
 COORDINATOR_WATER_SOFTENER: Final = "water_softener"
 COORDINATOR_WATER_CONTROL: Final = "water_control"
 
+# Coordinators whose first refresh does not need to block the setup
+NON_CRITICAL_COORDINATORS: Final = (
+    COORDINATOR_SERVICE_INFO,
+    COORDINATOR_POLLEN,
+    COORDINATOR_WASTE,
+)
+
+# Services
+SERVICE_REFRESH_WASTE_SCHEDULE: Final = "refresh_waste_schedule"
+
 # Device info
 MANUFACTURER: Final = "isal"
 
@@ -90,6 +209,9 @@ POLLEN_TYPES: Final = {
     "RYE": "rye",
 }
 
+# Forecast days of a pollen flight entry
+POLLEN_FORECAST_DAYS: Final = ("today", "tomorrow", "dayAfterTomorrow")
+
 # Waste types
 WASTE_TYPES: Final = {
     "PAPER": "paper",
@@ -107,6 +229,7 @@ WEATHER_WARNING_TYPE_UPFRONT: Final = "UPFRONT_INFORMATION"
 ENDPOINT_PETROL_STATION: Final = "/patrol-stations/{station_id}"
 ENDPOINT_PETROL_STATIONS_SEARCH: Final = "/patrol-stations"
 ENDPOINT_PETROL_STATIONS_CHEAPEST: Final = "/patrol-stations/cheapest"
+ENDPOINT_PETROL_STATIONS_BULK: Final = "/patrol-stations/by-ids"
 ENDPOINT_POLLEN_FLIGHT: Final = "/weather/pollen-flight"
 ENDPOINT_POLLEN_FLIGHT_HIGHEST: Final = "/weather/pollen-flight/highest"
 ENDPOINT_WEATHER_WARNINGS: Final = "/weather/warnings"
@@ -118,6 +241,73 @@ ENDPOINT_WATER_SOFTENER_SCENE: Final = "/water/softener/water-scene"
 ENDPOINT_WATER_SOFTENER_LEAKAGE_CHECK: Final = "/water/softener/micro-leakage-check"
 ENDPOINT_WATER_CONTROL: Final = "/water/control"
 ENDPOINT_WATER_CONTROL_VALVE: Final = "/water/control/shutoff-valve"
+ENDPOINT_SERVICE_INFO: Final = "/info"
+
+# Response cache lifetime per endpoint prefix (in seconds). The longest
+# matching prefix wins, endpoints without a match are not cached. Every
+# coordinator caps the lifetime of its endpoints at a share of its update
+# interval. Scheduled refreshes are at least half an interval apart, so
+# polling always reaches the backend.
+CACHE_TTL_POLICIES: Final = {
+    ENDPOINT_WASTE_COLLECTION_ALL: 6 * 60 * 60,
+    ENDPOINT_POLLEN_FLIGHT: 60 * 60,
+    ENDPOINT_SERVICE_INFO: 4 * 60,
+    ENDPOINT_WEATHER_WARNINGS: 60,
+    ENDPOINT_PETROL_STATIONS_SEARCH: 60,
+    ENDPOINT_WATER_SOFTENER: 10,
+    ENDPOINT_WATER_CONTROL: 2,
+}
+CACHE_TTL_INTERVAL_RATIO: Final = 0.4
+CACHE_MAX_ENTRIES: Final = 256
+CACHE_MAX_BYTES: Final = 4 * 1024 * 1024
+
+# Response bodies larger than this (in bytes) are decoded in the executor
+# instead of on the event loop. python -m benchmarks.json_decode measures the
+# executor hand-off at about 40-70 µs, while orjson decodes a 53 KB station
+# search in about 0.4 ms and a 530 KB one in about 5 ms, no slower than in
+# the executor. The decoders hold the GIL, so the hop gains nothing for such
+# bodies; only multi-megabyte bodies, where it costs under 1 %, take it.
+JSON_EXECUTOR_THRESHOLD: Final = 1024 * 1024
+
+# Station searches are sent for the center of a grid cell (edge length in
+# degrees) with the radius widened to cover the whole cell. Searches within
+# a cached or running search are answered locally. Cached searches live at
+# least the lifetime (in seconds) and at least one petrol update interval,
+# so the next refresh reuses them.
+GEO_CACHE_CELL_SIZE: Final = 0.02
+GEO_CACHE_TTL: Final = DEFAULT_UPDATE_INTERVAL_PETROL * 60
+GEO_CACHE_MAX_ENTRIES: Final = 64
+
+# Backoff between retries (in seconds): a random delay up to
+# base * 2 ** attempt, capped at the maximum
+RETRY_BACKOFF_BASE: Final = 0.5
+RETRY_BACKOFF_MAX: Final = 8.0
+
+# Endpoint groups sharing a circuit breaker, the longest matching prefix wins.
+# A breaker opens after consecutive failures and lets a single trial request
+# through once the reset timeout (in seconds) has passed.
+CIRCUIT_BREAKER_GROUPS: Final = (
+    ENDPOINT_PETROL_STATIONS_SEARCH,
+    ENDPOINT_WEATHER_WARNINGS,
+    ENDPOINT_POLLEN_FLIGHT,
+    ENDPOINT_WASTE_COLLECTION_ALL,
+    ENDPOINT_SERVICE_INFO,
+    ENDPOINT_WATER_SOFTENER,
+    ENDPOINT_WATER_CONTROL,
+)
+CIRCUIT_BREAKER_FAILURE_THRESHOLD: Final = 3
+CIRCUIT_BREAKER_RESET_TIMEOUT: Final = 60
+
+# Default token buckets limiting the requests of every config entry on one
+# backend per endpoint group: (requests per second, burst). The longest
+# matching prefix wins, other endpoints are not limited. The petrol group
+# protects the rate limits of the Tankerkönig API behind the backend, its
+# rate is configurable.
+RATE_LIMITS: Final = {
+    "/patrol-stations": (DEFAULT_PETROL_RATE_LIMIT / 60, 20),
+    "/weather": (2.0, 20),
+    "/water": (5.0, 20),
+}
 
 # Water scene enum constants
 WATER_SCENES: Final = ["NORMAL", "SHOWER", "WATERING", "HEATER", "WASHING"]
@@ -1,18 +1,315 @@
 """Data Update Coordinators for isal Easy Homey integration."""
 from __future__ import annotations
 
-from datetime import timedelta
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Awaitable, Hashable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 import logging
-from typing import Any
-
-from homeassistant.core import HomeAssistant
+import time
+from typing import Any, TypeVar
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_change,
+)
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
-from .api import IsalEasyHomeyApiClient, IsalEasyHomeyApiError
-from .const import DOMAIN
+from homeassistant.util import dt as dt_util
+
+from .api import (
+    IsalEasyHomeyApiClient,
+    IsalEasyHomeyApiError,
+    IsalEasyHomeyApiResponseError,
+)
+from .const import (
+    DEFAULT_CHEAPEST_FROM_SEARCH,
+    DEFAULT_DERIVE_LOCALLY,
+    DEFAULT_LOCATION_MOVE_THRESHOLD,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_SECTION_MAX_STALENESS,
+    DEFAULT_STATION_BATCH_SIZE,
+    DEFAULT_WASTE_SCHEDULE_MODE,
+    DEFAULT_WATER_CONTROL_MAX_INTERVAL,
+    DEFAULT_WATER_CONTROL_MIN_INTERVAL,
+    DOMAIN,
+    ENDPOINT_PETROL_STATIONS_SEARCH,
+    ENDPOINT_POLLEN_FLIGHT,
+    ENDPOINT_SERVICE_INFO,
+    ENDPOINT_WASTE_COLLECTION_ALL,
+    ENDPOINT_WATER_CONTROL,
+    ENDPOINT_WATER_SOFTENER,
+    ENDPOINT_WEATHER_WARNINGS,
+    PETROL_TYPES,
+    POLLEN_FORECAST_DAYS,
+    REFRESH_JITTER_MAX,
+    STATION_INDEX_CELL_SIZE,
+    STATION_INDEX_MAX_AGE,
+    STATION_INDEX_MAX_AREAS,
+    STATION_INDEX_MAX_STATIONS,
+    WASTE_SCHEDULE_MAX_STALENESS,
+    WASTE_SCHEDULE_REFRESH_INTERVAL,
+    WATER_CONTROL_IDLE_BACKOFF_DELAY,
+)
+from .geo import StationIndex, distance_km
+from .scheduler import RefreshScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+
+# Identifies a nearest station location: ("nearest", None) or ("user", name)
+_LocationKey = tuple[str, str | None]
+_NEAREST_LOCATION: _LocationKey = ("nearest", None)
+
+
+async def gather_isolated(
+    requests: dict[_KeyT, Awaitable[Any]],
+    max_concurrency: int,
+) -> tuple[dict[_KeyT, Any], dict[_KeyT, IsalEasyHomeyApiError]]:
+    """Run API calls concurrently and collect results and failures per call.
+
+    Args:
+        requests: Mapping of request key to the awaitable API call
+        max_concurrency: Maximum number of calls running at the same time
+
+    Returns:
+        Tuple of (results by key, API errors by key)
+
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _run(request: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await request
+
+    outcomes = await asyncio.gather(
+        *(_run(request) for request in requests.values()),
+        return_exceptions=True,
+    )
+
+    results: dict[_KeyT, Any] = {}
+    errors: dict[_KeyT, IsalEasyHomeyApiError] = {}
+    for key, outcome in zip(requests, outcomes, strict=True):
+        if isinstance(outcome, IsalEasyHomeyApiError):
+            errors[key] = outcome
+        elif isinstance(outcome, BaseException):
+            # Programming errors must not be swallowed by failure isolation
+            raise outcome
+        else:
+            results[key] = outcome
+    return results, errors
+
+
+def get_price_from_prices(prices: list[dict[str, Any]], petrol_type: str) -> float | None:
+    """Extract price for a specific petrol type.
+
+    Args:
+        prices: List of price dictionaries
+        petrol_type: The petrol type to find
+
+    Returns:
+        The price or None
+
+    """
+    for price in prices:
+        if price.get("petrolType") == petrol_type:
+            return price.get("price")
+    return None
+
+
+def format_address(address: dict[str, Any]) -> str:
+    """Format address as string.
+
+    Args:
+        address: Address dictionary
+
+    Returns:
+        Formatted address string
+
+    """
+    parts = []
+    if street := address.get("street"):
+        parts.append(street)
+    if house_number := address.get("houseNumber"):
+        parts[-1] = f"{parts[-1]} {house_number}"
+    if postal_code := address.get("postalCode"):
+        parts.append(postal_code)
+    if city := address.get("city"):
+        parts.append(city)
+    return ", ".join(parts)
+
+
+def normalize_station(station: dict[str, Any]) -> dict[str, Any]:
+    """Add a normalized record to a station payload.
+
+    The record holds everything the sensors derive from the raw payload, so
+    it is computed once per refresh instead of on every state write.
+
+    Args:
+        station: Station data from the API
+
+    Returns:
+        Shallow copy of the station with a "normalized" record
+
+    """
+    prices = {
+        petrol_type: get_price_from_prices(station.get("prices") or [], petrol_type)
+        for petrol_type in PETROL_TYPES
+    }
+    price_attributes: dict[str, Any] = {}
+    for petrol_type, price in prices.items():
+        prefix = petrol_type.lower()
+        price_attributes[f"{prefix}_price"] = price
+        price_attributes[f"{prefix}_price_eur"] = (
+            f"{price:.3f} €" if price is not None else "-"
+        )
+
+    return {
+        **station,
+        "normalized": {
+            "prices": prices,
+            "price_attributes": price_attributes,
+            "address": format_address(station.get("address") or {}),
+            "distance": (station.get("location") or {}).get("distance"),
+        },
+    }
+
+
+def find_cheapest_stations(
+    stations: list[dict[str, Any]],
+) -> dict[str, dict[str, Any]] | None:
+    """Find the cheapest station per fuel type in one pass over a search result.
+
+    Closed stations are skipped. Equal prices are decided by distance.
+
+    Args:
+        stations: List of stations from a search
+
+    Returns:
+        Cheapest station by fuel type, or None if the stations carry no prices
+
+    """
+    cheapest: dict[str, tuple[float, float, dict[str, Any]]] = {}
+    has_prices = False
+    for station in stations:
+        prices = station.get("prices")
+        if prices is None:
+            continue
+        has_prices = True
+        if station.get("status") == "CLOSED":
+            continue
+        distance = (station.get("location") or {}).get("distance")
+        if distance is None:
+            distance = float("inf")
+        for price in prices:
+            petrol_type = price.get("petrolType")
+            value = price.get("price")
+            if value is None or petrol_type not in PETROL_TYPES:
+                continue
+            best = cheapest.get(petrol_type)
+            if best is None or (value, distance) < (best[0], best[1]):
+                cheapest[petrol_type] = (value, distance, station)
+
+    if stations and not has_prices:
+        return None
+    return {petrol_type: best[2] for petrol_type, best in cheapest.items()}
+
+
+def index_pollen_flights(all_pollen: dict[str, Any]) -> dict[str, Any]:
+    """Index pollen flights by pollen type and derive day-level fields.
+
+    Args:
+        all_pollen: The pollen flight response
+
+    Returns:
+        Dictionary with the flights keyed by pollen type, the highest
+        severity level per forecast day and whether any pollen flies today
+
+    """
+    flights_by_type: dict[str, dict[str, Any]] = {}
+    max_severity_levels = dict.fromkeys(POLLEN_FORECAST_DAYS, 0)
+    for flight in all_pollen.get("flights", []):
+        if pollen_type := flight.get("pollenType"):
+            flights_by_type.setdefault(pollen_type, flight)
+        for day in POLLEN_FORECAST_DAYS:
+            level = flight.get(day, {}).get("severityLevel") or 0
+            max_severity_levels[day] = max(max_severity_levels[day], level)
+
+    return {
+        "flights_by_type": flights_by_type,
+        "max_severity_levels": max_severity_levels,
+        "active_today": max_severity_levels["today"] > 0,
+    }
+
+
+def derive_highest_pollen_flight(all_pollen: dict[str, Any]) -> dict[str, Any]:
+    """Derive the highest pollen flight response from all pollen flights.
+
+    Args:
+        all_pollen: The pollen flight response
+
+    Returns:
+        Dictionary shaped like the highest pollen flight response, holding
+        the first flight with the highest severity level today
+
+    """
+    flights = all_pollen.get("flights", [])
+    if not flights:
+        return {}
+    return {
+        "highestSeverity": max(
+            flights,
+            key=lambda flight: flight.get("today", {}).get("severityLevel") or 0,
+        )
+    }
+
+
+def derive_waste_collections(schedule: dict[str, Any], today: date) -> dict[str, Any]:
+    """Derive the upcoming and next waste collections from the full schedule.
+
+    Args:
+        schedule: All future waste collections from the API
+        today: The current local date
+
+    Returns:
+        Dictionary with "upcoming" (next collection per waste type) and
+        "next" (next collection date with all its waste types) shaped like
+        the responses of the upcoming and next collection endpoints
+
+    """
+    collections = sorted(
+        (
+            collection
+            for collection in schedule.get("scheduledCollections", [])
+            if collection.get("scheduledOn")
+            and datetime.fromisoformat(collection["scheduledOn"]).date() >= today
+        ),
+        key=lambda collection: datetime.fromisoformat(collection["scheduledOn"]),
+    )
+
+    upcoming: dict[str, dict[str, Any]] = {}
+    for collection in collections:
+        upcoming.setdefault(collection.get("wasteType"), collection)
+
+    next_collection: dict[str, Any] = {}
+    if collections:
+        next_date = datetime.fromisoformat(collections[0]["scheduledOn"]).date()
+        next_collection = {
+            "scheduledOn": collections[0]["scheduledOn"],
+            "scheduledCollections": [
+                collection
+                for collection in collections
+                if datetime.fromisoformat(collection["scheduledOn"]).date() == next_date
+            ],
+        }
+
+    return {
+        "upcoming": {"scheduledCollections": list(upcoming.values())},
+        "next": next_collection,
+    }
+
 
 def get_coordinates_from_entity(
     hass: HomeAssistant, entity_id: str | None
@@ -45,8 +342,83 @@ def get_coordinates_from_entity(
     return (float(latitude), float(longitude))
 
 
-class PetrolStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Coordinator for petrol station data."""
+class IsalEasyHomeyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Base of the coordinators of the integration.
+
+    Once added to a refresh scheduler, periodic refreshes run at the phase
+    of the coordinator instead of one update interval after the last one.
+    Refresh listeners are called after every successful refresh, even if
+    the data did not change and entities were not updated.
+    """
+
+    refresh_scheduler: RefreshScheduler | None = None
+    refresh_phase: float = 0.0
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the coordinator.
+
+        Args:
+            *args: Positional arguments of DataUpdateCoordinator
+            **kwargs: Keyword arguments of DataUpdateCoordinator
+
+        """
+        super().__init__(*args, **kwargs)
+        self._refresh_listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_add_refresh_listener(self, refreshed: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call a function after every successful refresh.
+
+        Args:
+            refreshed: The function to call
+
+        Returns:
+            Callback to stop calling the function
+
+        """
+        self._refresh_listeners.append(refreshed)
+
+        @callback
+        def _remove() -> None:
+            self._refresh_listeners.remove(refreshed)
+
+        return _remove
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Call the refresh listeners if the refresh succeeded."""
+        super()._async_refresh_finished()
+        if self.last_update_success:
+            for refreshed in list(self._refresh_listeners):
+                refreshed()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh at the phase of the coordinator."""
+        if self.refresh_scheduler is None or self.update_interval is None:
+            super()._schedule_refresh()
+            return
+        interval = self.update_interval
+        self.update_interval = timedelta(
+            seconds=self.refresh_scheduler.next_delay(
+                self.refresh_phase, interval.total_seconds()
+            )
+        )
+        try:
+            super()._schedule_refresh()
+        finally:
+            self.update_interval = interval
+
+
+class PetrolStationCoordinator(IsalEasyHomeyDataUpdateCoordinator):
+    """Coordinator for petrol station data.
+
+    Every station seen in a search or by-ID response is kept in a station
+    index. The nearest stations of a location are answered from the index
+    and searched only if the location lies outside every searched area.
+    Moves beyond the move threshold are picked up from state changes of the
+    location entities.
+    """
 
     def __init__(
         self,
@@ -59,6 +431,10 @@ class PetrolStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         search_radius: float,
         update_interval: timedelta,
         config_entry,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        cheapest_from_search: bool = DEFAULT_CHEAPEST_FROM_SEARCH,
+        move_threshold: float = DEFAULT_LOCATION_MOVE_THRESHOLD,
+        station_batch_size: int = DEFAULT_STATION_BATCH_SIZE,
     ) -> None:
         """Initialize the coordinator.
 
@@ -72,6 +448,10 @@ class PetrolStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             search_radius: Search radius in km
             update_interval: Update interval
             config_entry: The config entry
+            max_concurrency: Maximum number of API calls running at the same time
+            cheapest_from_search: Derive the cheapest stations from one search
+            move_threshold: Distance in km a location has to move to update its nearest station
+            station_batch_size: Maximum number of stations looked up with one request
 
         """
         super().__init__(
@@ -80,17 +460,147 @@ class PetrolStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name=f"{DOMAIN}_petrol_station",
             update_interval=update_interval,
             config_entry=config_entry,
+            # Unchanged (e.g. 304 Not Modified) data does not update entities
+            always_update=False,
         )
         self.client = client
+        client.limit_cache_ttl(ENDPOINT_PETROL_STATIONS_SEARCH, update_interval)
+        # Searches carry over to the next refresh, even if it is jittered late
+        client.extend_geo_cache_ttl(
+            update_interval + timedelta(seconds=REFRESH_JITTER_MAX)
+        )
         self.location_entity_id_cheapest = location_entity_id_cheapest
         self.location_entity_id_nearest = location_entity_id_nearest
         self.user_locations = user_locations or []
         self.station_ids = station_ids or []
         self.search_radius = search_radius
+        self.max_concurrency = max_concurrency
+        self.cheapest_from_search = cheapest_from_search
+        self.move_threshold = move_threshold
+        self.station_batch_size = station_batch_size
+        # Unknown until the first search result with stations was seen
+        self._search_has_prices: bool | None = None
+        # Searched areas stay covered while the next refresh confirms them
+        self._index = StationIndex(
+            STATION_INDEX_CELL_SIZE,
+            STATION_INDEX_MAX_STATIONS,
+            STATION_INDEX_MAX_AREAS,
+            STATION_INDEX_MAX_AGE,
+            (update_interval + timedelta(seconds=REFRESH_JITTER_MAX)).total_seconds(),
+        )
+        # Coordinates the nearest station of each location was determined for
+        self._located_coordinates: dict[_LocationKey, tuple[float, float]] = {}
+
+    @callback
+    def async_track_locations(self) -> CALLBACK_TYPE:
+        """Refresh when a location entity moved beyond the move threshold.
+
+        Returns:
+            Callback to stop tracking
+
+        """
+        entity_ids = {
+            entity_id
+            for entity_id in (
+                self.location_entity_id_nearest,
+                *(user_loc.get("entity_id") for user_loc in self.user_locations),
+            )
+            if entity_id
+        }
+        if not entity_ids:
+            return lambda: None
+        return async_track_state_change_event(
+            self.hass, list(entity_ids), self._async_location_changed
+        )
+
+    @callback
+    def _async_location_changed(self, event: Event) -> None:
+        """Request a refresh if a location moved beyond the move threshold.
+
+        Args:
+            event: The state changed event
+
+        """
+        if any(
+            self._has_moved(location, coordinates)
+            for location, coordinates in self._location_coordinates().items()
+        ):
+            _LOGGER.debug(
+                "%s moved, refreshing nearest stations", event.data["entity_id"]
+            )
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def _location_coordinates(self) -> dict[_LocationKey, tuple[float, float]]:
+        """Return the current coordinates of every nearest station location.
+
+        Returns:
+            Coordinates by location key
+        """
+        locations: dict[_LocationKey, tuple[float, float]] = {}
+        if coordinates := get_coordinates_from_entity(
+            self.hass, self.location_entity_id_nearest
+        ):
+            locations[_NEAREST_LOCATION] = coordinates
+
+        for user_loc in self.user_locations:
+            user_name = user_loc.get("name")
+            entity_id = user_loc.get("entity_id")
+
+            if not user_name or not entity_id:
+                continue
+
+            if coordinates := get_coordinates_from_entity(self.hass, entity_id):
+                locations[("user", user_name)] = coordinates
+        return locations
+
+    def _has_moved(
+        self, location: _LocationKey, coordinates: tuple[float, float]
+    ) -> bool:
+        """Return whether the nearest station of a location has to be updated.
+
+        Args:
+            location: The location key
+            coordinates: The current coordinates of the location
+
+        Returns:
+            True if never located or moved beyond the move threshold
+
+        """
+        located = self._located_coordinates.get(location)
+        return located is None or distance_km(located, coordinates) > self.move_threshold
+
+    def nearest_stations(
+        self, coordinates: tuple[float, float], count: int = 1
+    ) -> list[dict[str, Any]] | None:
+        """Return the nearest stations to some coordinates from the index.
+
+        Args:
+            coordinates: Tuple of (latitude, longitude)
+            count: Maximum number of stations to return
+
+        Returns:
+            Up to count stations within the search radius, nearest first, or
+            None if a closer station may be missing because the area around
+            the coordinates has not been searched
+
+        """
+        stations = self._index.nearest(coordinates, count, self.search_radius)
+        if len(stations) < count:
+            radius = self.search_radius
+        else:
+            radius = stations[-1]["location"]["distance"]
+        if not self._index.covers(coordinates, radius):
+            return None
+        return stations
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API.
 
+        All calls of a refresh run concurrently. A failing call only drops
+        its own part of the result; the refresh fails if every call failed.
+        Searches for identical coordinates are only sent once and all
+        stations requested by ID are looked up in bulk.
+
         Returns:
             Dictionary with petrol station data
 
@@ -98,89 +608,381 @@ class PetrolStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             UpdateFailed: If update fails
 
         """
-        try:
-            data: dict[str, Any] = {}
+        requests: dict[tuple[str, Any], Awaitable[Any]] = {}
+        # Tracked stations first, so the batches stay the same across refreshes
+        station_ids = dict.fromkeys(self.station_ids)
+
+        def add_search(coordinates: tuple[float, float]) -> None:
+            if ("search", coordinates) not in requests:
+                requests[("search", coordinates)] = self.client.search_petrol_stations(
+                    *coordinates, self.search_radius
+                )
 
-            # Get cheapest stations for all fuel types
-            coordinates_cheapest = get_coordinates_from_entity(
-                self.hass, self.location_entity_id_cheapest
+        # Get cheapest stations for all fuel types, either from one search
+        # or with one cheapest request per fuel type. Prices change
+        # anywhere, so this is searched on every refresh.
+        coordinates_cheapest = get_coordinates_from_entity(
+            self.hass, self.location_entity_id_cheapest
+        )
+        cheapest_from_search = self._use_cheapest_search()
+        if coordinates_cheapest:
+            if cheapest_from_search:
+                add_search(coordinates_cheapest)
+            else:
+                self._add_cheapest_requests(requests, coordinates_cheapest)
+
+        # Search around locations outside the indexed areas. For all others
+        # refresh the nearest station unless a search of this refresh does.
+        # A confirmed nearest station keeps the area around it covered.
+        locations = self._location_coordinates()
+        searches = [coordinates for kind, coordinates in requests if kind == "search"]
+        confirming: dict[str, list[tuple[tuple[float, float], float]]] = {}
+        for coordinates in locations.values():
+            if (nearest := self.nearest_stations(coordinates)) is None:
+                add_search(coordinates)
+            elif nearest and not any(
+                distance_km(searched, coordinates)
+                + nearest[0]["location"]["distance"]
+                <= self.search_radius
+                for searched in searches
+            ):
+                station_ids.setdefault(nearest[0]["stationId"])
+                confirming.setdefault(nearest[0]["stationId"], []).append(
+                    (coordinates, nearest[0]["location"]["distance"])
+                )
+
+        if station_ids:
+            requests[("stations", None)] = self.client.get_petrol_stations(
+                list(station_ids), self.station_batch_size, self.max_concurrency
             )
-            if coordinates_cheapest:
-                latitude, longitude = coordinates_cheapest
-
-                # Get cheapest stations for each fuel type
-                cheapest_stations = {}
-                for fuel_type in ["E5", "E10", "DIESEL"]:
-                    cheapest = await self.client.get_cheapest_petrol_station(
-                        latitude, longitude, self.search_radius, fuel_type
+
+        results, errors = await gather_isolated(requests, self.max_concurrency)
+        if (stations := results.pop(("stations", None), None)) is not None:
+            # Merge the per-station outcomes of the bulk lookup
+            found, failed = stations
+            results.update({("station", key): value for key, value in found.items()})
+            errors.update({("station", key): err for key, err in failed.items()})
+
+        data: dict[str, Any] = {}
+
+        if coordinates_cheapest:
+            cheapest_stations = None
+            search_key = ("search", coordinates_cheapest)
+            if cheapest_from_search and search_key in results:
+                cheapest_stations = find_cheapest_stations(results[search_key])
+                if cheapest_stations is None:
+                    _LOGGER.info(
+                        "Station search results contain no prices, "
+                        "falling back to cheapest station requests"
+                    )
+                    self._search_has_prices = False
+                    fallback: dict[tuple[str, Any], Awaitable[Any]] = {}
+                    self._add_cheapest_requests(fallback, coordinates_cheapest)
+                    fallback_results, fallback_errors = await gather_isolated(
+                        fallback, self.max_concurrency
                     )
-                    cheapest_stations[fuel_type] = cheapest
+                    results.update(fallback_results)
+                    errors.update(fallback_errors)
+                elif results[search_key]:
+                    self._search_has_prices = True
+
+            if cheapest_stations is None:
+                cheapest_stations = {
+                    fuel_type: results[("cheapest", fuel_type)]
+                    for fuel_type in PETROL_TYPES
+                    if ("cheapest", fuel_type) in results
+                }
+            data["cheapest_stations"] = cheapest_stations
+
+        for (kind, key), err in errors.items():
+            _LOGGER.warning("Failed to fetch %s petrol data %s: %s", kind, key, err)
+        if errors and not results:
+            err = next(iter(errors.values()))
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-                data["cheapest_stations"] = cheapest_stations
+        for (kind, key), result in results.items():
+            if kind == "search":
+                self._index.add_search(key, self.search_radius, result)
+            elif kind in ("station", "cheapest") and result:
+                self._index.add(result)
+        for station_id, circles in confirming.items():
+            if ("station", station_id) in results:
+                for coordinates, radius in circles:
+                    self._index.confirm(coordinates, radius)
+            else:
+                err = errors.get(("station", station_id))
+                if isinstance(err, IsalEasyHomeyApiResponseError) and err.status == 404:
+                    # Delisted, the next nearest station takes its place
+                    self._index.remove(station_id)
+
+        nearest_stations: dict[_LocationKey, dict[str, Any]] = {}
+        for location, coordinates in locations.items():
+            if (nearest := self.nearest_stations(coordinates)) is None:
+                # The search around the location failed
+                continue
+            self._located_coordinates[location] = coordinates
+            if nearest:
+                nearest_stations[location] = nearest[0]
+        if _NEAREST_LOCATION in nearest_stations:
+            data["nearest_station"] = nearest_stations[_NEAREST_LOCATION]
+        data["user_nearest_stations"] = {
+            location[1]: station
+            for location, station in nearest_stations.items()
+            if location[0] == "user"
+        }
+
+        data["stations_by_id"] = {
+            station_id: results[("station", station_id)]
+            for station_id in self.station_ids
+            if ("station", station_id) in results
+        }
+
+        return self._normalize_stations(data)
+
+    @staticmethod
+    def _normalize_stations(data: dict[str, Any]) -> dict[str, Any]:
+        """Normalize every station of a refresh result once.
+
+        A station referenced from several places (e.g. cheapest for two
+        fuel types) is normalized only once and shared.
 
-            # Get nearest station based on location_entity_id_nearest
-            coordinates_nearest = get_coordinates_from_entity(
-                self.hass, self.location_entity_id_nearest
+        Args:
+            data: The refresh result
+
+        Returns:
+            The refresh result with normalized stations
+
+        """
+        normalized: dict[int, dict[str, Any]] = {}
+
+        def normalize(station: dict[str, Any] | None) -> dict[str, Any] | None:
+            if not station:
+                return station
+            if id(station) not in normalized:
+                normalized[id(station)] = normalize_station(station)
+            return normalized[id(station)]
+
+        for key in ("cheapest_stations", "user_nearest_stations", "stations_by_id"):
+            if key in data:
+                data[key] = {name: normalize(station) for name, station in data[key].items()}
+        if "nearest_station" in data:
+            data["nearest_station"] = normalize(data["nearest_station"])
+        return data
+
+    def _use_cheapest_search(self) -> bool:
+        """Return whether cheapest stations are derived from a station search.
+
+        Returns:
+            True if a single search should be used for all fuel types
+
+        """
+        return self.cheapest_from_search and self._search_has_prices is not False
+
+    def _add_cheapest_requests(
+        self,
+        requests: dict[tuple[str, Any], Awaitable[Any]],
+        coordinates: tuple[float, float],
+    ) -> None:
+        """Add one cheapest station request per fuel type.
+
+        Args:
+            requests: The request mapping to add the calls to
+            coordinates: Tuple of (latitude, longitude)
+
+        """
+        latitude, longitude = coordinates
+        for fuel_type in PETROL_TYPES:
+            requests[("cheapest", fuel_type)] = self.client.get_cheapest_petrol_station(
+                latitude, longitude, self.search_radius, fuel_type
             )
-            if coordinates_nearest:
-                latitude, longitude = coordinates_nearest
 
-                stations = await self.client.search_petrol_stations(
-                    latitude, longitude, self.search_radius
-                )
 
-                if stations:
-                    nearest = min(
-                        stations,
-                        key=lambda x: x.get("location", {}).get("distance", float("inf"))
-                    )
-                    data["nearest_station"] = nearest
+@dataclass
+class SectionState:
+    """Outcome of the last fetches of one section of a coordinator payload."""
 
-            # Get nearest stations for each user location
-            user_nearest_stations = {}
-            for user_loc in self.user_locations:
-                user_name = user_loc.get("name")
-                entity_id = user_loc.get("entity_id")
+    # Last successfully fetched value
+    value: Any = None
+    # time.monotonic() of the last success
+    last_success: float | None = None
+    # Error of the last fetch, None if it succeeded
+    last_error: str | None = None
 
-                if not user_name or not entity_id:
-                    continue
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state for diagnostics.
 
-                coordinates = get_coordinates_from_entity(self.hass, entity_id)
-                if coordinates:
-                    latitude, longitude = coordinates
+        Returns:
+            Dictionary with the age of the value in seconds and the last error
 
-                    stations = await self.client.search_petrol_stations(
-                        latitude, longitude, self.search_radius
-                    )
+        """
+        return {
+            "age": (
+                time.monotonic() - self.last_success
+                if self.last_success is not None
+                else None
+            ),
+            "last_error": self.last_error,
+        }
+
+
+class PartialDataUpdateCoordinator(IsalEasyHomeyDataUpdateCoordinator, ABC):
+    """Coordinator whose payload sections are fetched and fail independently.
+
+    A failing section keeps its last good value while that is not older
+    than the maximum staleness and is dropped from the payload afterwards.
+    Data restored at startup counts as fetched when the first fetch of its
+    section fails. A refresh only fails if no section has data.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        max_staleness: timedelta = timedelta(minutes=DEFAULT_SECTION_MAX_STALENESS),
+        derive_locally: bool = DEFAULT_DERIVE_LOCALLY,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the coordinator.
 
-                    if stations:
-                        nearest = min(
-                            stations,
-                            key=lambda x: x.get("location", {}).get("distance", float("inf"))
-                        )
-                        user_nearest_stations[user_name] = nearest
+        Args:
+            *args: Positional arguments of DataUpdateCoordinator
+            max_staleness: How long a failing section keeps its last good value
+            derive_locally: Derive sections from others instead of fetching them
+            max_concurrent_requests: Maximum number of sections fetched at once
+            **kwargs: Keyword arguments of DataUpdateCoordinator
 
-            data["user_nearest_stations"] = user_nearest_stations
+        """
+        super().__init__(*args, **kwargs)
+        self.max_staleness = max_staleness
+        self.derive_locally = derive_locally
+        self.max_concurrent_requests = max_concurrent_requests
+        self.section_states: dict[str, SectionState] = {}
 
-            # Get data for specific station IDs
-            stations_by_id = {}
-            for station_id in self.station_ids:
-                try:
-                    station_data = await self.client.get_petrol_station(station_id)
-                    stations_by_id[station_id] = station_data
-                except IsalEasyHomeyApiError as err:
-                    _LOGGER.warning("Failed to fetch data for station %s: %s", station_id, err)
+    @property
+    def _fetch_derivable(self) -> bool:
+        """Return whether sections that can be derived are fetched.
 
-            data["stations_by_id"] = stations_by_id
+        With debug logging they are fetched anyway to check the derivation.
+        """
+        return not self.derive_locally or self.logger.isEnabledFor(logging.DEBUG)
 
-            return data
+    def _set_derived(
+        self, sections: dict[str, Any], section: str, derived: Any
+    ) -> None:
+        """Use a derived section, checking it against a fetched one.
 
-        except IsalEasyHomeyApiError as err:
+        Args:
+            sections: Value by section to set the derived section in
+            section: The derived section
+            derived: The derived value
+
+        """
+        if section in sections and sections[section] != derived:
+            _LOGGER.warning(
+                "Derived %s of %s differs from the API response: %s != %s",
+                section,
+                self.name,
+                derived,
+                sections[section],
+            )
+        sections[section] = derived
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch every section concurrently.
+
+        Returns:
+            The payload built from the available sections
+
+        Raises:
+            UpdateFailed: If no section has data
+
+        """
+        results, errors = await gather_isolated(
+            self._section_requests(), self.max_concurrent_requests
+        )
+        now = time.monotonic()
+        sections: dict[str, Any] = {}
+
+        for section, value in results.items():
+            state = self.section_states.setdefault(section, SectionState())
+            state.value = value
+            state.last_success = now
+            state.last_error = None
+            sections[section] = value
+
+        for section, err in errors.items():
+            state = self.section_states.setdefault(section, SectionState())
+            state.last_error = str(err)
+            if (
+                state.last_success is None
+                and self.max_staleness
+                and self.data
+                and section in self.data
+            ):
+                # Never fetched since the data was restored at startup
+                state.value = self.data[section]
+                state.last_success = now
+            if (
+                state.last_success is not None
+                and now - state.last_success <= self.max_staleness.total_seconds()
+            ):
+                _LOGGER.warning(
+                    "Failed to fetch %s of %s, keeping data from %.0fs ago: %s",
+                    section,
+                    self.name,
+                    now - state.last_success,
+                    err,
+                )
+                sections[section] = state.value
+            else:
+                _LOGGER.warning("Failed to fetch %s of %s: %s", section, self.name, err)
+
+        if not sections:
+            err = next(iter(errors.values()))
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        return self._build_data(sections)
+
+    @abstractmethod
+    def _section_requests(self) -> dict[str, Awaitable[Any]]:
+        """Return the API call of every section.
+
+        Returns:
+            Mapping of section to the awaitable API call
+
+        """
+
+    def _build_data(self, sections: dict[str, Any]) -> dict[str, Any]:
+        """Build the payload from the available sections.
+
+        Args:
+            sections: Value by section, failed sections without data are missing
+
+        Returns:
+            The coordinator payload
+
+        """
+        return sections
+
+    def has_sections(self, sections: frozenset[str]) -> bool:
+        """Return whether the payload has data for every given section.
+
+        Args:
+            sections: The sections to check
+
+        Returns:
+            True if none of the sections was dropped
+
+        """
+        return self.data is not None and sections <= self.data.keys()
 
 
-class WeatherWarningCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Coordinator for weather warning data."""
+class WeatherWarningCoordinator(PartialDataUpdateCoordinator):
+    """Coordinator for weather warning data of one or more warning cells.
+
+    The primary cell keeps the "warnings" and "upfront" sections, every
+    additional cell gets its own pair of sections. All of them are fetched
+    in the same refresh.
+    """
 
     def __init__(
         self,
@@ -189,15 +991,21 @@ class WeatherWarningCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         warning_cell_id: str,
         update_interval: timedelta,
         config_entry,
+        max_staleness: timedelta = timedelta(minutes=DEFAULT_SECTION_MAX_STALENESS),
+        additional_cell_ids: list[str] | None = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
     ) -> None:
         """Initialize the coordinator.
 
         Args:
             hass: The Home Assistant instance
             client: The API client
-            warning_cell_id: Warning cell ID
+            warning_cell_id: ID of the primary warning cell
             update_interval: Update interval
             config_entry: The config entry
+            max_staleness: How long a failing section keeps its last good value
+            additional_cell_ids: IDs of further warning cells to watch
+            max_concurrent_requests: Maximum number of warning requests at once
 
         """
         super().__init__(
@@ -206,41 +1014,68 @@ class WeatherWarningCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name=f"{DOMAIN}_weather_warning",
             update_interval=update_interval,
             config_entry=config_entry,
+            # Unchanged (e.g. 304 Not Modified) data does not update entities
+            always_update=False,
+            max_staleness=max_staleness,
+            max_concurrent_requests=max_concurrent_requests,
         )
         self.client = client
+        client.limit_cache_ttl(ENDPOINT_WEATHER_WARNINGS, update_interval)
         self.warning_cell_id = warning_cell_id
+        # Primary cell first, duplicates dropped
+        self.warning_cell_ids = list(
+            dict.fromkeys([warning_cell_id, *(additional_cell_ids or [])])
+        )
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from API.
+    def cell_sections(self, cell_id: str) -> tuple[str, str]:
+        """Return the sections holding the data of a warning cell.
+
+        Args:
+            cell_id: The warning cell ID
 
         Returns:
-            Dictionary with weather warning data
+            Tuple of the warnings and the upfront information section
 
-        Raises:
-            UpdateFailed: If update fails
+        """
+        if cell_id == self.warning_cell_id:
+            return ("warnings", "upfront")
+        return (f"warnings_{cell_id}", f"upfront_{cell_id}")
+
+    def _section_requests(self) -> dict[str, Awaitable[Any]]:
+        """Return the API call of every section.
+
+        Returns:
+            Warnings and upfront information requests of every cell
 
         """
-        try:
-            # Get warnings
-            warnings = await self.client.get_weather_warnings(
-                self.warning_cell_id, "WARNING"
+        requests: dict[str, Awaitable[Any]] = {}
+        for cell_id in self.warning_cell_ids:
+            warnings, upfront = self.cell_sections(cell_id)
+            requests[warnings] = self.client.get_weather_warnings(cell_id, "WARNING")
+            requests[upfront] = self.client.get_weather_warnings(
+                cell_id, "UPFRONT_INFORMATION"
             )
+        return requests
 
-            # Get upfront information
-            upfront = await self.client.get_weather_warnings(
-                self.warning_cell_id, "UPFRONT_INFORMATION"
-            )
+    def active_cells(self, data: dict[str, Any], upfront: bool = False) -> list[str]:
+        """Return the warning cells with at least one active warning.
 
-            return {
-                "warnings": warnings,
-                "upfront": upfront,
-            }
+        Args:
+            data: The coordinator payload
+            upfront: Check the upfront information instead of the warnings
 
-        except IsalEasyHomeyApiError as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+        Returns:
+            IDs of the matching cells in the configured order
+
+        """
+        return [
+            cell_id
+            for cell_id in self.warning_cell_ids
+            if data.get(self.cell_sections(cell_id)[upfront], {}).get("count", 0) > 0
+        ]
 
 
-class PollenFlightCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+class PollenFlightCoordinator(PartialDataUpdateCoordinator):
     """Coordinator for pollen flight data."""
 
     def __init__(
@@ -249,6 +1084,8 @@ class PollenFlightCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         client: IsalEasyHomeyApiClient,
         update_interval: timedelta,
         config_entry,
+        max_staleness: timedelta = timedelta(minutes=DEFAULT_SECTION_MAX_STALENESS),
+        derive_locally: bool = DEFAULT_DERIVE_LOCALLY,
     ) -> None:
         """Initialize the coordinator.
 
@@ -257,6 +1094,8 @@ class PollenFlightCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             client: The API client
             update_interval: Update interval
             config_entry: The config entry
+            max_staleness: How long a failing section keeps its last good value
+            derive_locally: Derive the highest pollen flight from all flights
 
         """
         super().__init__(
@@ -265,37 +1104,52 @@ class PollenFlightCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name=f"{DOMAIN}_pollen_flight",
             update_interval=update_interval,
             config_entry=config_entry,
+            # Unchanged (e.g. 304 Not Modified) data does not update entities
+            always_update=False,
+            max_staleness=max_staleness,
+            derive_locally=derive_locally,
         )
         self.client = client
+        client.limit_cache_ttl(ENDPOINT_POLLEN_FLIGHT, update_interval)
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from API.
+    def _section_requests(self) -> dict[str, Awaitable[Any]]:
+        """Return the API call of every section.
 
         Returns:
-            Dictionary with pollen flight data
-
-        Raises:
-            UpdateFailed: If update fails
+            All pollen flights and, unless derived, highest pollen flight requests
 
         """
-        try:
-            # Get all pollen flight data
-            all_pollen = await self.client.get_pollen_flight()
+        requests = {"all_pollen": self.client.get_pollen_flight()}
+        if self._fetch_derivable:
+            requests["highest"] = self.client.get_highest_pollen_flight()
+        return requests
 
-            # Get highest pollen flight
-            highest = await self.client.get_highest_pollen_flight()
+    def _build_data(self, sections: dict[str, Any]) -> dict[str, Any]:
+        """Add the pollen flight index to the payload.
 
-            return {
-                "all_pollen": all_pollen,
-                "highest": highest,
-            }
+        Args:
+            sections: Value by section
 
-        except IsalEasyHomeyApiError as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+        Returns:
+            The sections plus the index of all pollen flights if available
+
+        """
+        if "all_pollen" not in sections:
+            return sections
+        if self.derive_locally:
+            self._set_derived(
+                sections, "highest", derive_highest_pollen_flight(sections["all_pollen"])
+            )
+        return {**sections, **index_pollen_flights(sections["all_pollen"])}
 
 
-class WasteCollectionCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Coordinator for waste collection data."""
+class WasteCollectionCoordinator(PartialDataUpdateCoordinator):
+    """Coordinator for waste collection data.
+
+    In schedule mode the full schedule is fetched once a day and the next
+    and upcoming collections are derived locally. Entities are updated at
+    midnight in both modes, so dates relative to today stay correct.
+    """
 
     def __init__(
         self,
@@ -303,24 +1157,80 @@ class WasteCollectionCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         client: IsalEasyHomeyApiClient,
         update_interval: timedelta,
         config_entry,
+        max_staleness: timedelta = timedelta(minutes=DEFAULT_SECTION_MAX_STALENESS),
+        schedule_mode: bool = DEFAULT_WASTE_SCHEDULE_MODE,
+        derive_locally: bool = DEFAULT_DERIVE_LOCALLY,
     ) -> None:
         """Initialize the coordinator.
 
         Args:
             hass: The Home Assistant instance
             client: The API client
-            update_interval: Update interval
+            update_interval: Update interval, in schedule mode the retry interval
             config_entry: The config entry
+            max_staleness: How long a failing section keeps its last good value
+            schedule_mode: Fetch the full schedule daily and derive collections
+            derive_locally: Derive the next collection from the upcoming ones
 
         """
+        if schedule_mode:
+            # A schedule stays valid for days, derived collections are only
+            # wrong once a collection date passes that it does not contain
+            max_staleness = max(
+                max_staleness, timedelta(days=WASTE_SCHEDULE_MAX_STALENESS)
+            )
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_waste_collection",
-            update_interval=update_interval,
+            update_interval=(
+                timedelta(hours=WASTE_SCHEDULE_REFRESH_INTERVAL)
+                if schedule_mode
+                else update_interval
+            ),
             config_entry=config_entry,
+            max_staleness=max_staleness,
+            derive_locally=derive_locally,
         )
         self.client = client
+        client.limit_cache_ttl(ENDPOINT_WASTE_COLLECTION_ALL, self.update_interval)
+        self.schedule_mode = schedule_mode
+        self.retry_interval = update_interval
+
+    @callback
+    def async_track_midnight(self) -> CALLBACK_TYPE:
+        """Update entities at local midnight.
+
+        Returns:
+            Callback to stop tracking
+
+        """
+        return async_track_time_change(
+            self.hass, self._async_midnight, hour=0, minute=0, second=0
+        )
+
+    @callback
+    def _async_midnight(self, now: datetime) -> None:
+        """Recompute the collections for the new day.
+
+        Args:
+            now: The current time
+
+        """
+        if not self.data:
+            return
+        if self.schedule_mode and "schedule" in self.data:
+            self.data = {
+                "schedule": self.data["schedule"],
+                **derive_waste_collections(self.data["schedule"], now.date()),
+            }
+        # Without rescheduling the next refresh
+        self.async_update_listeners()
+
+    async def async_refresh_schedule(self) -> None:
+        """Fetch the schedule now instead of waiting for the daily refresh."""
+        self.client.invalidate_cache(ENDPOINT_WASTE_COLLECTION_ALL)
+        await self.async_request_refresh()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API.
@@ -333,22 +1243,74 @@ class WasteCollectionCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         """
         try:
-            # Get upcoming waste collections
-            upcoming = await self.client.get_upcoming_waste_collections()
+            data = await super()._async_update_data()
+        except UpdateFailed:
+            self._adapt_update_interval(False)
+            raise
+        self._adapt_update_interval(
+            self.section_states["schedule"].last_error is None
+            if self.schedule_mode
+            else True
+        )
+        return data
 
-            # Get next waste collection
-            next_collection = await self.client.get_next_waste_collection()
+    def _adapt_update_interval(self, fetched: bool) -> None:
+        """Retry a failed schedule fetch at the regular interval.
 
-            return {
-                "upcoming": upcoming,
-                "next": next_collection,
-            }
+        Args:
+            fetched: Whether the schedule was fetched successfully
 
-        except IsalEasyHomeyApiError as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+        """
+        if self.schedule_mode:
+            self.update_interval = (
+                timedelta(hours=WASTE_SCHEDULE_REFRESH_INTERVAL)
+                if fetched
+                else self.retry_interval
+            )
+
+    def _section_requests(self) -> dict[str, Awaitable[Any]]:
+        """Return the API call of every section.
 
+        Returns:
+            The full schedule request in schedule mode, otherwise upcoming
+            and next waste collection requests
+
+        """
+        if self.schedule_mode:
+            return {"schedule": self.client.get_all_waste_collections()}
+        requests = {"upcoming": self.client.get_upcoming_waste_collections()}
+        if self._fetch_derivable:
+            requests["next"] = self.client.get_next_waste_collection()
+        return requests
 
-class ServiceInfoCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    def _build_data(self, sections: dict[str, Any]) -> dict[str, Any]:
+        """Derive the collections from the schedule or the upcoming collections.
+
+        Args:
+            sections: Value by section
+
+        Returns:
+            The sections plus the derived collections if the schedule is available
+
+        """
+        if self.derive_locally and "upcoming" in sections:
+            # The next collection is the earliest upcoming one of any type
+            self._set_derived(
+                sections,
+                "next",
+                derive_waste_collections(sections["upcoming"], dt_util.now().date())[
+                    "next"
+                ],
+            )
+        if "schedule" not in sections:
+            return sections
+        return {
+            **sections,
+            **derive_waste_collections(sections["schedule"], dt_util.now().date()),
+        }
+
+
+class ServiceInfoCoordinator(IsalEasyHomeyDataUpdateCoordinator):
     """Coordinator for service info data."""
 
     def __init__(
@@ -375,6 +1337,7 @@ class ServiceInfoCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             config_entry=config_entry,
         )
         self.client = client
+        client.limit_cache_ttl(ENDPOINT_SERVICE_INFO, update_interval)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API.
@@ -395,7 +1358,106 @@ class ServiceInfoCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
 
-class WaterSoftenerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+def changed_sections(
+    previous: dict[str, Any] | None, current: dict[str, Any]
+) -> set[str]:
+    """Return the top-level sections that differ between two payloads.
+
+    Args:
+        previous: The previous payload
+        current: The current payload
+
+    Returns:
+        Keys that were added, removed or changed
+
+    """
+    if previous is None:
+        return set(current)
+    return {
+        key
+        for key in previous.keys() | current.keys()
+        if previous.get(key) != current.get(key)
+    }
+
+
+class SectionedDataUpdateCoordinator(IsalEasyHomeyDataUpdateCoordinator, ABC):
+    """Coordinator that only notifies entities bound to changed sections.
+
+    Entities register with a frozenset of top-level payload keys as listener
+    context. After a refresh only listeners whose sections changed are
+    called. Listeners without context, the first refresh and any change of
+    the update success always notify every listener.
+    """
+
+    # None means every listener is notified
+    _changed_sections: set[str] | None = None
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data and record which sections changed.
+
+        Returns:
+            The fetched payload
+
+        """
+        self._changed_sections = None
+        previous_success = self.last_update_success
+        data = await self._async_fetch_data()
+        if previous_success:
+            self._changed_sections = changed_sections(self.data, data)
+        return data
+
+    @abstractmethod
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch the payload from the API.
+
+        Returns:
+            The fetched payload
+
+        """
+
+    @callback
+    def async_set_section(self, section: str, value: Any) -> None:
+        """Replace one section of the data and notify its entities.
+
+        Used for optimistic updates after a write call. The data is copied
+        so the next refresh still detects the section as changed if the
+        backend state differs.
+
+        Args:
+            section: The top-level key to replace
+            value: The new value
+
+        """
+        self.async_set_updated_data({**self.data, section: value})
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Set data manually and notify the entities of changed sections.
+
+        Args:
+            data: The new payload
+
+        """
+        self._changed_sections = (
+            changed_sections(self.data, data) if self.last_update_success else None
+        )
+        super().async_set_updated_data(data)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners bound to changed sections."""
+        changed = self._changed_sections
+        self._changed_sections = None
+        if changed is None:
+            super().async_update_listeners()
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not changed.isdisjoint(context):
+                update_callback()
+
+
+class WaterSoftenerCoordinator(SectionedDataUpdateCoordinator):
     """Coordinator for water softener data."""
 
     def __init__(
@@ -412,10 +1474,13 @@ class WaterSoftenerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name=f"{DOMAIN}_water_softener",
             update_interval=update_interval,
             config_entry=config_entry,
+            # Unchanged (e.g. 304 Not Modified) data does not update entities
+            always_update=False,
         )
         self.client = client
+        client.limit_cache_ttl(ENDPOINT_WATER_SOFTENER, update_interval)
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Fetch data from API."""
         try:
             return await self.client.get_water_softener_data()
@@ -423,8 +1488,11 @@ class WaterSoftenerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
 
-class WaterControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Coordinator for water control data."""
+class WaterControlCoordinator(SectionedDataUpdateCoordinator):
+    """Coordinator for water control data.
+
+    Polls fast while water flows and backs off while it is idle.
+    """
 
     def __init__(
         self,
@@ -432,20 +1500,71 @@ class WaterControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         client: IsalEasyHomeyApiClient,
         update_interval: timedelta,
         config_entry,
+        min_interval: timedelta = timedelta(
+            seconds=DEFAULT_WATER_CONTROL_MIN_INTERVAL
+        ),
+        max_interval: timedelta = timedelta(
+            seconds=DEFAULT_WATER_CONTROL_MAX_INTERVAL
+        ),
     ) -> None:
-        """Initialize the coordinator."""
+        """Initialize the coordinator.
+
+        Args:
+            hass: The Home Assistant instance
+            client: The API client
+            update_interval: Update interval right after water stopped flowing
+            config_entry: The config entry
+            min_interval: Update interval while water flows
+            max_interval: Longest update interval while water is idle
+
+        """
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_water_control",
             update_interval=update_interval,
             config_entry=config_entry,
+            # Unchanged (e.g. 304 Not Modified) data does not update entities
+            always_update=False,
         )
         self.client = client
+        self.min_interval = min(min_interval, max_interval)
+        self.max_interval = max_interval
+        client.limit_cache_ttl(ENDPOINT_WATER_CONTROL, self.min_interval)
+        self.idle_interval = min(max(update_interval, self.min_interval), max_interval)
+        self._idle_since: float | None = None
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Fetch data from API."""
         try:
-            return await self.client.get_water_control_data()
+            data = await self.client.get_water_control_data()
         except IsalEasyHomeyApiError as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        self._adapt_update_interval(data)
+        return data
+
+    def _adapt_update_interval(self, data: dict[str, Any]) -> None:
+        """Choose the next update interval from the current flow rate.
+
+        Args:
+            data: The water control data
+
+        """
+        if data.get("currentFlowRate"):
+            self._idle_since = None
+            interval = self.min_interval
+        else:
+            now = time.monotonic()
+            if self._idle_since is None:
+                self._idle_since = now
+            if now - self._idle_since < WATER_CONTROL_IDLE_BACKOFF_DELAY:
+                interval = self.idle_interval
+            else:
+                interval = min(
+                    max(self.update_interval, self.idle_interval) * 2,
+                    self.max_interval,
+                )
+
+        if interval != self.update_interval:
+            _LOGGER.debug("Polling water control every %s", interval)
+            self.update_interval = interval
@@ -0,0 +1,68 @@
+"""Diagnostics support for isal Easy Homey."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_KEY, DOMAIN
+from .coordinator import PartialDataUpdateCoordinator
+
+TO_REDACT = {CONF_API_KEY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Args:
+        hass: The Home Assistant instance
+        entry: The config entry
+
+    Returns:
+        Dictionary with the entry, API client and coordinator state
+
+    """
+    data = hass.data[DOMAIN][entry.entry_id]
+    client = data["client"]
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "client": {
+            "statistics": client.statistics.as_dict(),
+            "circuit_breakers": client.circuit_breaker_states(),
+            "rate_limits": client.rate_limiter_states(),
+        },
+        "coordinators": {
+            name: {
+                "last_update_success": coordinator.last_update_success,
+                "update_interval": (
+                    coordinator.update_interval.total_seconds()
+                    if coordinator.update_interval
+                    else None
+                ),
+                "last_exception": (
+                    str(coordinator.last_exception)
+                    if coordinator.last_exception
+                    else None
+                ),
+                **(
+                    {
+                        "sections": {
+                            section: state.as_dict()
+                            for section, state in coordinator.section_states.items()
+                        }
+                    }
+                    if isinstance(coordinator, PartialDataUpdateCoordinator)
+                    else {}
+                ),
+            }
+            for name, coordinator in data["coordinators"].items()
+        },
+    }
@@ -0,0 +1,357 @@
+"""Geographic helpers for isal Easy Homey."""
+from __future__ import annotations
+
+from collections import OrderedDict
+import math
+import time
+from typing import Any
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def distance_km(origin: tuple[float, float], target: tuple[float, float]) -> float:
+    """Return the great-circle distance between two coordinates.
+
+    Args:
+        origin: Tuple of (latitude, longitude)
+        target: Tuple of (latitude, longitude)
+
+    Returns:
+        The haversine distance in km
+
+    """
+    lat1, lon1 = map(math.radians, origin)
+    lat2, lon2 = map(math.radians, target)
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def get_station_coordinates(station: dict[str, Any]) -> tuple[float, float] | None:
+    """Return the coordinates of a station.
+
+    Args:
+        station: Station data from the API
+
+    Returns:
+        Tuple of (latitude, longitude) or None if the station has no location
+
+    """
+    location = station.get("location") or {}
+    latitude = location.get("latitude")
+    longitude = location.get("longitude")
+    if latitude is None or longitude is None:
+        return None
+    return (float(latitude), float(longitude))
+
+
+def with_distance(
+    station: dict[str, Any], coordinates: tuple[float, float]
+) -> dict[str, Any]:
+    """Return a copy of a station with the distance to some coordinates.
+
+    Args:
+        station: Station data from the API
+        coordinates: Tuple of (latitude, longitude) to measure from
+
+    Returns:
+        Shallow copy of the station with location.distance set in km, or the
+        station itself if it has no location
+
+    """
+    if (station_coordinates := get_station_coordinates(station)) is None:
+        return station
+    return {
+        **station,
+        "location": {
+            **station["location"],
+            "distance": round(distance_km(coordinates, station_coordinates), 2),
+        },
+    }
+
+
+def grid_cell(
+    coordinates: tuple[float, float], cell_size: float
+) -> tuple[float, float]:
+    """Return the center of the grid cell some coordinates fall in.
+
+    Args:
+        coordinates: Tuple of (latitude, longitude)
+        cell_size: Edge length of a grid cell in degrees
+
+    Returns:
+        Tuple of (latitude, longitude) of the cell center
+
+    """
+    return tuple(  # type: ignore[return-value]
+        round((math.floor(value / cell_size) + 0.5) * cell_size, 6)
+        for value in coordinates
+    )
+
+
+def stations_within(
+    stations: list[dict[str, Any]],
+    coordinates: tuple[float, float],
+    radius: float,
+) -> list[dict[str, Any]]:
+    """Return the stations within a radius, nearest first.
+
+    Args:
+        stations: Stations from a search around other coordinates
+        coordinates: Tuple of (latitude, longitude) to search around
+        radius: The search radius in km
+
+    Returns:
+        Copies of the stations within the radius with location.distance
+        measured from the coordinates, sorted by distance. Stations without
+        a location are dropped.
+
+    """
+    found = [
+        with_distance(station, coordinates)
+        for station in stations
+        if (station_coordinates := get_station_coordinates(station)) is not None
+        and distance_km(coordinates, station_coordinates) <= radius
+    ]
+    found.sort(key=lambda station: station["location"]["distance"])
+    return found
+
+
+class StationIndex:
+    """Stations bucketed by grid cell for in-memory nearest station queries.
+
+    The index also remembers the areas that were searched, so a query can
+    tell whether its answer is complete or a closer station may be missing.
+    Stations not seen again within the maximum age are dropped, so stations
+    the backend no longer lists do not linger. A searched area stays covered
+    while its stations are confirmed within the coverage age, but no longer
+    than the maximum age after it was searched.
+    """
+
+    def __init__(
+        self,
+        cell_size: float,
+        max_stations: int,
+        max_areas: int,
+        max_age: float = math.inf,
+        coverage_max_age: float = math.inf,
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            cell_size: Edge length of a grid cell in degrees
+            max_stations: Maximum number of stations, least recently seen go first
+            max_areas: Maximum number of searched areas to remember
+            max_age: Seconds a station is kept after it was last seen and a
+                searched area after it was searched
+            coverage_max_age: Seconds a searched area is kept after its
+                stations were last confirmed
+
+        """
+        self._cell_size = cell_size
+        self._max_stations = max_stations
+        self._max_areas = max_areas
+        self._max_age = max_age
+        self._coverage_max_age = coverage_max_age
+        # stationId -> (cell, coordinates, station, seen_at), oldest first
+        self._stations: OrderedDict[
+            str, tuple[tuple[int, int], tuple[float, float], dict[str, Any], float]
+        ] = OrderedDict()
+        self._buckets: dict[tuple[int, int], set[str]] = {}
+        # Center of a searched area -> (searched radius in km, searched_at,
+        # confirmed_at), least recently confirmed first
+        self._areas: OrderedDict[
+            tuple[float, float], tuple[float, float, float]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of indexed stations."""
+        self._expire()
+        return len(self._stations)
+
+    def _expire(self) -> None:
+        """Drop the stations and areas older than their maximum age."""
+        now = time.monotonic()
+        oldest = now - self._max_age
+        while self._stations and next(iter(self._stations.values()))[3] < oldest:
+            station_id, (cell, _, _, _) = self._stations.popitem(last=False)
+            self._discard(station_id, cell)
+        oldest_confirmed = now - self._coverage_max_age
+        for center, (_, searched_at, confirmed_at) in list(self._areas.items()):
+            if searched_at < oldest or confirmed_at < oldest_confirmed:
+                del self._areas[center]
+
+    def _cell(self, coordinates: tuple[float, float]) -> tuple[int, int]:
+        """Return the grid cell some coordinates fall in."""
+        return (
+            math.floor(coordinates[0] / self._cell_size),
+            math.floor(coordinates[1] / self._cell_size),
+        )
+
+    def add(self, station: dict[str, Any]) -> None:
+        """Add a station or replace an older version of it.
+
+        Args:
+            station: Station data from the API, ignored without ID or location
+
+        """
+        station_id = station.get("stationId")
+        coordinates = get_station_coordinates(station)
+        if not station_id or coordinates is None:
+            return
+        if (previous := self._stations.pop(station_id, None)) is not None:
+            self._discard(station_id, previous[0])
+        cell = self._cell(coordinates)
+        self._stations[station_id] = (cell, coordinates, station, time.monotonic())
+        self._buckets.setdefault(cell, set()).add(station_id)
+        while len(self._stations) > self._max_stations:
+            evicted_id, (evicted_cell, _, _, _) = self._stations.popitem(last=False)
+            self._discard(evicted_id, evicted_cell)
+
+    def remove(self, station_id: str) -> None:
+        """Remove a station the backend no longer lists.
+
+        Args:
+            station_id: The ID of the station
+
+        """
+        if (previous := self._stations.pop(station_id, None)) is not None:
+            self._discard(station_id, previous[0])
+
+    def _discard(self, station_id: str, cell: tuple[int, int]) -> None:
+        """Remove a station from its bucket."""
+        bucket = self._buckets[cell]
+        bucket.discard(station_id)
+        if not bucket:
+            del self._buckets[cell]
+
+    def add_search(
+        self,
+        center: tuple[float, float],
+        radius: float,
+        stations: list[dict[str, Any]],
+    ) -> None:
+        """Add the result of a search and remember the searched area.
+
+        Args:
+            center: Tuple of (latitude, longitude) that was searched around
+            radius: The radius that was searched in km
+            stations: The stations found
+
+        """
+        for station in stations:
+            self.add(station)
+        # Stations beyond the new radius were not seen again
+        self._areas.pop(center, None)
+        now = time.monotonic()
+        self._areas[center] = (radius, now, now)
+        while len(self._areas) > self._max_areas:
+            self._areas.popitem(last=False)
+
+    def confirm(self, coordinates: tuple[float, float], radius: float) -> None:
+        """Keep the areas covering a circle whose stations were confirmed.
+
+        Args:
+            coordinates: Tuple of (latitude, longitude) of the circle center
+            radius: Radius of the circle in km
+
+        """
+        self._expire()
+        now = time.monotonic()
+        for center, (area_radius, searched_at, _) in list(self._areas.items()):
+            if distance_km(center, coordinates) + radius <= area_radius:
+                del self._areas[center]
+                self._areas[center] = (area_radius, searched_at, now)
+
+    def covers(self, coordinates: tuple[float, float], radius: float) -> bool:
+        """Return whether a circle lies within a searched area.
+
+        Args:
+            coordinates: Tuple of (latitude, longitude) of the circle center
+            radius: Radius of the circle in km
+
+        Returns:
+            True if every station within the circle has been indexed
+
+        """
+        self._expire()
+        return any(
+            distance_km(center, coordinates) + radius <= area_radius
+            for center, (area_radius, _, _) in self._areas.items()
+        )
+
+    def nearest(
+        self,
+        coordinates: tuple[float, float],
+        count: int = 1,
+        max_distance: float = math.inf,
+    ) -> list[dict[str, Any]]:
+        """Return the indexed stations nearest to some coordinates.
+
+        Rings of grid cells around the coordinates are scanned outwards
+        until no cell of the next ring can hold a closer station.
+
+        Args:
+            coordinates: Tuple of (latitude, longitude) to measure from
+            count: Maximum number of stations to return
+            max_distance: Maximum distance of a station in km
+
+        Returns:
+            Copies of the nearest stations with location.distance measured
+            from the coordinates, nearest first
+
+        """
+        self._expire()
+        if not self._buckets or count <= 0:
+            return []
+        center_lat, center_lon = self._cell(coordinates)
+        # Lower bound of the cell size in km, cells narrow towards the poles
+        latitudes = [cell[0] for cell in self._buckets]
+        poleward = max(abs(min(latitudes)), abs(max(latitudes)) + 1) * self._cell_size
+        cell_km = (
+            self._cell_size * KM_PER_DEGREE * math.cos(math.radians(min(poleward, 89.9)))
+        )
+        max_ring = max(
+            max(abs(cell[0] - center_lat), abs(cell[1] - center_lon))
+            for cell in self._buckets
+        )
+
+        found: list[tuple[float, str]] = []
+        for ring in range(max_ring + 1):
+            # Stations in this ring are at least (ring - 1) cells away
+            bound = (ring - 1) * cell_km
+            if bound > max_distance or (
+                len(found) >= count and bound > found[count - 1][0]
+            ):
+                break
+            for cell in _ring_cells(center_lat, center_lon, ring):
+                for station_id in self._buckets.get(cell, ()):
+                    distance = distance_km(coordinates, self._stations[station_id][1])
+                    if distance <= max_distance:
+                        found.append((distance, station_id))
+            found.sort()
+
+        return [
+            with_distance(self._stations[station_id][2], coordinates)
+            for _, station_id in found[:count]
+        ]
+
+
+def _ring_cells(lat: int, lon: int, ring: int) -> list[tuple[int, int]]:
+    """Return the grid cells at a ring distance around a cell."""
+    if ring == 0:
+        return [(lat, lon)]
+    cells = [
+        (lat + offset, lon + side)
+        for offset in range(-ring, ring + 1)
+        for side in (-ring, ring)
+    ]
+    cells.extend(
+        (lat + side, lon + offset)
+        for offset in range(-ring + 1, ring)
+        for side in (-ring, ring)
+    )
+    return cells
@@ -0,0 +1,135 @@
+"""Refresh scheduling shared by every config entry on one backend."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api import RateLimiter
+from .const import (
+    BACKEND_MAX_IN_FLIGHT_REQUESTS,
+    DATA_REFRESH_SCHEDULERS,
+    RATE_LIMITS,
+    REFRESH_JITTER_MAX,
+    REFRESH_JITTER_RATIO,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import IsalEasyHomeyDataUpdateCoordinator
+
+
+class RefreshScheduler:
+    """Spreads the refreshes of all coordinators on one backend.
+
+    Every coordinator refreshes at a fixed phase of its update interval,
+    derived from its config entry and coordinator key, plus a small random
+    jitter. Coordinators with the same interval therefore do not refresh at
+    the same time, across restarts and across Home Assistant instances.
+    The scheduler also limits the requests in flight to and the request
+    rate of the backend.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = BACKEND_MAX_IN_FLIGHT_REQUESTS,
+        rate_limits: dict[str, tuple[float, int]] | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_in_flight: Maximum number of requests in flight to the backend
+            rate_limits: (rate per second, burst) by endpoint prefix, defaults
+                to RATE_LIMITS
+
+        """
+        self.request_semaphore = asyncio.Semaphore(max_in_flight)
+        self.rate_limiter = RateLimiter(
+            RATE_LIMITS if rate_limits is None else rate_limits
+        )
+
+    @staticmethod
+    def phase(entry_id: str, key: str) -> float:
+        """Return the phase of a coordinator.
+
+        Args:
+            entry_id: The ID of the config entry
+            key: The coordinator key
+
+        Returns:
+            Share of the update interval in [0, 1) to refresh at
+
+        """
+        digest = hashlib.sha256(f"{entry_id}:{key}".encode()).digest()
+        return int.from_bytes(digest[:8], "big") / 2**64
+
+    @staticmethod
+    def next_delay(phase: float, interval: float) -> float:
+        """Return the delay until the next refresh at a phase.
+
+        A slot closer than half an interval is skipped, so a refresh
+        requested in between does not cause two refreshes in a row.
+
+        Args:
+            phase: Share of the update interval to refresh at
+            interval: The update interval in seconds
+
+        Returns:
+            Delay in seconds, between half and one and a half intervals plus
+            the jitter
+
+        """
+        delay = (phase * interval - time.time()) % interval
+        if delay < interval / 2:
+            delay += interval
+        return delay + random.uniform(
+            0, min(REFRESH_JITTER_MAX, interval * REFRESH_JITTER_RATIO)
+        )
+
+    @callback
+    def async_add(
+        self,
+        coordinator: IsalEasyHomeyDataUpdateCoordinator,
+        entry_id: str,
+        key: str,
+    ) -> None:
+        """Schedule the refreshes of a coordinator.
+
+        Args:
+            coordinator: The coordinator
+            entry_id: The ID of the config entry
+            key: The coordinator key
+
+        """
+        coordinator.refresh_scheduler = self
+        coordinator.refresh_phase = self.phase(entry_id, key)
+
+
+@callback
+def async_get_refresh_scheduler(
+    hass: HomeAssistant,
+    base_url: str,
+    rate_limits: dict[str, tuple[float, int]] | None = None,
+) -> RefreshScheduler:
+    """Return the refresh scheduler of a backend, creating it if needed.
+
+    Args:
+        hass: The Home Assistant instance
+        base_url: The base URL of the backend
+        rate_limits: Request rate limits of a newly created scheduler,
+            defaults to RATE_LIMITS
+
+    Returns:
+        The refresh scheduler
+
+    """
+    schedulers: dict[str, RefreshScheduler] = hass.data.setdefault(
+        DATA_REFRESH_SCHEDULERS, {}
+    )
+    base_url = base_url.rstrip("/")
+    if (scheduler := schedulers.get(base_url)) is None:
+        scheduler = schedulers[base_url] = RefreshScheduler(rate_limits=rate_limits)
+    return scheduler
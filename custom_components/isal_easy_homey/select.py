@@ -64,7 +64,7 @@ class IsalEasyHomeyWaterSceneSelect(
         entry: ConfigEntry,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset({"waterScene", "waterSceneIcon"}))
         self._attr_unique_id = f"{entry.entry_id}_water_softener_water_scene"
         self._attr_device_info = get_device_info(entry.entry_id, COORDINATOR_WATER_SOFTENER)
 
@@ -94,7 +94,6 @@ class IsalEasyHomeyWaterSceneSelect(
             return
 
         # Optimistic update
-        self.coordinator.data["waterScene"] = option
-        self.async_write_ha_state()
+        self.coordinator.async_set_section("waterScene", option)
         await self.coordinator.async_request_refresh()
 
@@ -32,6 +32,7 @@ from .const import (
     get_device_info,
 )
 from .coordinator import (
+    PartialDataUpdateCoordinator,
     PetrolStationCoordinator,
     PollenFlightCoordinator,
     WasteCollectionCoordinator,
@@ -50,45 +51,8 @@ class IsalEasyHomeySensorEntityDescription(SensorEntityDescription):
     attributes_fn: Callable[[dict[str, Any]], dict[str, Any]] | None = None
     icon_fn: Callable[[dict[str, Any]], str] | None = None
     available_fn: Callable[[dict[str, Any]], bool] | None = None
-
-
-def get_price_from_prices(prices: list[dict[str, Any]], petrol_type: str) -> float | None:
-    """Extract price for a specific petrol type.
-
-    Args:
-        prices: List of price dictionaries
-        petrol_type: The petrol type to find
-
-    Returns:
-        The price or None
-
-    """
-    for price in prices:
-        if price.get("petrolType") == petrol_type:
-            return price.get("price")
-    return None
-
-
-def format_address(address: dict[str, Any]) -> str:
-    """Format address as string.
-
-    Args:
-        address: Address dictionary
-
-    Returns:
-        Formatted address string
-
-    """
-    parts = []
-    if street := address.get("street"):
-        parts.append(street)
-    if house_number := address.get("houseNumber"):
-        parts[-1] = f"{parts[-1]} {house_number}"
-    if postal_code := address.get("postalCode"):
-        parts.append(postal_code)
-    if city := address.get("city"):
-        parts.append(city)
-    return ", ".join(parts)
+    # Top-level payload keys the entity depends on, None for all
+    sections: frozenset[str] | None = None
 
 
 # Petrol Station Sensors
@@ -99,30 +63,23 @@ PETROL_STATION_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
         icon="mdi:gas-station-outline",
         native_unit_of_measurement="km",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("nearest_station", {})
-        .get("location", {})
-        .get("distance"),
+        value_fn=lambda data: (
+            data.get("nearest_station", {}).get("location") or {}
+        ).get("distance"),
         attributes_fn=lambda data: {
             "station_id": data.get("nearest_station", {}).get("stationId"),
             "name": data.get("nearest_station", {}).get("name"),
             "brand": data.get("nearest_station", {}).get("brand"),
-            "address": format_address(data.get("nearest_station", {}).get("address", {})),
+            "address": data.get("nearest_station", {})
+            .get("normalized", {})
+            .get("address"),
             "location": data.get("nearest_station", {}).get("location"),
             "status": data.get("nearest_station", {}).get("status"),
-            "e5_price": get_price_from_prices(
-                data.get("nearest_station", {}).get("prices", []), "E5"
-            ),
-            "e5_price_eur": f"{get_price_from_prices(data.get('nearest_station', {}).get('prices', []), 'E5'):.3f} €" if get_price_from_prices(data.get("nearest_station", {}).get("prices", []), "E5") is not None else "-",
-            "e10_price": get_price_from_prices(
-                data.get("nearest_station", {}).get("prices", []), "E10"
-            ),
-            "e10_price_eur": f"{get_price_from_prices(data.get('nearest_station', {}).get('prices', []), 'E10'):.3f} €" if get_price_from_prices(data.get("nearest_station", {}).get("prices", []), "E10") is not None else "-",
-            "diesel_price": get_price_from_prices(
-                data.get("nearest_station", {}).get("prices", []), "DIESEL"
-            ),
-            "diesel_price_eur": f"{get_price_from_prices(data.get('nearest_station', {}).get('prices', []), 'DIESEL'):.3f} €" if get_price_from_prices(data.get("nearest_station", {}).get("prices", []), "DIESEL") is not None else "-",
+            **data.get("nearest_station", {})
+            .get("normalized", {})
+            .get("price_attributes", {}),
             "distance": data.get("nearest_station", {})
-            .get("location", {})
+            .get("normalized", {})
             .get("distance"),
         },
         available_fn=lambda data: "nearest_station" in data and data["nearest_station"],
@@ -135,6 +92,7 @@ WEATHER_WARNING_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="current_weather_warning",
         translation_key="current_weather_warning",
+        sections=frozenset({"warnings"}),
         value_fn=lambda data: (
             max(
                 data.get("warnings", {}).get("warnings", []),
@@ -274,6 +232,7 @@ WEATHER_WARNING_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="current_upfront_warning",
         translation_key="current_upfront_warning",
+        sections=frozenset({"upfront"}),
         value_fn=lambda data: (
             max(
                 data.get("upfront", {}).get("warnings", []),
@@ -413,6 +372,7 @@ WEATHER_WARNING_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="all_weather_warnings_json",
         translation_key="all_weather_warnings_json",
+        sections=frozenset({"warnings"}),
         icon="mdi:code-json",
         value_fn=lambda data: data.get("warnings", {}).get("count", 0),
         attributes_fn=lambda data: {
@@ -423,6 +383,7 @@ WEATHER_WARNING_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="all_upfront_warnings_json",
         translation_key="all_upfront_warnings_json",
+        sections=frozenset({"upfront"}),
         icon="mdi:code-json",
         value_fn=lambda data: data.get("upfront", {}).get("count", 0),
         attributes_fn=lambda data: {
@@ -478,6 +439,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_device_status",
         translation_key="water_softener_device_status",
+        sections=frozenset({"deviceStatus", "deviceStatusIcon"}),
         device_class=SensorDeviceClass.ENUM,
         options=["ONLINE", "OFFLINE", "UNKNOWN"],
         icon_fn=lambda data: data.get("deviceStatusIcon", {}).get("mdiIcon", "mdi:information"),
@@ -486,30 +448,35 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_software_version",
         translation_key="water_softener_software_version",
+        sections=frozenset({"softwareVersion"}),
         icon="mdi:tag",
         value_fn=lambda data: data.get("softwareVersion"),
     ),
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_hardware_version",
         translation_key="water_softener_hardware_version",
+        sections=frozenset({"hardwareVersion"}),
         icon="mdi:tag",
         value_fn=lambda data: data.get("hardwareVersion"),
     ),
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_gateway_firmware",
         translation_key="water_softener_gateway_firmware",
+        sections=frozenset({"gatewayFirmwareVersion"}),
         icon="mdi:tag",
         value_fn=lambda data: data.get("gatewayFirmwareVersion"),
     ),
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_gateway_hardware",
         translation_key="water_softener_gateway_hardware",
+        sections=frozenset({"gatewayHardwareVersion"}),
         icon="mdi:tag",
         value_fn=lambda data: data.get("gatewayHardwareVersion"),
     ),
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_operating_time",
         translation_key="water_softener_operating_time",
+        sections=frozenset({"operatingTimeSeconds"}),
         icon="mdi:clock-outline",
         native_unit_of_measurement="h",
         state_class=SensorStateClass.MEASUREMENT,
@@ -518,6 +485,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_uptime",
         translation_key="water_softener_uptime",
+        sections=frozenset({"uptimeSeconds"}),
         icon="mdi:timer-outline",
         native_unit_of_measurement="h",
         state_class=SensorStateClass.MEASUREMENT,
@@ -526,6 +494,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_raw_hardness",
         translation_key="water_softener_raw_hardness",
+        sections=frozenset({"waterHardness"}),
         icon="mdi:water",
         native_unit_of_measurement="°dH",
         state_class=SensorStateClass.MEASUREMENT,
@@ -534,6 +503,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_desired_hardness",
         translation_key="water_softener_desired_hardness",
+        sections=frozenset({"waterHardness"}),
         icon="mdi:water",
         native_unit_of_measurement="°dH",
         state_class=SensorStateClass.MEASUREMENT,
@@ -542,6 +512,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_battery_capacity",
         translation_key="water_softener_battery_capacity",
+        sections=frozenset({"batteryCapacity"}),
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement="%",
         state_class=SensorStateClass.MEASUREMENT,
@@ -551,6 +522,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_battery_remaining",
         translation_key="water_softener_battery_remaining",
+        sections=frozenset({"batteryCapacity"}),
         icon="mdi:battery-clock-outline",
         native_unit_of_measurement="min",
         state_class=SensorStateClass.MEASUREMENT,
@@ -559,6 +531,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_salt_level_percent",
         translation_key="water_softener_salt_level_percent",
+        sections=frozenset({"saltLevel"}),
         native_unit_of_measurement="%",
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda data: data.get("saltLevel", {}).get("saltLevelPercent"),
@@ -567,6 +540,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_salt_level_kg",
         translation_key="water_softener_salt_level_kg",
+        sections=frozenset({"saltLevel"}),
         icon="mdi:shaker-outline",
         native_unit_of_measurement="kg",
         state_class=SensorStateClass.MEASUREMENT,
@@ -575,6 +549,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_salt_range",
         translation_key="water_softener_salt_range",
+        sections=frozenset({"saltLevel"}),
         icon="mdi:chevron-triple-right",
         native_unit_of_measurement="d",
         state_class=SensorStateClass.MEASUREMENT,
@@ -583,6 +558,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_maintenance_days",
         translation_key="water_softener_maintenance_days",
+        sections=frozenset({"maintenance"}),
         icon="mdi:wrench-clock",
         native_unit_of_measurement="d",
         state_class=SensorStateClass.MEASUREMENT,
@@ -591,6 +567,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_maintenance_registered",
         translation_key="water_softener_maintenance_registered",
+        sections=frozenset({"maintenance"}),
         icon="mdi:account-wrench",
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda data: data.get("maintenance", {}).get("registeredMaintenances"),
@@ -598,6 +575,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_maintenance_requested",
         translation_key="water_softener_maintenance_requested",
+        sections=frozenset({"maintenance"}),
         icon="mdi:cog-counterclockwise",
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda data: data.get("maintenance", {}).get("requestedMaintenances"),
@@ -605,6 +583,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_regeneration_count",
         translation_key="water_softener_regeneration_count",
+        sections=frozenset({"regeneration"}),
         icon="mdi:counter",
         state_class=SensorStateClass.TOTAL,
         value_fn=lambda data: data.get("regeneration", {}).get("totalRegenerationCount"),
@@ -612,6 +591,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_shutoff_valve",
         translation_key="water_softener_shutoff_valve",
+        sections=frozenset({"leakageProtection"}),
         device_class=SensorDeviceClass.ENUM,
         options=["OPEN", "CLOSED"],
         icon_fn=lambda data: data.get("leakageProtection", {}).get("shutoffValveIcon", {}).get("mdiIcon", "mdi:valve"),
@@ -620,6 +600,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_max_flow_rate",
         translation_key="water_softener_max_flow_rate",
+        sections=frozenset({"leakageProtection"}),
         icon="mdi:waves-arrow-up",
         native_unit_of_measurement="L/h",
         state_class=SensorStateClass.MEASUREMENT,
@@ -628,6 +609,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_max_extraction_volume",
         translation_key="water_softener_max_extraction_volume",
+        sections=frozenset({"leakageProtection"}),
         icon="mdi:cup-water",
         native_unit_of_measurement="L",
         state_class=SensorStateClass.MEASUREMENT,
@@ -636,6 +618,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_max_extraction_time",
         translation_key="water_softener_max_extraction_time",
+        sections=frozenset({"leakageProtection"}),
         icon="mdi:clock-end",
         native_unit_of_measurement="h",
         state_class=SensorStateClass.MEASUREMENT,
@@ -644,6 +627,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_micro_leakage_check",
         translation_key="water_softener_micro_leakage_check",
+        sections=frozenset({"leakageProtection"}),
         device_class=SensorDeviceClass.ENUM,
         options=["IDLE", "RUNNING"],
         icon="mdi:pipe-leak",
@@ -652,6 +636,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_micro_leakage_status",
         translation_key="water_softener_micro_leakage_status",
+        sections=frozenset({"leakageProtection"}),
         device_class=SensorDeviceClass.ENUM,
         options=["NO_LEAKAGE", "LEAKAGE_DETECTED"],
         icon="mdi:pipe-leak",
@@ -660,6 +645,7 @@ WATER_SOFTENER_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_softener_last_updated",
         translation_key="water_softener_last_updated",
+        sections=frozenset({"lastUpdatedOn"}),
         icon="mdi:update",
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda data: datetime.fromisoformat(data["lastUpdatedOn"]) if data.get("lastUpdatedOn") else None,
@@ -672,6 +658,7 @@ WATER_CONTROL_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_control_flow_rate",
         translation_key="water_control_flow_rate",
+        sections=frozenset({"currentFlowRate"}),
         icon="mdi:waves-arrow-right",
         native_unit_of_measurement="L/h",
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
@@ -681,6 +668,7 @@ WATER_CONTROL_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_control_total_consumption",
         translation_key="water_control_total_consumption",
+        sections=frozenset({"totalWaterConsumption"}),
         icon="mdi:water",
         native_unit_of_measurement="m³",
         device_class=SensorDeviceClass.WATER,
@@ -690,6 +678,7 @@ WATER_CONTROL_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_control_treated_consumption",
         translation_key="water_control_treated_consumption",
+        sections=frozenset({"treatedWaterConsumption"}),
         icon="mdi:water-check",
         native_unit_of_measurement="m³",
         device_class=SensorDeviceClass.WATER,
@@ -699,6 +688,7 @@ WATER_CONTROL_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_control_untreated_consumption",
         translation_key="water_control_untreated_consumption",
+        sections=frozenset({"untreatedWaterConsumption"}),
         icon="mdi:water-alert",
         native_unit_of_measurement="m³",
         device_class=SensorDeviceClass.WATER,
@@ -708,6 +698,7 @@ WATER_CONTROL_SENSORS: tuple[IsalEasyHomeySensorEntityDescription, ...] = (
     IsalEasyHomeySensorEntityDescription(
         key="water_control_last_updated",
         translation_key="water_control_last_updated",
+        sections=frozenset({"lastUpdatedOn"}),
         icon="mdi:update",
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda data: datetime.fromisoformat(data["lastUpdatedOn"]) if data.get("lastUpdatedOn") else None,
@@ -906,7 +897,7 @@ class IsalEasyHomeySensor(
             coordinator_key: The coordinator key for device assignment
 
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.sections)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = get_device_info(entry.entry_id, coordinator_key)
@@ -955,12 +946,19 @@ class IsalEasyHomeySensor(
             True if available
 
         """
+        if not super().available:
+            return False
+        sections = self.entity_description.sections
+        if (
+            sections
+            and isinstance(self.coordinator, PartialDataUpdateCoordinator)
+            and not self.coordinator.has_sections(sections)
+        ):
+            # A section failed for longer than the maximum staleness
+            return False
         if self.entity_description.available_fn:
-            return (
-                super().available
-                and self.entity_description.available_fn(self.coordinator.data)
-            )
-        return super().available
+            return self.entity_description.available_fn(self.coordinator.data)
+        return True
 
 
 class IsalEasyHomeyHighestPollenSensor(
@@ -1085,11 +1083,7 @@ class IsalEasyHomeyPollenSensor(
             Pollen data dictionary or None
 
         """
-        flights = self.coordinator.data.get("all_pollen", {}).get("flights", [])
-        for flight in flights:
-            if flight.get("pollenType") == self._pollen_type:
-                return flight
-        return None
+        return self.coordinator.data.get("flights_by_type", {}).get(self._pollen_type)
 
     @property
     def native_value(self) -> str | None:
@@ -1408,8 +1402,8 @@ class IsalEasyHomeyCheapestStationSensor(
         """
         station_data = self._get_station_data()
         if station_data:
-            return get_price_from_prices(
-                station_data.get("prices", []), self._fuel_type
+            return station_data.get("normalized", {}).get("prices", {}).get(
+                self._fuel_type
             )
         return None
 
@@ -1425,27 +1419,17 @@ class IsalEasyHomeyCheapestStationSensor(
         if not station_data:
             return {}
 
+        normalized = station_data.get("normalized", {})
         return {
             "fuel_type": self._fuel_type,
             "station_id": station_data.get("stationId"),
             "name": station_data.get("name"),
             "brand": station_data.get("brand"),
-            "address": format_address(station_data.get("address", {})),
+            "address": normalized.get("address"),
             "location": station_data.get("location"),
             "status": station_data.get("status"),
-            "e5_price": get_price_from_prices(
-                station_data.get("prices", []), "E5"
-            ),
-            "e5_price_eur": f"{get_price_from_prices(station_data.get('prices', []), 'E5'):.3f} €" if get_price_from_prices(station_data.get("prices", []), "E5") is not None else "-",
-            "e10_price": get_price_from_prices(
-                station_data.get("prices", []), "E10"
-            ),
-            "e10_price_eur": f"{get_price_from_prices(station_data.get('prices', []), 'E10'):.3f} €" if get_price_from_prices(station_data.get("prices", []), "E10") is not None else "-",
-            "diesel_price": get_price_from_prices(
-                station_data.get("prices", []), "DIESEL"
-            ),
-            "diesel_price_eur": f"{get_price_from_prices(station_data.get('prices', []), 'DIESEL'):.3f} €" if get_price_from_prices(station_data.get("prices", []), "DIESEL") is not None else "-",
-            "distance": station_data.get("location", {}).get("distance"),
+            **normalized.get("price_attributes", {}),
+            "distance": normalized.get("distance"),
         }
 
     @property
@@ -1511,7 +1495,7 @@ class IsalEasyHomeyUserNearestStationSensor(
         """
         station_data = self._get_station_data()
         if station_data:
-            return station_data.get("location", {}).get("distance")
+            return (station_data.get("location") or {}).get("distance")
         return None
 
     @property
@@ -1526,27 +1510,17 @@ class IsalEasyHomeyUserNearestStationSensor(
         if not station_data:
             return {"user_name": self._user_name}
 
+        normalized = station_data.get("normalized", {})
         return {
             "user_name": self._user_name,
             "station_id": station_data.get("stationId"),
             "name": station_data.get("name"),
             "brand": station_data.get("brand"),
-            "address": format_address(station_data.get("address", {})),
+            "address": normalized.get("address"),
             "location": station_data.get("location"),
             "status": station_data.get("status"),
-            "e5_price": get_price_from_prices(
-                station_data.get("prices", []), "E5"
-            ),
-            "e5_price_eur": f"{get_price_from_prices(station_data.get('prices', []), 'E5'):.3f} €" if get_price_from_prices(station_data.get("prices", []), "E5") is not None else "-",
-            "e10_price": get_price_from_prices(
-                station_data.get("prices", []), "E10"
-            ),
-            "e10_price_eur": f"{get_price_from_prices(station_data.get('prices', []), 'E10'):.3f} €" if get_price_from_prices(station_data.get("prices", []), "E10") is not None else "-",
-            "diesel_price": get_price_from_prices(
-                station_data.get("prices", []), "DIESEL"
-            ),
-            "diesel_price_eur": f"{get_price_from_prices(station_data.get('prices', []), 'DIESEL'):.3f} €" if get_price_from_prices(station_data.get("prices", []), "DIESEL") is not None else "-",
-            "distance": station_data.get("location", {}).get("distance"),
+            **normalized.get("price_attributes", {}),
+            "distance": normalized.get("distance"),
         }
 
     @property
@@ -1637,26 +1611,16 @@ class IsalEasyHomeyStationIdSensor(
         if not station_data:
             return {"station_id": self._station_id}
 
+        normalized = station_data.get("normalized", {})
         return {
             "station_id": station_data.get("stationId"),
             "name": station_data.get("name"),
             "brand": station_data.get("brand"),
-            "address": format_address(station_data.get("address", {})),
+            "address": normalized.get("address"),
             "location": station_data.get("location"),
             "status": station_data.get("status"),
             "status_translation": station_data.get("statusTranslation"),
-            "e5_price": get_price_from_prices(
-                station_data.get("prices", []), "E5"
-            ),
-            "e5_price_eur": f"{get_price_from_prices(station_data.get('prices', []), 'E5'):.3f} €" if get_price_from_prices(station_data.get("prices", []), "E5") is not None else "-",
-            "e10_price": get_price_from_prices(
-                station_data.get("prices", []), "E10"
-            ),
-            "e10_price_eur": f"{get_price_from_prices(station_data.get('prices', []), 'E10'):.3f} €" if get_price_from_prices(station_data.get("prices", []), "E10") is not None else "-",
-            "diesel_price": get_price_from_prices(
-                station_data.get("prices", []), "DIESEL"
-            ),
-            "diesel_price_eur": f"{get_price_from_prices(station_data.get('prices', []), 'DIESEL'):.3f} €" if get_price_from_prices(station_data.get("prices", []), "DIESEL") is not None else "-",
+            **normalized.get("price_attributes", {}),
             "all_day_opened": station_data.get("openingHours", {}).get("allDayOpened"),
             "opening_hours": station_data.get("openingHours", {}).get("openingHours"),
         }
@@ -0,0 +1,104 @@
+"""Objects shared by the config entries of one backend."""
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_SHARED_REGISTRY
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class _SharedItem:
+    """An object with the config entries using it."""
+
+    value: Any
+    entry_ids: set[str] = field(default_factory=set)
+    # Called once the last config entry released the object
+    on_release: list[CALLBACK_TYPE] = field(default_factory=list)
+
+
+class SharedRegistry:
+    """Reference counted objects shared by config entries.
+
+    Entries asking for the same key get the same object. It is released
+    once every entry that acquired it has been unloaded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._items: dict[Hashable, _SharedItem] = {}
+
+    def acquire(
+        self, key: Hashable, entry_id: str, factory: Callable[[], _T]
+    ) -> tuple[_T, bool]:
+        """Return the object of a key, creating it if needed.
+
+        Args:
+            key: Identifies the object, e.g. the backend and query parameters
+            entry_id: The ID of the config entry using the object
+            factory: Creates the object if no entry uses it yet
+
+        Returns:
+            Tuple of (object, whether it was created)
+
+        """
+        created = key not in self._items
+        if created:
+            self._items[key] = _SharedItem(factory())
+        item = self._items[key]
+        item.entry_ids.add(entry_id)
+        return item.value, created
+
+    @callback
+    def async_on_release(self, key: Hashable, func: CALLBACK_TYPE) -> None:
+        """Call a function once the object of a key is released.
+
+        Args:
+            key: The key of an acquired object
+            func: The function to call
+
+        """
+        self._items[key].on_release.append(func)
+
+    @callback
+    def async_release(self, entry_id: str) -> list[Any]:
+        """Release every object a config entry acquired.
+
+        Args:
+            entry_id: The ID of the config entry
+
+        Returns:
+            The objects no entry uses anymore
+
+        """
+        released = []
+        for key, item in list(self._items.items()):
+            item.entry_ids.discard(entry_id)
+            if item.entry_ids:
+                continue
+            del self._items[key]
+            for func in item.on_release:
+                func()
+            released.append(item.value)
+        return released
+
+
+@callback
+def async_get_shared_registry(hass: HomeAssistant) -> SharedRegistry:
+    """Return the shared registry, creating it if needed.
+
+    Args:
+        hass: The Home Assistant instance
+
+    Returns:
+        The shared registry
+
+    """
+    if (registry := hass.data.get(DATA_SHARED_REGISTRY)) is None:
+        registry = hass.data[DATA_SHARED_REGISTRY] = SharedRegistry()
+    return registry
@@ -0,0 +1,117 @@
+"""Persistent warm-start cache of coordinator data for isal Easy Homey."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, WARM_START_SAVE_DELAY
+
+if TYPE_CHECKING:
+    from .coordinator import IsalEasyHomeyDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+class CoordinatorDataStore:
+    """Last successful data of every coordinator of a config entry.
+
+    The data is written with a delay, so frequently polling coordinators
+    only cause one write per save delay. All coordinators of an entry share
+    one storage file.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store.
+
+        Args:
+            hass: The Home Assistant instance
+            entry_id: The ID of the config entry
+
+        """
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.coordinator_data"
+        )
+        # Coordinator key -> {"saved_at": timestamp, "data": data}
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the stored data."""
+        try:
+            stored = await self._store.async_load()
+        except Exception:  # pylint: disable=broad-except
+            # A broken cache must never block the setup
+            _LOGGER.warning("Could not load cached coordinator data", exc_info=True)
+            stored = None
+        self._entries = stored or {}
+
+    def restore(self, key: str, max_age: float) -> Any | None:
+        """Return the stored data of a coordinator if it is recent enough.
+
+        Args:
+            key: The coordinator key
+            max_age: Maximum age of the data in seconds
+
+        Returns:
+            The stored data or None if missing or older than max_age
+
+        """
+        if (entry := self._entries.get(key)) is None:
+            return None
+        age = time.time() - entry["saved_at"]
+        if age > max_age:
+            _LOGGER.debug("Cached %s data is too old (%.0fs)", key, age)
+            return None
+        _LOGGER.debug("Restoring %s data cached %.0fs ago", key, age)
+        return entry["data"]
+
+    @callback
+    def async_track(
+        self, key: str, coordinator: IsalEasyHomeyDataUpdateCoordinator
+    ) -> CALLBACK_TYPE:
+        """Save the data of a coordinator after every successful refresh.
+
+        Refreshes returning unchanged data are recorded as well, so stable
+        data does not age out of the cache while it is revalidated.
+
+        Args:
+            key: The coordinator key
+            coordinator: The coordinator to track
+
+        Returns:
+            Callback to stop tracking
+
+        """
+
+        @callback
+        def _async_refreshed() -> None:
+            if coordinator.data is None:
+                return
+            self._entries[key] = {"saved_at": time.time(), "data": coordinator.data}
+            self._async_schedule_save()
+
+        return coordinator.async_add_refresh_listener(_async_refreshed)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a write unless one is already pending."""
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, WARM_START_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the data to write."""
+        self._save_pending = False
+        return self._entries
+
+    async def async_remove(self) -> None:
+        """Remove the storage file."""
+        await self._store.async_remove()
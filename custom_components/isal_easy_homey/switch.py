@@ -54,7 +54,9 @@ class IsalEasyHomeyShutoffValveSwitch(
         entry: ConfigEntry,
     ) -> None:
         """Initialize the switch entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, frozenset({"shutoffValveStatus", "shutoffValveIcon"})
+        )
         self._attr_unique_id = f"{entry.entry_id}_water_control_shutoff_valve"
         self._attr_device_info = get_device_info(entry.entry_id, COORDINATOR_WATER_CONTROL)
 
@@ -81,8 +83,7 @@ class IsalEasyHomeyShutoffValveSwitch(
             return
 
         # Optimistic update
-        self.coordinator.data["shutoffValveStatus"] = "CLOSED"
-        self.async_write_ha_state()
+        self.coordinator.async_set_section("shutoffValveStatus", "CLOSED")
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -94,7 +95,6 @@ class IsalEasyHomeyShutoffValveSwitch(
             return
 
         # Optimistic update
-        self.coordinator.data["shutoffValveStatus"] = "OPEN"
-        self.async_write_ha_state()
+        self.coordinator.async_set_section("shutoffValveStatus", "OPEN")
         await self.coordinator.async_request_refresh()
 
@@ -0,0 +1 @@
+"""Tests for the isal Easy Homey integration."""
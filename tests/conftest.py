@@ -0,0 +1,44 @@
+"""Fixtures for isal Easy Homey tests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
+
+from aiohttp import ClientSession
+import pytest
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.isal_easy_homey.api import IsalEasyHomeyApiClient
+
+BASE_URL = "http://easy-homey.local/v1"
+
+ApiClientFactory = Callable[..., IsalEasyHomeyApiClient]
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable loading the integration from custom_components."""
+
+
+@pytest.fixture
+async def api_client_factory(
+    aioclient_mock: AiohttpClientMocker,
+) -> AsyncGenerator[ApiClientFactory]:
+    """Return a function creating API clients for the mocked backend.
+
+    Requests of the clients are answered by aioclient_mock below BASE_URL.
+    """
+    sessions: list[ClientSession] = []
+
+    def _create(**kwargs: Any) -> IsalEasyHomeyApiClient:
+        session = aioclient_mock.create_session(asyncio.get_running_loop())
+        sessions.append(session)
+        return IsalEasyHomeyApiClient(BASE_URL, session, **kwargs)
+
+    yield _create
+
+    for session in sessions:
+        await session.close()
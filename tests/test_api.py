@@ -0,0 +1,468 @@
+"""Tests for the isal Easy Homey API client."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+from yarl import URL
+
+from custom_components.isal_easy_homey.api import (
+    CircuitBreaker,
+    IsalEasyHomeyApiCircuitOpenError,
+    IsalEasyHomeyApiResponseError,
+    IsalEasyHomeyApiStatistics,
+    ResponseCache,
+    TokenBucket,
+)
+from custom_components.isal_easy_homey.const import CIRCUIT_BREAKER_FAILURE_THRESHOLD
+
+from .conftest import BASE_URL, ApiClientFactory
+
+
+def _cache(max_entries: int = 8, max_bytes: int = 1024) -> ResponseCache:
+    """Return a cache keeping /info for 10 s and /water/control for 2 s."""
+    return ResponseCache(
+        {"/info": 10, "/water/control": 2},
+        max_entries,
+        max_bytes,
+        IsalEasyHomeyApiStatistics(),
+    )
+
+
+def test_response_cache_ttl() -> None:
+    """Test cached responses expire after the lifetime of their endpoint."""
+    cache = _cache()
+    key = ("/water/control", ())
+    with patch("custom_components.isal_easy_homey.api.time.monotonic") as now:
+        now.return_value = 100.0
+        cache.set(key, {"valve": "OPEN"}, 10, cache.generation)
+        now.return_value = 101.9
+        assert cache.get(key) == {"valve": "OPEN"}
+        now.return_value = 102.0
+        assert cache.get(key) is None
+
+
+def test_response_cache_ttl_limit() -> None:
+    """Test limits lower the lifetime of every endpoint below their prefix."""
+    cache = _cache()
+    cache.limit_ttl("/water", 1)
+    cache.limit_ttl("/water", 5)
+    assert cache.ttl_for("/water/control") == 1
+    assert cache.ttl_for("/info") == 10
+    cache.limit_ttl("/info", 60)
+    assert cache.ttl_for("/info") == 10
+
+
+def test_response_cache_skips_endpoints_without_policy() -> None:
+    """Test endpoints without a lifetime are not cached."""
+    cache = _cache()
+    cache.set(("/weather/warnings", ()), {}, 10, cache.generation)
+    assert cache.get(("/weather/warnings", ())) is None
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    """Test the cache stays within its entry and byte limits."""
+    cache = _cache(max_entries=2, max_bytes=25)
+    first, second, third = (("/info", (("page", page),)) for page in range(3))
+    cache.set(first, 1, 10, cache.generation)
+    cache.set(second, 2, 10, cache.generation)
+    assert cache.get(first) == 1
+    cache.set(third, 3, 10, cache.generation)
+    assert cache.get(second) is None
+    assert cache.get(first) == 1
+    cache.set(second, 2, 10, cache.generation)
+    assert cache.get(third) is None
+
+
+def test_response_cache_invalidate() -> None:
+    """Test invalidating a prefix drops its entries and stale responses."""
+    cache = _cache()
+    generation = cache.generation
+    cache.set(("/water/control", ()), 1, 10, generation)
+    cache.set(("/info", ()), 2, 10, generation)
+    cache.invalidate("/water")
+    assert cache.get(("/water/control", ())) is None
+    assert cache.get(("/info", ())) == 2
+    # A response requested before the invalidation is not stored
+    cache.set(("/water/control", ()), 1, 10, generation)
+    assert cache.get(("/water/control", ())) is None
+
+
+async def test_write_detaches_in_flight_get(
+    api_client_factory: ApiClientFactory, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a GET after a write does not join a GET sent before the write."""
+    valve = "OPEN"
+    get_started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def water_control(
+        method: str, url: URL, data: Any
+    ) -> AiohttpClientMockResponse:
+        status = valve
+        get_started.set()
+        await release.wait()
+        return AiohttpClientMockResponse(
+            method, url, json={"shutoffValveStatus": status}
+        )
+
+    async def shutoff_valve(
+        method: str, url: URL, data: Any
+    ) -> AiohttpClientMockResponse:
+        nonlocal valve
+        valve = data["newStatus"]
+        return AiohttpClientMockResponse(
+            method, url, json={"shutoffValveStatus": valve}
+        )
+
+    aioclient_mock.get(f"{BASE_URL}/water/control", side_effect=water_control)
+    aioclient_mock.post(
+        f"{BASE_URL}/water/control/shutoff-valve", side_effect=shutoff_valve
+    )
+    client = api_client_factory()
+
+    before_write = asyncio.create_task(client.get_water_control_data())
+    await get_started.wait()
+    await client.control_shutoff_valve("CLOSED")
+    after_write = asyncio.create_task(client.get_water_control_data())
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await before_write)["shutoffValveStatus"] == "OPEN"
+    assert (await after_write)["shutoffValveStatus"] == "CLOSED"
+    assert client.statistics.requests_coalesced == 0
+    # The response of the GET sent before the write is not cached
+    assert (await client.get_water_control_data())["shutoffValveStatus"] == "CLOSED"
+
+
+async def test_identical_gets_are_coalesced(
+    api_client_factory: ApiClientFactory, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test identical GET requests in flight share one backend request."""
+
+    async def info(method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        await asyncio.sleep(0.01)
+        return AiohttpClientMockResponse(method, url, json={"serviceVersion": "1"})
+
+    aioclient_mock.get(f"{BASE_URL}/info", side_effect=info)
+    client = api_client_factory()
+
+    results = await asyncio.gather(*(client.get_service_info() for _ in range(3)))
+
+    assert results == [{"serviceVersion": "1"}] * 3
+    assert aioclient_mock.call_count == 1
+    assert client.statistics.requests_coalesced == 2
+
+
+async def test_not_modified_returns_stored_response(
+    api_client_factory: ApiClientFactory, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a 304 answer returns the response its validator belongs to."""
+    responses = iter(
+        [
+            {"json": {"serviceVersion": "1"}, "headers": {"ETag": '"v1"'}},
+            {"status": 304},
+        ]
+    )
+
+    async def info(method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        return AiohttpClientMockResponse(method, url, **next(responses))
+
+    aioclient_mock.get(f"{BASE_URL}/info", side_effect=info)
+    client = api_client_factory(cache_max_entries=0)
+
+    first = await client.get_service_info()
+    second = await client.get_service_info()
+
+    assert second is first
+    assert aioclient_mock.mock_calls[1][3] == {"If-None-Match": '"v1"'}
+    assert client.statistics.not_modified == 1
+
+
+async def test_not_modified_without_stored_response(
+    api_client_factory: ApiClientFactory, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a 304 without a stored response requests the full response."""
+    responses = iter([{"status": 304}, {"json": {"serviceVersion": "1"}}])
+
+    async def info(method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        return AiohttpClientMockResponse(method, url, **next(responses))
+
+    aioclient_mock.get(f"{BASE_URL}/info", side_effect=info)
+    client = api_client_factory(cache_max_entries=0)
+
+    assert await client.get_service_info() == {"serviceVersion": "1"}
+    assert aioclient_mock.call_count == 2
+    assert client.statistics.not_modified == 0
+
+
+def test_circuit_breaker_transitions() -> None:
+    """Test the breaker opens, lets one trial through and closes again."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    with patch("custom_components.isal_easy_homey.api.time.monotonic") as now:
+        now.return_value = 0.0
+        breaker.record_failure(Exception("timeout"))
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+        breaker.record_failure(Exception("timeout"))
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.trips == 1
+
+        now.return_value = 29.0
+        assert not breaker.allow_request()
+        now.return_value = 30.0
+        assert breaker.allow_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        # Only a single trial request while half open
+        assert not breaker.allow_request()
+
+        breaker.record_failure(Exception("timeout"))
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.trips == 2
+
+        now.return_value = 60.0
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.failures == 0
+        assert breaker.allow_request()
+        assert breaker.allow_request()
+
+
+def test_circuit_breaker_release_ends_trial() -> None:
+    """Test a cancelled trial request lets the next trial through."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure(Exception("timeout"))
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.release()
+    assert breaker.allow_request()
+
+
+async def test_circuit_breaker_rejects_without_request(
+    api_client_factory: ApiClientFactory, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test an open breaker fails requests without sending them."""
+    aioclient_mock.get(f"{BASE_URL}/info", status=503)
+    client = api_client_factory(retries=0, cache_max_entries=0)
+
+    for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+        with pytest.raises(IsalEasyHomeyApiResponseError):
+            await client.get_service_info()
+    with pytest.raises(IsalEasyHomeyApiCircuitOpenError):
+        await client.get_service_info()
+
+    assert aioclient_mock.call_count == CIRCUIT_BREAKER_FAILURE_THRESHOLD
+    assert client.statistics.circuit_rejections == 1
+    assert client.circuit_breaker_states()["/info"]["state"] == CircuitBreaker.OPEN
+
+
+async def test_transient_failures_are_retried(
+    api_client_factory: ApiClientFactory,
+    aioclient_mock: AiohttpClientMocker,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a GET failing transiently is sent again."""
+    responses = iter([{"status": 503}, {"json": {"serviceVersion": "1"}}])
+
+    async def info(method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        return AiohttpClientMockResponse(method, url, **next(responses))
+
+    aioclient_mock.get(f"{BASE_URL}/info", side_effect=info)
+    client = api_client_factory(retries=1)
+
+    with patch("custom_components.isal_easy_homey.api.RETRY_BACKOFF_BASE", 0):
+        assert await client.get_service_info() == {"serviceVersion": "1"}
+    assert client.statistics.retries == 1
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+
+
+async def test_only_last_attempt_is_logged_as_error(
+    api_client_factory: ApiClientFactory,
+    aioclient_mock: AiohttpClientMocker,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a request failing on every attempt logs one error."""
+    aioclient_mock.get(f"{BASE_URL}/info", status=503)
+    client = api_client_factory(retries=1)
+
+    with (
+        patch("custom_components.isal_easy_homey.api.RETRY_BACKOFF_BASE", 0),
+        pytest.raises(IsalEasyHomeyApiResponseError),
+    ):
+        await client.get_service_info()
+
+    assert aioclient_mock.call_count == 2
+    errors = [record for record in caplog.records if record.levelno >= logging.ERROR]
+    assert len(errors) == 1
+    assert "/info" in errors[0].getMessage()
+
+
+def _station(index: int, latitude: float, longitude: float) -> dict[str, Any]:
+    """Return a station payload at some coordinates."""
+    return {
+        "stationId": f"station-{index}",
+        "location": {"latitude": latitude, "longitude": longitude},
+    }
+
+
+async def test_nearby_searches_share_one_search(
+    api_client_factory: ApiClientFactory, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test concurrent searches nearby wait for the search covering them."""
+
+    async def search(method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        await asyncio.sleep(0.01)
+        return AiohttpClientMockResponse(
+            method,
+            url,
+            json=[
+                _station(index, 48.125 + index * 0.002, 11.571) for index in range(10)
+            ],
+        )
+
+    aioclient_mock.get(f"{BASE_URL}/patrol-stations", side_effect=search)
+    client = api_client_factory()
+    # Four grid cells, all within the widened search of the first location
+    locations = [
+        (48.131, 11.571),
+        (48.1395, 11.571),
+        (48.141, 11.571),
+        (48.131, 11.5805),
+    ]
+
+    results = await asyncio.gather(
+        *(
+            client.search_petrol_stations(latitude, longitude, 1.0)
+            for latitude, longitude in locations
+        )
+    )
+
+    assert aioclient_mock.call_count == 1
+    assert client.statistics.geo_cache_hits == 3
+    for result in results:
+        assert result
+        assert all(station["location"]["distance"] <= 1.0 for station in result)
+
+    # The search is still cached for the next refresh
+    await client.search_petrol_stations(48.132, 11.572, 1.0)
+    assert aioclient_mock.call_count == 1
+    assert client.statistics.geo_cache_hits == 4
+
+
+def _register_stations(
+    aioclient_mock: AiohttpClientMocker, station_ids: list[str]
+) -> None:
+    """Answer the per-ID lookup of every station."""
+    for station_id in station_ids:
+        aioclient_mock.get(
+            f"{BASE_URL}/patrol-stations/{station_id}", json={"stationId": station_id}
+        )
+
+
+@pytest.mark.parametrize("status", [400, 404, 422, 501])
+async def test_unsupported_bulk_lookup_falls_back(
+    api_client_factory: ApiClientFactory,
+    aioclient_mock: AiohttpClientMocker,
+    status: int,
+) -> None:
+    """Test a backend rejecting the bulk lookup is asked per ID from then on."""
+    station_ids = [f"station-{index}" for index in range(5)]
+    aioclient_mock.get(f"{BASE_URL}/patrol-stations/by-ids", status=status)
+    _register_stations(aioclient_mock, station_ids)
+    client = api_client_factory(retries=0)
+
+    stations, errors = await client.get_petrol_stations(station_ids, batch_size=2)
+
+    assert not errors
+    assert list(stations) == station_ids
+    # Only the probe was sent to the bulk endpoint
+    assert aioclient_mock.call_count == 1 + len(station_ids)
+
+    client.invalidate_cache("/patrol-stations")
+    await client.get_petrol_stations(["station-0"], batch_size=2)
+    assert aioclient_mock.call_count == 2 + len(station_ids)
+    assert aioclient_mock.mock_calls[-1][1].path.endswith("/station-0")
+
+
+async def test_failed_bulk_lookup_falls_back(
+    api_client_factory: ApiClientFactory, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a bulk lookup failing transiently is retried on the next refresh."""
+    station_ids = [f"station-{index}" for index in range(5)]
+    aioclient_mock.get(f"{BASE_URL}/patrol-stations/by-ids", status=503)
+    _register_stations(aioclient_mock, station_ids)
+    client = api_client_factory(retries=0)
+
+    stations, errors = await client.get_petrol_stations(station_ids, batch_size=2)
+
+    assert not errors
+    assert list(stations) == station_ids
+    assert aioclient_mock.call_count == 1 + len(station_ids)
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(
+        f"{BASE_URL}/patrol-stations/by-ids",
+        json=[{"stationId": station_id} for station_id in station_ids],
+    )
+    stations, errors = await client.get_petrol_stations(station_ids, batch_size=5)
+
+    assert not errors
+    assert list(stations) == station_ids
+    assert aioclient_mock.call_count == 1
+
+
+async def test_token_bucket_serves_waiters_by_priority() -> None:
+    """Test queued requests get tokens by priority, then in arrival order."""
+    # Slow enough that no token refills before every request is queued
+    bucket = TokenBucket(rate=10.0, burst=1)
+    assert await bucket.acquire(2) == 0.0
+    served: list[str] = []
+
+    async def request(name: str, priority: int) -> None:
+        await bucket.acquire(priority)
+        served.append(name)
+
+    await asyncio.gather(
+        request("poll", 2),
+        request("second write", 0),
+        request("control", 1),
+        request("write", 0),
+    )
+
+    assert served == ["second write", "write", "control", "poll"]
+    assert bucket.waits == 4
+    assert bucket.max_queue_depth == 4
+    assert bucket.queue_depth == 0
+
+
+async def test_token_bucket_skips_cancelled_waiters() -> None:
+    """Test a request cancelled while queued does not take a token."""
+    bucket = TokenBucket(rate=20.0, burst=1)
+    await bucket.acquire(2)
+    cancelled = asyncio.ensure_future(bucket.acquire(0))
+    waiting = asyncio.ensure_future(bucket.acquire(2))
+    await asyncio.sleep(0)
+    assert bucket.queue_depth == 2
+
+    cancelled.cancel()
+    await waiting
+
+    assert cancelled.cancelled()
+    assert bucket.waits == 1
+    assert bucket.queue_depth == 0
+    assert bucket.as_dict()["tokens"] < 1
+
+
+async def test_client_rate_limits(api_client_factory: ApiClientFactory) -> None:
+    """Test a client without a shared rate limiter uses its own limits."""
+    client = api_client_factory(rate_limits={"/patrol-stations": (1.0, 5)})
+    assert list(client.rate_limiter_states()) == ["/patrol-stations"]
+    assert api_client_factory().rate_limiter_states() == {}
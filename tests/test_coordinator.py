@@ -0,0 +1,133 @@
+"""Tests for the isal Easy Homey coordinators."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.isal_easy_homey.api import IsalEasyHomeyApiConnectionError
+from custom_components.isal_easy_homey.coordinator import (
+    PartialDataUpdateCoordinator,
+    PetrolStationCoordinator,
+    PollenFlightCoordinator,
+    SectionedDataUpdateCoordinator,
+)
+
+ALL_POLLEN = {
+    "flights": [
+        {
+            "pollenType": "BIRCH",
+            "today": {"severityLevel": 3},
+            "tomorrow": {"severityLevel": 2},
+            "dayAfterTomorrow": {"severityLevel": 0},
+        }
+    ]
+}
+HIGHEST = {"highestSeverity": ALL_POLLEN["flights"][0]}
+
+
+def _pollen_coordinator(hass: HomeAssistant, client: Any) -> PollenFlightCoordinator:
+    """Return a pollen coordinator keeping failed sections for 60 minutes."""
+    return PollenFlightCoordinator(
+        hass,
+        client,
+        timedelta(minutes=30),
+        None,
+        max_staleness=timedelta(minutes=60),
+    )
+
+
+def test_partial_coordinator_is_abstract() -> None:
+    """Test coordinators have to declare the requests of their sections."""
+    with pytest.raises(TypeError):
+        PartialDataUpdateCoordinator(MagicMock(), MagicMock(), name="test")
+
+
+async def test_failed_section_keeps_restored_data(hass: HomeAssistant) -> None:
+    """Test a section failing after a warm start keeps its restored value."""
+    client = MagicMock()
+    client.get_pollen_flight = AsyncMock(
+        side_effect=IsalEasyHomeyApiConnectionError("down")
+    )
+    client.get_highest_pollen_flight = AsyncMock(return_value=HIGHEST)
+    coordinator = _pollen_coordinator(hass, client)
+    # Restored from the warm-start cache
+    coordinator.data = {"all_pollen": ALL_POLLEN, "highest": HIGHEST}
+
+    with patch(
+        "custom_components.isal_easy_homey.coordinator.time.monotonic"
+    ) as now:
+        now.return_value = 0.0
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert coordinator.data["all_pollen"] == ALL_POLLEN
+        assert coordinator.data["max_severity_levels"]["today"] == 3
+        assert coordinator.section_states["all_pollen"].last_error == "down"
+
+        # Dropped once older than the maximum staleness
+        now.return_value = 3601.0
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert "all_pollen" not in coordinator.data
+        assert coordinator.data["highest"] == HIGHEST
+
+    await coordinator.async_shutdown()
+
+
+async def test_failed_section_without_data_is_dropped(hass: HomeAssistant) -> None:
+    """Test a section that never had data is missing from the payload."""
+    client = MagicMock()
+    client.get_pollen_flight = AsyncMock(
+        side_effect=IsalEasyHomeyApiConnectionError("down")
+    )
+    client.get_highest_pollen_flight = AsyncMock(return_value=HIGHEST)
+    coordinator = _pollen_coordinator(hass, client)
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data == {"highest": HIGHEST}
+    await coordinator.async_shutdown()
+
+
+def test_sectioned_coordinator_is_abstract() -> None:
+    """Test coordinators have to implement fetching their payload."""
+    with pytest.raises(TypeError):
+        SectionedDataUpdateCoordinator(MagicMock(), MagicMock(), name="test")
+
+
+async def test_unmoved_location_is_searched_once(hass: HomeAssistant) -> None:
+    """Test refreshes of a location that did not move confirm its station."""
+    station = {
+        "stationId": "near",
+        "location": {"latitude": 48.147, "longitude": 11.575},
+    }
+    hass.states.async_set(
+        "device_tracker.car", "home", {"latitude": 48.137, "longitude": 11.575}
+    )
+    client = MagicMock()
+    client.search_petrol_stations = AsyncMock(return_value=[station])
+    client.get_petrol_stations = AsyncMock(return_value=({"near": station}, {}))
+    coordinator = PetrolStationCoordinator(
+        hass,
+        client,
+        None,
+        "device_tracker.car",
+        None,
+        None,
+        5.0,
+        timedelta(minutes=5),
+        None,
+    )
+
+    with patch("custom_components.isal_easy_homey.geo.time.monotonic") as now:
+        for now.return_value in (0.0, 300.0, 600.0, 900.0):
+            await coordinator.async_refresh()
+            assert coordinator.data["nearest_station"]["stationId"] == "near"
+
+    assert client.search_petrol_stations.call_count == 1
+    assert client.get_petrol_stations.call_count == 3
+    await coordinator.async_shutdown()
@@ -0,0 +1,156 @@
+"""Tests for the isal Easy Homey geographic helpers."""
+from __future__ import annotations
+
+import random
+from typing import Any
+from unittest.mock import patch
+
+from custom_components.isal_easy_homey.geo import StationIndex, distance_km
+
+MUNICH = (48.137, 11.575)
+
+
+def _station(station_id: str, latitude: float, longitude: float) -> dict[str, Any]:
+    """Return a station payload at some coordinates."""
+    return {
+        "stationId": station_id,
+        "location": {"latitude": latitude, "longitude": longitude},
+    }
+
+
+def test_nearest_matches_brute_force() -> None:
+    """Test the ring scan finds the same stations as comparing all of them."""
+    rng = random.Random(0)
+    stations = [
+        _station(
+            f"station-{index}",
+            MUNICH[0] + rng.uniform(-0.3, 0.3),
+            MUNICH[1] + rng.uniform(-0.3, 0.3),
+        )
+        for index in range(300)
+    ]
+    index = StationIndex(0.05, 1000, 8)
+    for station in stations:
+        index.add(station)
+
+    for _ in range(20):
+        origin = (
+            MUNICH[0] + rng.uniform(-0.3, 0.3),
+            MUNICH[1] + rng.uniform(-0.3, 0.3),
+        )
+        expected = sorted(
+            stations,
+            key=lambda station: distance_km(
+                origin,
+                (station["location"]["latitude"], station["location"]["longitude"]),
+            ),
+        )[:5]
+        nearest = index.nearest(origin, count=5)
+        assert [station["stationId"] for station in nearest] == [
+            station["stationId"] for station in expected
+        ]
+        distances = [station["location"]["distance"] for station in nearest]
+        assert distances == sorted(distances)
+
+
+def test_nearest_limits_distance() -> None:
+    """Test stations beyond the maximum distance are not returned."""
+    index = StationIndex(0.05, 100, 8)
+    index.add(_station("near", MUNICH[0] + 0.01, MUNICH[1]))
+    index.add(_station("far", MUNICH[0] + 0.5, MUNICH[1]))
+
+    nearest = index.nearest(MUNICH, count=2, max_distance=5)
+
+    assert [station["stationId"] for station in nearest] == ["near"]
+    assert nearest[0]["location"]["distance"] == 1.11
+    assert index.nearest(MUNICH, count=0) == []
+    assert StationIndex(0.05, 100, 8).nearest(MUNICH) == []
+
+
+def test_add_replaces_and_evicts() -> None:
+    """Test a station is replaced by a newer version and the oldest evicted."""
+    index = StationIndex(0.05, 2, 8)
+    index.add(_station("first", MUNICH[0], MUNICH[1]))
+    index.add(_station("second", MUNICH[0] + 0.01, MUNICH[1]))
+    # Moves the first station away, it is now the most recently seen
+    index.add(_station("first", MUNICH[0] + 1, MUNICH[1]))
+    index.add(_station("third", MUNICH[0] + 0.02, MUNICH[1]))
+
+    assert len(index) == 2
+    nearest = index.nearest(MUNICH, count=3)
+    assert [station["stationId"] for station in nearest] == ["third", "first"]
+
+
+def test_covers_searched_areas() -> None:
+    """Test a circle is covered only if it lies within a searched area."""
+    index = StationIndex(0.05, 100, 8)
+    index.add_search(MUNICH, 10, [_station("near", MUNICH[0] + 0.01, MUNICH[1])])
+
+    assert index.covers(MUNICH, 10)
+    assert index.covers((MUNICH[0] + 0.04, MUNICH[1]), 5)
+    assert not index.covers((MUNICH[0] + 0.04, MUNICH[1]), 6)
+    assert not index.covers(MUNICH, 11)
+
+
+def test_stations_and_areas_expire() -> None:
+    """Test stations and areas not seen within the maximum age are dropped."""
+    index = StationIndex(0.05, 100, 8, max_age=300)
+    with patch("custom_components.isal_easy_homey.geo.time.monotonic") as now:
+        now.return_value = 0.0
+        index.add_search(
+            MUNICH,
+            10,
+            [
+                _station("listed", MUNICH[0] + 0.01, MUNICH[1]),
+                _station("delisted", MUNICH[0] + 0.005, MUNICH[1]),
+            ],
+        )
+        now.return_value = 200.0
+        index.add_search(MUNICH, 10, [_station("listed", MUNICH[0] + 0.01, MUNICH[1])])
+
+        now.return_value = 400.0
+        assert [station["stationId"] for station in index.nearest(MUNICH, 2)] == [
+            "listed"
+        ]
+        assert index.covers(MUNICH, 10)
+
+        now.return_value = 501.0
+        assert index.nearest(MUNICH) == []
+        assert not index.covers(MUNICH, 1)
+        assert len(index) == 0
+
+
+def test_confirmed_areas_stay_covered() -> None:
+    """Test an area stays covered while its stations are confirmed."""
+    index = StationIndex(0.05, 100, 8, max_age=3600, coverage_max_age=330)
+    with patch("custom_components.isal_easy_homey.geo.time.monotonic") as now:
+        now.return_value = 0.0
+        index.add_search(MUNICH, 10, [_station("near", MUNICH[0] + 0.01, MUNICH[1])])
+        index.add_search(
+            (MUNICH[0] + 1, MUNICH[1]),
+            10,
+            [_station("far", MUNICH[0] + 1.01, MUNICH[1])],
+        )
+
+        for now.return_value in (300.0, 600.0, 900.0):
+            index.confirm(MUNICH, 1.11)
+            index.add(_station("near", MUNICH[0] + 0.01, MUNICH[1]))
+        assert index.covers(MUNICH, 10)
+        assert not index.covers((MUNICH[0] + 1, MUNICH[1]), 1)
+
+        # Searched too long ago, even though it was confirmed
+        now.return_value = 3601.0
+        index.confirm(MUNICH, 1.11)
+        assert not index.covers(MUNICH, 1)
+
+
+def test_remove_station() -> None:
+    """Test a removed station is no longer the nearest one."""
+    index = StationIndex(0.05, 100, 8)
+    index.add(_station("near", MUNICH[0] + 0.01, MUNICH[1]))
+    index.add(_station("next", MUNICH[0] + 0.02, MUNICH[1]))
+    index.remove("near")
+    index.remove("unknown")
+
+    assert [station["stationId"] for station in index.nearest(MUNICH)] == ["next"]
+    assert len(index) == 1
@@ -0,0 +1,149 @@
+"""Tests for the isal Easy Homey setup."""
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+from yarl import URL
+
+from custom_components.isal_easy_homey.const import (
+    CONF_API_BASE_URL,
+    CONF_PETROL_RATE_LIMIT,
+    COORDINATOR_WASTE,
+    COORDINATOR_WATER_SOFTENER,
+    DATA_REFRESH_SCHEDULERS,
+    DOMAIN,
+    SERVICE_REFRESH_WASTE_SCHEDULE,
+)
+
+from .conftest import BASE_URL
+
+
+async def test_shared_coordinator_refreshed_once(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test an entry set up during the first refresh of a shared coordinator.
+
+    The entry neither restores its own cached data into the coordinator nor
+    refreshes it a second time.
+    """
+    release = asyncio.Event()
+
+    async def backend(method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        if url.path.endswith("/water/softener"):
+            await release.wait()
+            return AiohttpClientMockResponse(method, url, json={"fresh": True})
+        return AiohttpClientMockResponse(method, url, json={})
+
+    aioclient_mock.get(re.compile(re.escape(BASE_URL)), side_effect=backend)
+    entries = [
+        MockConfigEntry(domain=DOMAIN, data={CONF_API_BASE_URL: BASE_URL})
+        for _ in range(2)
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+    # Only the second entry has data of the last run
+    storage_key = f"{DOMAIN}.{entries[1].entry_id}.coordinator_data"
+    hass_storage[storage_key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": storage_key,
+        "data": {
+            COORDINATOR_WATER_SOFTENER: {
+                "saved_at": time.time(),
+                "data": {"fresh": False},
+            }
+        },
+    }
+
+    setup = hass.async_create_task(
+        hass.config_entries.async_setup(entries[0].entry_id)
+    )
+    for _ in range(100):
+        if ConfigEntryState.LOADED in {entry.state for entry in entries}:
+            break
+        await asyncio.sleep(0.01)
+    assert entries[1].state is ConfigEntryState.LOADED
+    coordinator = hass.data[DOMAIN][entries[1].entry_id]["coordinators"][
+        COORDINATOR_WATER_SOFTENER
+    ]
+    # Not restored from the cache of the second entry
+    assert coordinator.data == {}
+    assert not coordinator.last_update_success
+
+    release.set()
+    assert await setup
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert all(entry.state is ConfigEntryState.LOADED for entry in entries)
+    softener_requests = [
+        call for call in aioclient_mock.mock_calls if call[1].path.endswith("/softener")
+    ]
+    assert len(softener_requests) == 1
+    assert (
+        hass.data[DOMAIN][entries[0].entry_id]["coordinators"][
+            COORDINATOR_WATER_SOFTENER
+        ]
+        is coordinator
+    )
+    assert coordinator.data == {"fresh": True}
+    assert coordinator.last_update_success
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_refresh_waste_schedule_service(hass: HomeAssistant) -> None:
+    """Test the service is registered once and refreshes every loaded entry."""
+    refreshed: list[str] = []
+
+    class WasteCoordinator:
+        async def async_refresh_schedule(self) -> None:
+            refreshed.append("schedule")
+
+    waste = WasteCoordinator()
+    assert await async_setup_component(hass, DOMAIN, {})
+    hass.data[DOMAIN] = {
+        entry_id: {"coordinators": {COORDINATOR_WASTE: waste}}
+        for entry_id in ("first", "second")
+    }
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_REFRESH_WASTE_SCHEDULE, blocking=True
+    )
+
+    assert refreshed == ["schedule"]
+
+
+async def test_petrol_rate_limit_option(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test the backend is rate limited as configured by its first entry."""
+    aioclient_mock.get(re.compile(re.escape(BASE_URL)), json={})
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_API_BASE_URL: BASE_URL},
+        options={CONF_PETROL_RATE_LIMIT: 120},
+    )
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    scheduler = hass.data[DATA_REFRESH_SCHEDULERS][BASE_URL]
+    limits = scheduler.rate_limiter.as_dict()
+    assert limits["/patrol-stations"]["rate"] == 2.0
+    assert limits["/water"]["rate"] == 5.0
+    assert await hass.config_entries.async_unload(entry.entry_id)
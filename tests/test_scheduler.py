@@ -0,0 +1,35 @@
+"""Tests for the isal Easy Homey refresh scheduler."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.isal_easy_homey.const import (
+    DEFAULT_UPDATE_INTERVAL_PETROL,
+    RATE_LIMITS,
+)
+from custom_components.isal_easy_homey.scheduler import (
+    RefreshScheduler,
+    async_get_refresh_scheduler,
+)
+
+
+def test_default_petrol_rate_fits_per_station_refresh() -> None:
+    """Test 200 stations looked up one by one fit in the petrol interval."""
+    rate, burst = RATE_LIMITS["/patrol-stations"]
+    assert burst + rate * DEFAULT_UPDATE_INTERVAL_PETROL * 60 >= 200
+
+
+def test_scheduler_rate_limits() -> None:
+    """Test the rate limits of a scheduler can be replaced."""
+    assert set(RefreshScheduler().rate_limiter.as_dict()) == set(RATE_LIMITS)
+    scheduler = RefreshScheduler(rate_limits={"/patrol-stations": (2.0, 40)})
+    assert list(scheduler.rate_limiter.as_dict()) == ["/patrol-stations"]
+
+
+async def test_scheduler_is_shared_per_backend(hass: HomeAssistant) -> None:
+    """Test entries on one backend share a scheduler and its rate limits."""
+    scheduler = async_get_refresh_scheduler(
+        hass, "http://easy-homey.local/v1/", {"/water": (1.0, 1)}
+    )
+    assert async_get_refresh_scheduler(hass, "http://easy-homey.local/v1") is scheduler
+    assert list(scheduler.rate_limiter.as_dict()) == ["/water"]
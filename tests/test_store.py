@@ -0,0 +1,46 @@
+"""Tests for the isal Easy Homey warm-start cache."""
+from __future__ import annotations
+
+import logging
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.isal_easy_homey.coordinator import (
+    IsalEasyHomeyDataUpdateCoordinator,
+)
+from custom_components.isal_easy_homey.store import CoordinatorDataStore
+
+
+async def test_unchanged_refresh_renews_cached_data(hass: HomeAssistant) -> None:
+    """Test a refresh returning unchanged data renews its cache entry."""
+    data = {"collections": ["PAPER"]}
+
+    async def _update() -> dict[str, list[str]]:
+        return data
+
+    coordinator = IsalEasyHomeyDataUpdateCoordinator(
+        hass,
+        logging.getLogger(__name__),
+        name="test",
+        update_method=_update,
+        config_entry=None,
+        always_update=False,
+    )
+    store = CoordinatorDataStore(hass, "entry")
+    unsub = store.async_track("waste_collection", coordinator)
+
+    with patch("custom_components.isal_easy_homey.store.time.time") as now:
+        now.return_value = 1000.0
+        await coordinator.async_refresh()
+        now.return_value = 1500.0
+        # Unchanged data does not notify the entities
+        await coordinator.async_refresh()
+
+        now.return_value = 1800.0
+        assert store.restore("waste_collection", 600) == data
+        now.return_value = 2101.0
+        assert store.restore("waste_collection", 600) is None
+
+    unsub()
+    await coordinator.async_shutdown()